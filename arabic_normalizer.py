@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Arabic Text Normalization
+======================================================
+
+Table-driven normalization of Arabic text for search columns and matching.
+
+Each level is precomputed once as a 65,536-entry NumPy lookup over UTF-16
+code units: a text is encoded, mapped with one take(), stripped of deleted
+units and decoded, so its cost barely depends on how many marks and letter
+variants are folded. (str.translate() creates an int object per non-ASCII
+character and is slower than a handful of str.replace() passes on Arabic.)
+Batches (normalize_many) are joined and mapped in one pass for thousands of
+texts. Texts under NUMPY_MIN_CHARS characters, and every text when NumPy is
+not installed, go through str.translate() with the same mapping.
+
+Steps (combined into levels, or selected individually):
+- harakat:          tanween, short vowels, shadda, sukun, maddah, hamza marks
+                    and the other combining marks U+064B-U+065F (dropped)
+- superscript_alef: dagger alef U+0670 (dropped)
+- quranic_marks:    Quranic annotation signs U+06D6-U+06ED (dropped)
+- tatweel:          kashida U+0640 (dropped)
+- alef:             أ إ آ ٱ → ا
+- hamza:            ؤ → و, ئ → ي
+- ta_marbuta:       ة → ه
+- alef_maqsura:     ى → ي
+
+Levels:
+- diacritics: only drops marks; letters are untouched
+- search:     diacritics + letter folding (the default; used for text_clean)
+
+Usage:
+    from arabic_normalizer import normalize, normalize_many
+    normalize(text)                          # 'search' level
+    normalize(text, 'diacritics')
+    normalize(text, ('tatweel', 'alef'))     # custom step selection
+    normalize_many(texts)                    # list in, list out
+    normalize_many(row_generator)            # generator in, generator out
+"""
+
+import codecs
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy
+    UNITS = numpy.dtype('<u2')
+except ImportError:  # everything falls back to str.translate()
+    numpy = None
+
+# ============================================================================
+# STEPS AND LEVELS
+# ============================================================================
+
+STEPS: Dict[str, Dict[int, Optional[str]]] = {
+    'harakat': {c: None for c in range(0x064B, 0x0660)},
+    'superscript_alef': {0x0670: None},
+    'quranic_marks': {c: None for c in range(0x06D6, 0x06EE)},
+    'tatweel': {0x0640: None},
+    'alef': {ord('أ'): 'ا', ord('إ'): 'ا', ord('آ'): 'ا', ord('ٱ'): 'ا'},
+    'hamza': {ord('ؤ'): 'و', ord('ئ'): 'ي'},
+    'ta_marbuta': {ord('ة'): 'ه'},
+    'alef_maqsura': {ord('ى'): 'ي'},
+}
+
+LEVELS: Dict[str, Sequence[str]] = {
+    'diacritics': ('harakat', 'superscript_alef', 'quranic_marks', 'tatweel'),
+    'search': ('harakat', 'superscript_alef', 'quranic_marks', 'tatweel',
+               'alef', 'hamza', 'ta_marbuta', 'alef_maqsura'),
+}
+
+DEFAULT_LEVEL = 'search'
+
+TABLE_SIZE = 0x0700           # str.translate table: covers the Arabic block; higher code points are left as-is
+BATCH_TEXTS = 256             # texts joined per NumPy pass (bounds buffers while streaming)
+NUMPY_MIN_CHARS = 64          # shorter texts are cheaper with str.translate()
+SEPARATOR = '\x00'
+DELETED = 0xFFFF              # noncharacter marking dropped units (a literal U+FFFF is dropped too)
+CODEC = 'utf-16-le'
+
+Level = Union[str, Sequence[str]]
+
+# ============================================================================
+# TRANSLATION TABLES
+# ============================================================================
+
+@lru_cache(maxsize=None)
+def _tables(steps: Tuple[str, ...]) -> tuple:
+    """(str.translate table, UTF-16 code unit lookup or None) for a tuple of step names."""
+    table: List[Optional[int]] = list(range(TABLE_SIZE))
+    for step in steps:
+        if step not in STEPS:
+            raise ValueError(f"Unknown normalization step {step!r} (choose from {', '.join(STEPS)})")
+        for code, replacement in STEPS[step].items():
+            table[code] = ord(replacement) if replacement else None
+
+    lookup = None
+    if numpy is not None:
+        lookup = numpy.arange(0x10000, dtype=UNITS)
+        for code, replacement in enumerate(table):
+            if replacement != code:
+                lookup[code] = DELETED if replacement is None else replacement
+    return table, lookup
+
+def _resolve(level: Level) -> Tuple[str, ...]:
+    if isinstance(level, str):
+        if level not in LEVELS:
+            raise ValueError(f"Unknown normalization level {level!r} (choose from {', '.join(LEVELS)})")
+        return tuple(LEVELS[level])
+    return tuple(level)
+
+def translation_table(level: Level = DEFAULT_LEVEL) -> List[Optional[int]]:
+    """The str.translate table for a level name or a sequence of step names."""
+    return _tables(_resolve(level))[0]
+
+# Built at import time for the named levels, which normalize() looks up directly
+_LEVEL_TABLES = {level: _tables(_resolve(level)) for level in LEVELS}
+
+# ============================================================================
+# NORMALIZATION
+# ============================================================================
+
+def _map_units(text: str, table, lookup) -> str:
+    """Run a text through a UTF-16 code unit lookup (astral characters pass through as surrogate pairs)."""
+    try:
+        mapped = lookup.take(numpy.frombuffer(text.encode(CODEC), dtype=UNITS))
+    except UnicodeEncodeError:   # lone surrogates
+        return text.translate(table)
+    return codecs.utf_16_le_decode(mapped[mapped != DELETED])[0]
+
+def normalize(text: Optional[str], level: Level = DEFAULT_LEVEL) -> Optional[str]:
+    """Normalize one text; None and '' are returned unchanged."""
+    if not text:
+        return text
+    tables = _LEVEL_TABLES.get(level) if isinstance(level, str) else None
+    table, lookup = tables or _tables(_resolve(level))
+    if lookup is None or len(text) < NUMPY_MIN_CHARS:
+        return text.translate(table)
+    return _map_units(text, table, lookup)
+
+def _normalize_batch(texts: List[Optional[str]], steps: Tuple[str, ...]) -> List[Optional[str]]:
+    table, lookup = _tables(steps)
+    if lookup is None or len(texts) < 2:
+        return [text.translate(table) if text else text for text in texts]
+
+    parts = _map_units(SEPARATOR.join(text or '' for text in texts), table, lookup).split(SEPARATOR)
+    if len(parts) != len(texts):  # a text contained the separator
+        return [text.translate(table) if text else text for text in texts]
+    return [part if text else text for part, text in zip(parts, texts)]
+
+def iter_normalized(texts: Iterable[Optional[str]], level: Level = DEFAULT_LEVEL) -> Iterator[Optional[str]]:
+    """Lazily normalize a stream of texts, BATCH_TEXTS at a time."""
+    steps = _resolve(level)
+    batch: List[Optional[str]] = []
+    for text in texts:
+        batch.append(text)
+        if len(batch) >= BATCH_TEXTS:
+            yield from _normalize_batch(batch, steps)
+            batch = []
+    if batch:
+        yield from _normalize_batch(batch, steps)
+
+def normalize_many(texts: Iterable[Optional[str]],
+                   level: Level = DEFAULT_LEVEL) -> Union[List[Optional[str]], Iterator[Optional[str]]]:
+    """
+    Normalize a batch: a list (or tuple) comes back as a list, any other
+    iterable - e.g. a generator of rows being streamed into the database -
+    comes back as a generator.
+    """
+    if isinstance(texts, (list, tuple)):
+        return list(iter_normalized(texts, level))
+    return iter_normalized(texts, level)
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Arabic Light Stemmer and Root Search
+=================================================================
+
+Reduces Arabic words to (mostly triliteral) roots so a search for رحمة also
+finds الرحمن, يرحم and رحيم, which MySQL FULLTEXT treats as unrelated tokens.
+
+Stemming works on 'search'-normalized words (arabic_normalizer) and is
+table-driven, ISRI-style:
+1. exceptions (الله, ...) are returned as-is
+2. one definite-article / conjunction+article prefix is removed (وال, بال, ال, لل, ...)
+3. pronoun and plural suffixes are removed, longest first (هما, ات, ون, ها, ه, ...)
+4. a conjunction و/ف is removed from words of 5+ letters whose stem is
+   still 4+ letters long (وقالوا -> قال, but وجدوا -> وجد)
+5. the word is matched against morphological patterns of its length written
+   with the root slots ف ع ل (فاعل, مفعول, استفعل, ...); the slot letters are
+   the root. Words no pattern matches keep their stem (quadriliteral roots).
+
+Every distinct word is stemmed once: results are kept in a form -> root
+cache shared by the whole process, so indexing the Quran and all hadith
+collections stems each surface form a single time.
+
+Index time: search_index.py uses the 'arabic_root' analyzer for the
+quran_arabic (ayahs.text_clean) and hadiths_arabic (hadiths.text_clean)
+sources, so their postings are keyed by root. `build` also writes a root ->
+surface forms lexicon, used by the query-time expander.
+
+Usage:
+    python arabic_stemmer.py build                  # root indexes + lexicon
+    python arabic_stemmer.py stem رحمة الرحمن يرحم رحيم
+    python arabic_stemmer.py expand رحمة            # corpus forms sharing the root
+    python arabic_stemmer.py search رحمة -k 5       # Quran and hadiths by root
+
+    from arabic_stemmer import root, root_many
+    root('والرحمن')                  # 'رحم' (input is 'search'-normalized)
+    root_many(['يرحم', 'رحيم'])      # ['رحم', 'رحم']
+
+Requirements:
+    numpy (search indexes); build needs mysql-connector-python
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import arabic_normalizer
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+ROOT_SOURCES = ('quran_arabic', 'hadiths_arabic')
+LEXICON_NAME = 'arabic_roots.tsv'
+MIN_STEM = 3
+CACHE_LIMIT = 1_000_000   # cached forms before the cache is reset
+
+EXCEPTIONS = {'الله': 'الله', 'اللهم': 'الله', 'لله': 'الله', 'بالله': 'الله', 'والله': 'الله'}
+
+PREFIXES = ('وال', 'فال', 'بال', 'كال', 'ولل', 'فلل', 'ال', 'لل')
+SUFFIXES = ('هما', 'كما', 'تما', 'تان', 'تين',
+            'ات', 'ان', 'ون', 'ين', 'ها', 'هم', 'هن', 'كم', 'كن', 'نا', 'تم', 'وا', 'يه',
+            'ه', 'ي', 'ك', 'ت', 'ا')
+CONJUNCTIONS = ('و', 'ف')
+
+SLOTS = 'فعل'
+PATTERNS = (
+    # 4 letters
+    'فاعل', 'فعال', 'فعيل', 'فعول', 'مفعل', 'تفعل', 'يفعل', 'نفعل', 'افعل', 'فعلن',
+    # 5 letters
+    'مفعول', 'مفاعل', 'مفعال', 'مفعيل', 'مفتعل', 'منفعل', 'متفعل', 'فاعول', 'فعايل', 'فعلان',
+    'افعال', 'افتعل', 'انفعل', 'تفاعل', 'تفعيل', 'يفتعل', 'يتفعل', 'سيفعل', 'ستفعل', 'سنفعل',
+    # 6 letters
+    'استفعل', 'مستفعل', 'يستفعل', 'متفاعل', 'افتعال', 'انفعال', 'مفاعيل', 'تفاعيل',
+)
+
+def _compile(pattern: str) -> Tuple[Tuple[Tuple[int, str], ...], Tuple[int, ...]]:
+    """(fixed (position, letter) pairs, root slot positions)."""
+    return (tuple((i, letter) for i, letter in enumerate(pattern) if letter not in SLOTS),
+            tuple(i for i, letter in enumerate(pattern) if letter in SLOTS))
+
+PATTERNS_BY_LENGTH: Dict[int, List[tuple]] = {}
+for _pattern in PATTERNS:
+    PATTERNS_BY_LENGTH.setdefault(len(_pattern), []).append(_compile(_pattern))
+
+# ============================================================================
+# STEMMING
+# ============================================================================
+
+def _match_pattern(word: str) -> Optional[str]:
+    for fixed, slots in PATTERNS_BY_LENGTH.get(len(word), ()):
+        if all(word[i] == letter for i, letter in fixed):
+            return ''.join(word[i] for i in slots)
+    return None
+
+def stem_word(word: str) -> str:
+    """Root of one normalized word (uncached; see root())."""
+    if word in EXCEPTIONS:
+        return EXCEPTIONS[word]
+    if len(word) <= MIN_STEM:
+        return word
+
+    for prefix in PREFIXES:
+        if word.startswith(prefix) and len(word) - len(prefix) >= MIN_STEM:
+            word = word[len(prefix):]
+            break
+
+    long_word = len(word) >= 5
+    for _ in range(2):
+        for suffix in SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+                word = word[:-len(suffix)]
+                break
+        else:
+            break
+
+    if long_word and len(word) >= 4 and word[0] in CONJUNCTIONS:
+        word = word[1:]
+    if len(word) == MIN_STEM:
+        return word
+    return _match_pattern(word) or word
+
+_cache: Dict[str, str] = {}
+
+def root(word: str) -> str:
+    """Cached root of a normalized word."""
+    result = _cache.get(word)
+    if result is None:
+        if len(_cache) >= CACHE_LIMIT:
+            _cache.clear()
+        result = _cache[word] = stem_word(word)
+    return result
+
+def root_many(words: Iterable[str]) -> List[str]:
+    """Roots of a batch of normalized words; each distinct word is stemmed once."""
+    cache = _cache
+    return [cache.get(word) or root(word) for word in words]
+
+def cached_forms() -> Dict[str, List[str]]:
+    """{root: [forms]} for every form stemmed so far in this process."""
+    forms: Dict[str, List[str]] = {}
+    for form, form_root in _cache.items():
+        forms.setdefault(form_root, []).append(form)
+    return forms
+
+# ============================================================================
+# LEXICON AND EXPANSION
+# ============================================================================
+
+def lexicon_path(directory: Optional[Path] = None) -> Path:
+    from search_index import DEFAULT_DIR
+    return (directory or DEFAULT_DIR) / LEXICON_NAME
+
+def save_lexicon(path: Path, forms: Dict[str, List[str]]) -> int:
+    """One 'root<TAB>form form ...' line per root; returns the number of roots."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        for form_root in sorted(forms):
+            f.write(f"{form_root}\t{' '.join(sorted(forms[form_root], key=lambda form: (len(form), form)))}\n")
+    return len(forms)
+
+def load_lexicon(path: Path) -> Dict[str, List[str]]:
+    forms = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            form_root, _, words = line.rstrip('\n').partition('\t')
+            forms[form_root] = words.split()
+    return forms
+
+def expand(word: str, lexicon: Dict[str, List[str]]) -> List[str]:
+    """Every corpus form sharing the root of `word` (the word itself if unseen)."""
+    normalized = arabic_normalizer.normalize(word)
+    return lexicon.get(root(normalized), [normalized])
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def build(args):
+    import mysql.connector
+    import search_index
+    from import_quran import DB_CONFIG
+
+    print("\n🔌 Connecting to MySQL database...")
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG)
+        cursor = connection.cursor()
+    except mysql.connector.Error as err:
+        print(f"   ❌ Error: {err}")
+        sys.exit(1)
+
+    try:
+        for source in ROOT_SOURCES:
+            start_time = time.time()
+            path = search_index.index_path(source, args.directory)
+            print(f"\n🌱 Indexing {source} by root...")
+            builder, size = search_index.build_source(cursor, source, path)
+            print(f"   ✅ {len(builder.doc_ids):,} documents, {len(builder.vocabulary):,} roots -> "
+                  f"{path} ({size / 1e6:.1f} MB) in {time.time() - start_time:.1f}s")
+        roots = save_lexicon(lexicon_path(args.directory), cached_forms())
+        print(f"\n📖 {len(_cache):,} distinct forms stemmed once each; lexicon of {roots:,} roots "
+              f"-> {lexicon_path(args.directory)}\n")
+    finally:
+        cursor.close()
+        connection.close()
+
+def search(args):
+    import search_index
+
+    indexes = {source: search_index.SearchIndex.load(source, args.directory) for source in ROOT_SOURCES}
+    print(f"Roots: {' '.join(search_index.ANALYZERS['arabic_root'](args.query))}")
+    start = time.perf_counter()
+    results = {source: index.search(args.query, args.k) for source, index in indexes.items()}
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for source, hits in results.items():
+        print(f"\n{source}:")
+        for row_id, label, score in hits:
+            print(f"  {score:7.3f}  {label}  (id {row_id})")
+        if not hits:
+            print("  no results")
+    print(f"\n(both indexes queried in {elapsed_ms:.2f} ms)")
+
+def parse_args():
+    """Parse command-line options."""
+    from search_index import DEFAULT_DIR
+
+    parser = argparse.ArgumentParser(description="Arabic root extraction and root-aware search")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--directory', type=Path, default=DEFAULT_DIR, help="Index directory (default: %(default)s)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('build', parents=[common], help="Build the root indexes and the lexicon")
+    stem_parser = commands.add_parser('stem', help="Print the root of each word")
+    stem_parser.add_argument('words', nargs='+')
+    expand_parser = commands.add_parser('expand', parents=[common], help="Corpus forms sharing a word's root")
+    expand_parser.add_argument('word')
+    search_parser = commands.add_parser('search', parents=[common], help="Search the Quran and hadiths by root")
+    search_parser.add_argument('query')
+    search_parser.add_argument('-k', type=int, default=10, help="Results per source (default: %(default)s)")
+    return parser.parse_args()
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+    if args.command == 'build':
+        build(args)
+    elif args.command == 'stem':
+        for word in args.words:
+            print(f"{word}\t{root(arabic_normalizer.normalize(word))}")
+    else:
+        try:
+            if args.command == 'expand':
+                print(' '.join(expand(args.word, load_lexicon(lexicon_path(args.directory)))))
+            else:
+                search(args)
+        except (FileNotFoundError, ValueError) as err:
+            print(f"❌ {err}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Prefix Autocomplete
+================================================
+
+Search-as-you-type suggestions for surah names, hadith collection and chapter
+names and the corpus vocabulary, answered from a memory-mapped trie with no database
+round trip.
+
+Features:
+- Entries are surah and hadith collection names (English and Arabic),
+  hadith chapter names (collections and chapters weighted by hadith count) and every term of the BM25 indexes
+  (weighted by document frequency, see search_index.py)
+- Keys are case-folded and Arabic-normalized (arabic_normalizer 'search'),
+  and multi-word names are also reachable from each later word and from
+  after an attached Arabic article ("baqarah" finds Al-Baqarah, بقرة finds
+  البقرة)
+- The trie is array-encoded: nodes are laid out breadth-first, so a node's
+  children are contiguous and sorted by character; a child is found by
+  bisecting that slice
+- The best TOP_K completions of every node are computed at build time
+  (surahs, collections, chapters, then terms; by weight within a kind); a
+  single-child chain shares its child's list, so a keystroke is one child
+  lookup plus reading a precomputed list
+- Loading maps the file and casts memoryviews over it: no parsing, no
+  per-node objects
+
+File layout (little-endian): header + JSON metadata, then the arrays listed
+in ARRAYS, each 8-byte aligned.
+
+Usage:
+    python autocomplete.py build
+    python autocomplete.py complete "al-b"
+    python autocomplete.py complete "رح" -k 5
+
+    from autocomplete import Autocomplete
+    completions = Autocomplete.load()
+    completions.complete('baq')     # [('Al-Baqarah', 'surah', '2'), ...]
+
+Requirements:
+    none to query; build needs mysql-connector-python (and numpy to read
+    the search index vocabularies)
+"""
+
+import argparse
+import json
+import mmap
+import re
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import arabic_normalizer
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_PATH = Path(__file__).resolve().with_name('autocomplete.bin')
+
+TOP_K = 10
+KINDS = ('surah', 'collection', 'chapter', 'term')   # ranking priority, best first
+VOCABULARY_SOURCES = ('ayah_data', 'hadiths')  # search_index sources whose terms are suggested
+MIN_TERM_FREQUENCY = 2                         # skip hapaxes (mostly typos and OCR noise)
+ARTICLE = 'ال'                                 # Arabic names are also keyed without it (البقرة -> بقرة)
+SEPARATORS = re.compile(r'[\W_]+')
+
+MAGIC = b'QTRIE\0\0\0'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<8sHI')   # magic, version, metadata length
+ALIGN = 8
+
+# name, array typecode
+ARRAYS = (
+    ('node_char', 'I'),         # code point of the edge leading into each node
+    ('first_child', 'I'),       # index of each node's first child
+    ('child_count', 'I'),
+    ('top_start', 'I'),         # each node's completions: top[top_start:top_start + top_count]
+    ('top_count', 'B'),
+    ('top', 'I'),               # entry ids
+    ('entry_kind', 'B'),
+    ('entry_weight', 'I'),
+    ('text_offsets', 'I'),      # entries + 1 byte offsets into texts
+    ('texts', 'B'),             # UTF-8 "display\\tref" per entry
+)
+
+Entry = Tuple[str, str, str, int]       # (display text, kind, ref, weight)
+Completion = Tuple[str, str, str]       # (display text, kind, ref)
+
+def normalize_key(text: str) -> str:
+    """Matching form of a name or query: Arabic-normalized, case-folded, words joined by one space."""
+    return SEPARATORS.sub(' ', arabic_normalizer.normalize(text).casefold()).strip()
+
+def entry_keys(text: str) -> List[str]:
+    """The full key plus one key starting at every later word (and after each word's article)."""
+    words = normalize_key(text).split(' ')
+    keys = []
+    for i, word in enumerate(words):
+        keys.append(' '.join(words[i:]))
+        if word.startswith(ARTICLE) and len(word) > len(ARTICLE) + 1:
+            keys.append(' '.join([word[len(ARTICLE):]] + words[i + 1:]))
+    return keys
+
+# ============================================================================
+# BUILDER
+# ============================================================================
+
+def build_trie(entries: List[Entry], top_k: int = TOP_K) -> Dict[str, array]:
+    """Lay out the trie and its per-node completions as arrays."""
+    order = sorted(range(len(entries)), key=lambda i: (KINDS.index(entries[i][1]), -entries[i][3], entries[i][0]))
+
+    # Dict-of-dicts trie; node = [children, completions, is_terminal]
+    root: list = [{}, [], False]
+    for entry_id in order:
+        for key in entry_keys(entries[entry_id][0]):
+            node = root
+            for char in key:
+                if len(node[1]) < top_k and entry_id not in node[1]:
+                    node[1].append(entry_id)
+                node = node[0].setdefault(char, [{}, [], False])
+            if len(node[1]) < top_k and entry_id not in node[1]:
+                node[1].append(entry_id)
+            node[2] = True
+
+    arrays = {name: array(typecode) for name, typecode in ARRAYS}
+    nodes = [root]
+    arrays['node_char'].append(0)
+    queue = deque([0])
+    while queue:
+        index = queue.popleft()
+        children = sorted(nodes[index][0].items())
+        arrays['first_child'].append(len(nodes))
+        arrays['child_count'].append(len(children))
+        for char, child in children:
+            queue.append(len(nodes))
+            nodes.append(child)
+            arrays['node_char'].append(ord(char))
+
+    # Completion lists, children before parents so single-child chains can share
+    top_start = [0] * len(nodes)
+    top_count = [0] * len(nodes)
+    for index in range(len(nodes) - 1, -1, -1):
+        children, completions, terminal = nodes[index]
+        if len(children) == 1 and not terminal:
+            child = arrays['first_child'][index]
+            if top_count[child] == len(completions):
+                top_start[index], top_count[index] = top_start[child], top_count[child]
+                continue
+        top_start[index], top_count[index] = len(arrays['top']), len(completions)
+        arrays['top'].extend(completions)
+    arrays['top_start'].extend(top_start)
+    arrays['top_count'].extend(top_count)
+
+    texts = [f"{text}\t{ref}".encode('utf-8') for text, _, ref, _ in entries]
+    arrays['entry_kind'].extend(KINDS.index(kind) for _, kind, _, _ in entries)
+    arrays['entry_weight'].extend(min(weight, 0xFFFFFFFF) for _, _, _, weight in entries)
+    arrays['text_offsets'].append(0)
+    for encoded in texts:
+        arrays['text_offsets'].append(arrays['text_offsets'][-1] + len(encoded))
+    arrays['texts'].frombytes(b''.join(texts))
+    return arrays
+
+def write_trie(path: Union[str, Path], entries: List[Entry], top_k: int = TOP_K) -> Tuple[int, int]:
+    """Write the trie file; returns (node count, size in bytes)."""
+    arrays = build_trie(entries, top_k)
+    layout, position = {}, 0
+    for name, _ in ARRAYS:
+        position += -position % ALIGN
+        layout[name] = [position, len(arrays[name])]
+        position += len(arrays[name]) * arrays[name].itemsize
+        if sys.byteorder != 'little':
+            arrays[name].byteswap()
+
+    meta = {'top_k': top_k, 'entries': len(entries), 'nodes': len(arrays['node_char']),
+            'built_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()), 'arrays': layout}
+    encoded = json.dumps(meta).encode('utf-8')
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded)) + encoded
+    header += b'\0' * (-len(header) % ALIGN)
+
+    with open(path, 'wb') as f:
+        f.write(header)
+        for name, _ in ARRAYS:
+            f.write(b'\0' * (-(f.tell() - len(header)) % ALIGN))
+            f.write(arrays[name].tobytes())
+        return meta['nodes'], f.tell()
+
+# ============================================================================
+# LOOKUP
+# ============================================================================
+
+class Autocomplete:
+    """Memory-mapped prefix completer."""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_PATH):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        magic, version, meta_length = HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not an autocomplete v{FORMAT_VERSION} file")
+        self.meta = json.loads(bytes(view[HEADER.size:HEADER.size + meta_length]))
+        self.top_k = self.meta['top_k']
+        self._decoded: Dict[int, Completion] = {}   # entry id -> completion, filled as entries are shown
+        data_start = HEADER.size + meta_length
+        data_start += -data_start % ALIGN
+
+        for name, typecode in ARRAYS:
+            offset, count = self.meta['arrays'][name]
+            size = array(typecode).itemsize
+            raw = view[data_start + offset:data_start + offset + count * size]
+            if sys.byteorder == 'little' or size == 1:
+                values = raw.cast(typecode)
+            else:
+                values = array(typecode)
+                values.frombytes(raw)
+                values.byteswap()
+            setattr(self, '_' + name, values)
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_PATH) -> 'Autocomplete':
+        return cls(path)
+
+    def _find(self, key: str) -> Optional[int]:
+        node = 0
+        node_char, first_child, child_count = self._node_char, self._first_child, self._child_count
+        for char in key:
+            first = first_child[node]
+            last = first + child_count[node]
+            code = ord(char)
+            node = bisect_left(node_char, code, first, last)
+            if node == last or node_char[node] != code:
+                return None
+        return node
+
+    def entry(self, entry_id: int) -> Completion:
+        completion = self._decoded.get(entry_id)
+        if completion is None:
+            encoded = bytes(self._texts[self._text_offsets[entry_id]:self._text_offsets[entry_id + 1]])
+            text, _, ref = encoded.decode('utf-8').partition('\t')
+            completion = self._decoded[entry_id] = (text, KINDS[self._entry_kind[entry_id]], ref)
+        return completion
+
+    def complete(self, prefix: str, k: int = TOP_K, kinds: Optional[Iterable[str]] = None) -> List[Completion]:
+        """Best completions of `prefix` (at most the build's top_k; `kinds` filters them)."""
+        node = self._find(normalize_key(prefix))
+        if node is None:
+            return []
+        start = self._top_start[node]
+        entry_ids = self._top[start:start + self._top_count[node]]
+        decoded = self._decoded
+        completions = [decoded.get(entry_id) or self.entry(entry_id) for entry_id in entry_ids]
+        if kinds is not None:
+            completions = [completion for completion in completions if completion[1] in kinds]
+        return completions[:k]
+
+# ============================================================================
+# BUILD FROM THE DATABASE AND SEARCH INDEXES
+# ============================================================================
+
+def vocabulary_entries(directory: Optional[Path] = None) -> List[Entry]:
+    """Terms of the BM25 indexes with their summed document frequencies."""
+    import search_index
+
+    frequencies: Dict[str, int] = {}
+    for source in VOCABULARY_SOURCES:
+        path = search_index.index_path(source, directory or search_index.DEFAULT_DIR)
+        if not path.exists():
+            print(f"   ⚠ {path} not found (run search_index.py build); skipping its vocabulary")
+            continue
+        index = search_index.SearchIndex(path)
+        for term in index.terms:
+            frequencies[term] = frequencies.get(term, 0) + index.document_frequency(term)
+    return [(term, 'term', '', df) for term, df in frequencies.items()
+            if df >= MIN_TERM_FREQUENCY and not term.isdigit()]
+
+def database_entries(cursor) -> List[Entry]:
+    cursor.execute("SELECT surah_number, name_english, name_arabic FROM surahs ORDER BY surah_number")
+    entries = []
+    for number, name_english, name_arabic in cursor.fetchall():
+        # Earlier surahs first among equal prefixes
+        entries += [(name, 'surah', str(number), 1000 - number) for name in (name_english, name_arabic) if name]
+
+    cursor.execute("""
+        SELECT c.slug, c.name_english, c.name_arabic, COUNT(h.id)
+        FROM hadith_collections c
+        LEFT JOIN hadiths h ON h.collection_id = c.id
+        GROUP BY c.id, c.slug, c.name_english, c.name_arabic
+    """)
+    for slug, name_english, name_arabic, count in cursor.fetchall():
+        entries += [(name, 'collection', slug, count) for name in (name_english, name_arabic) if name]
+
+    cursor.execute("""
+        SELECT c.slug, ch.chapter_number, ch.chapter_name_english, COUNT(h.id)
+        FROM hadith_chapters ch
+        JOIN hadith_collections c ON c.id = ch.collection_id
+        LEFT JOIN hadiths h ON h.chapter_id = ch.id
+        WHERE ch.chapter_name_english IS NOT NULL AND ch.chapter_name_english <> ''
+        GROUP BY ch.id, c.slug, ch.chapter_number, ch.chapter_name_english
+    """)
+    entries += [(name, 'chapter', f"{slug}:{number}", count) for slug, number, name, count in cursor.fetchall()]
+    return entries
+
+def build(args):
+    import mysql.connector
+    from import_quran import DB_CONFIG
+
+    print("\n🔌 Connecting to MySQL database...")
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG)
+        cursor = connection.cursor()
+    except mysql.connector.Error as err:
+        print(f"   ❌ Error: {err}")
+        sys.exit(1)
+
+    try:
+        start_time = time.time()
+        entries = database_entries(cursor)
+    finally:
+        cursor.close()
+        connection.close()
+    print(f"📚 {len(entries):,} surah, collection and chapter names")
+    terms = vocabulary_entries(args.index_directory)
+    print(f"📚 {len(terms):,} vocabulary terms")
+
+    nodes, size = write_trie(args.output, entries + terms, args.top_k)
+    start = time.perf_counter()
+    Autocomplete.load(args.output)
+    load_us = (time.perf_counter() - start) * 1e6
+    print(f"   ✅ {nodes:,} nodes -> {args.output} ({size / 1e6:.1f} MB, loads in {load_us:.0f} µs) "
+          f"in {time.time() - start_time:.1f}s\n")
+
+def complete(args):
+    start = time.perf_counter()
+    completer = Autocomplete.load(args.output)
+    load_us = (time.perf_counter() - start) * 1e6
+    start = time.perf_counter()
+    completions = completer.complete(args.prefix, args.k, args.kind)
+    query_us = (time.perf_counter() - start) * 1e6
+    for text, kind, ref in completions:
+        print(f"  {text:<40} {kind:<8} {ref}")
+    if not completions:
+        print("  no completions")
+    print(f"\n(loaded in {load_us:.0f} µs, completed in {query_us:.1f} µs)")
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Build or query the autocomplete trie")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--output', type=Path, default=DEFAULT_PATH, help="Trie file (default: %(default)s)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = commands.add_parser('build', parents=[common], help="Build the trie from the database and indexes")
+    build_parser.add_argument('--index-directory', type=Path, help="search_index.py directory (default: its default)")
+    build_parser.add_argument('--top-k', type=int, default=TOP_K, help="Completions kept per node (default: %(default)s)")
+
+    complete_parser = commands.add_parser('complete', parents=[common], help="Complete a prefix")
+    complete_parser.add_argument('prefix')
+    complete_parser.add_argument('-k', type=int, default=TOP_K, help="Completions to show (default: %(default)s)")
+    complete_parser.add_argument('--kind', nargs='+', choices=KINDS, help="Only these kinds")
+    return parser.parse_args()
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+    if args.command == 'build':
+        build(args)
+        return
+    try:
+        complete(args)
+    except (FileNotFoundError, ValueError) as err:
+        print(f"❌ {err}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
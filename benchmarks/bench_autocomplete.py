@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Prefix Autocomplete
+===============================
+
+Builds autocomplete.py tries over synthetic entry sets of growing size
+(surah-like names plus a Zipf-weighted vocabulary) and measures:
+
+- cold load:   opening and mapping the trie file (what a fresh worker pays)
+- keystroke:   complete() for every prefix of a word as it is typed
+- baseline:    the same prefixes answered from a sorted key list (bisect to
+               the prefix range, then heapq.nsmallest by rank over it)
+
+Every completion list must equal the baseline's, so the run doubles as a
+check of the precomputed per-node top-k lists.
+
+Usage:
+    python benchmarks/bench_autocomplete.py
+    python benchmarks/bench_autocomplete.py --sizes 10000 100000 500000 --words 200
+"""
+
+import argparse
+import heapq
+import random
+import statistics
+import string
+import sys
+import tempfile
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import autocomplete  # noqa: E402
+
+LETTERS = string.ascii_lowercase
+
+def synthetic_entries(rng: random.Random, size: int) -> list:
+    entries = [(f"Al-{''.join(rng.choices(LETTERS, k=rng.randint(4, 9))).title()}", 'surah', str(number), 1000 - number)
+               for number in range(1, 115)]
+    terms = set()
+    while len(terms) < size:
+        terms.add(''.join(rng.choices(LETTERS, k=max(2, int(rng.gauss(7, 2.5))))))
+    entries += [(term, 'term', '', int(100000 / rank)) for rank, term in enumerate(sorted(terms), 1)]
+    rng.shuffle(entries)
+    return entries
+
+class SortedBaseline:
+    """Sorted (key, entry id) list; a query scans the whole prefix range."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        pairs = sorted({(key, i) for i, entry in enumerate(entries) for key in autocomplete.entry_keys(entry[0])})
+        self.keys = [key for key, _ in pairs]
+        self.ids = [i for _, i in pairs]
+        self.rank = {i: (autocomplete.KINDS.index(kind), -weight, text)
+                     for i, (text, kind, _, weight) in enumerate(entries)}
+
+    def complete(self, prefix, k):
+        key = autocomplete.normalize_key(prefix)
+        start = bisect_left(self.keys, key)
+        end = bisect_left(self.keys, key + '\U0010ffff', start)
+        best = heapq.nsmallest(k, set(self.ids[start:end]), key=self.rank.__getitem__)
+        return [self.entries[i][:3] for i in best]
+
+def percentile(times, fraction):
+    return times[min(len(times) - 1, int(len(times) * fraction))]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark trie autocomplete")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 300000], help="Vocabulary sizes")
+    parser.add_argument('--words', type=int, default=200, help="Words typed per size (one query per keystroke)")
+    parser.add_argument('-k', type=int, default=autocomplete.TOP_K, help="Completions per query")
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("PREFIX AUTOCOMPLETE BENCHMARK")
+    print("="*70)
+    print(f"  {'entries':>9} {'build':>8} {'file':>8} {'cold load':>10} {'key p50':>9} {'p99':>8} {'baseline p50':>13} {'p99':>9}")
+
+    consistent = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            rng = random.Random(size)
+            entries = synthetic_entries(rng, size)
+            path = Path(tmp) / f"autocomplete_{size}.bin"
+            start = time.perf_counter()
+            _, file_size = autocomplete.write_trie(path, entries, args.k)
+            build_s = time.perf_counter() - start
+
+            loads = []
+            for _ in range(20):
+                start = time.perf_counter()
+                completer = autocomplete.Autocomplete.load(path)
+                loads.append((time.perf_counter() - start) * 1e6)
+
+            prefixes = [word[:i] for word in (rng.choice(entries)[0] for _ in range(args.words))
+                        for i in range(1, len(word) + 1)]
+            baseline = SortedBaseline(entries)
+            trie_times, baseline_times = [], []
+            for prefix in prefixes:
+                start = time.perf_counter()
+                result = completer.complete(prefix, args.k)
+                trie_times.append((time.perf_counter() - start) * 1e6)
+                start = time.perf_counter()
+                expected = baseline.complete(prefix, args.k)
+                baseline_times.append((time.perf_counter() - start) * 1e6)
+                consistent &= result == expected
+
+            trie_times.sort()
+            baseline_times.sort()
+            print(f"  {len(entries):>9,} {build_s:>7.1f}s {file_size / 1e6:>6.1f}MB {statistics.median(loads):>8.0f}µs "
+                  f"{statistics.median(trie_times):>7.1f}µs {percentile(trie_times, 0.99):>6.1f}µs "
+                  f"{statistics.median(baseline_times):>11.1f}µs {percentile(baseline_times, 0.99):>7.0f}µs")
+            del completer
+
+    print(f"\n  {'✅ trie completions match the sorted-list baseline' if consistent else '❌ COMPLETIONS DIFFER FROM BASELINE'}")
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    main()
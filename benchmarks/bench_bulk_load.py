@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark - executemany vs LOAD DATA LOCAL INFILE
+=================================================
+
+Loads synthetic hadith-sized rows (long vocalized Arabic text containing
+tabs, newlines, backslashes and NULLs) into a scratch table with each
+bulk-load engine, reports rows/second, and reads every row back to check
+that the TSV escaping round-trips exactly.
+
+Needs a MySQL server with local_infile=ON and the DB_CONFIG from
+import_quran.py. The scratch table is dropped afterwards.
+
+Usage:
+    python benchmarks/bench_bulk_load.py
+    python benchmarks/bench_bulk_load.py --rows 35000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import mysql.connector
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import bulk_load  # noqa: E402
+from import_quran import DB_CONFIG  # noqa: E402
+
+SCRATCH_TABLE = 'bench_bulk_load'
+
+SAMPLE_WORDS = [
+    'حَدَّثَنَا', 'الْحُمَيْدِيُّ', 'عَبْدُ', 'اللَّهِ', 'بْنُ', 'الزُّبَيْرِ', 'قَالَ',
+    'سُفْيَانُ', 'إِنَّمَا', 'الأَعْمَالُ', 'بِالنِّيَّاتِ', 'وَإِنَّمَا', 'لِكُلِّ', 'امْرِئٍ',
+    'Narrated', "'Umar", 'bin', 'Al-Khattab:', 'Allah\'s', 'Messenger', '(ﷺ)', 'said',
+    '\t', '\n', '\\', '\r\n',
+]
+
+def make_rows(count: int):
+    rng = random.Random(42)
+    rows = []
+    for i in range(count):
+        text = ' '.join(rng.choice(SAMPLE_WORDS) for _ in range(rng.randint(40, 400)))
+        rows.append((i + 1, str(i + 1), text, None if i % 7 == 0 else f"Sahih {i % 3}"))
+    return rows
+
+def create_scratch_table(cursor):
+    cursor.execute(f"DROP TABLE IF EXISTS {SCRATCH_TABLE}")
+    cursor.execute(f"""
+        CREATE TABLE {SCRATCH_TABLE} (
+          id INT PRIMARY KEY,
+          reference_number VARCHAR(50) NOT NULL,
+          text_arabic LONGTEXT NOT NULL,
+          grade VARCHAR(50)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk-load engines")
+    parser.add_argument('--rows', type=int, default=25000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    columns = ['id', 'reference_number', 'text_arabic', 'grade']
+
+    config = dict(DB_CONFIG, raise_on_warnings=False)
+    connection = mysql.connector.connect(**config, allow_local_infile=True)
+    cursor = connection.cursor(buffered=True)
+
+    results = {}
+    try:
+        for engine in bulk_load.ENGINES:
+            create_scratch_table(cursor)
+            connection.commit()
+
+            bulk_load.set_engine(engine)
+            start = time.perf_counter()
+            loaded = bulk_load.batch_insert(cursor, SCRATCH_TABLE, columns, rows)
+            connection.commit()
+            elapsed = time.perf_counter() - start
+
+            # A refused LOAD DATA flips the engine back; report what actually ran
+            actual = engine if bulk_load.get_engine() == engine else f"{engine} -> executemany"
+
+            cursor.execute(f"SELECT id, reference_number, text_arabic, grade FROM {SCRATCH_TABLE} ORDER BY id")
+            round_trip = cursor.fetchall() == rows
+            results[engine] = (actual, loaded, elapsed, round_trip)
+    finally:
+        cursor.execute(f"DROP TABLE IF EXISTS {SCRATCH_TABLE}")
+        connection.commit()
+        cursor.close()
+        connection.close()
+
+    print("\n" + "="*70)
+    print(f"BULK LOAD BENCHMARK ({args.rows:,} rows)")
+    print("="*70)
+    baseline = results['executemany'][2]
+    for engine, (actual, loaded, elapsed, round_trip) in results.items():
+        print(f"  {actual:<24} {loaded:>8,} rows  {elapsed:7.2f}s  {loaded / elapsed:>10,.0f} rows/s  "
+              f"{baseline / elapsed:5.2f}x  {'✅ round-trip' if round_trip else '❌ MISMATCH'}")
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Packed Corpus vs In-Memory Dicts
+============================================
+
+Compares two ways a read-heavy service can hold the Quran plus N editions:
+
+- dicts:  {edition: {ayah_key: text}}, as built from ayah_data rows
+- corpus: quran_corpus.bin, memory-mapped by QuranCorpus
+
+Reports startup time, Python heap held after startup (tracemalloc; the
+corpus lives in the shared page cache, not the process heap) and per-lookup
+latency. Both must return identical texts.
+
+Usage:
+    python benchmarks/bench_corpus.py
+    python benchmarks/bench_corpus.py --editions 50
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quran_coords import QuranCoords  # noqa: E402
+from quran_corpus import QuranCorpus, write_corpus  # noqa: E402
+
+AYAH_COUNTS = [7, 286, 200, 176, 120, 165, 206, 75, 129, 109, 123, 111, 43, 52, 99, 128, 111, 110, 98, 135,
+               112, 78, 118, 64, 77, 227, 93, 88, 69, 60, 34, 30, 73, 54, 45, 83, 182, 88, 75, 85, 54, 53, 89,
+               59, 37, 35, 38, 29, 18, 45, 60, 49, 62, 55, 78, 96, 29, 22, 24, 13, 14, 11, 11, 18, 12, 12, 30,
+               52, 52, 44, 28, 28, 20, 56, 40, 31, 50, 40, 46, 42, 29, 19, 36, 25, 22, 17, 19, 26, 30, 20, 15,
+               21, 11, 8, 8, 19, 5, 8, 8, 11, 11, 8, 3, 9, 5, 4, 7, 3, 6, 3, 5, 4, 5, 6]
+WORDS = ['mercy', 'Lord', 'believers', 'guidance', 'Day', 'Judgement', 'الرحمن', 'الرحيم', 'Paradise', 'those']
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def synthetic_text(rng, edition, number):
+    return f"{edition} {number}: " + ' '.join(rng.choices(WORDS, k=rng.randint(5, 60)))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the packed corpus against in-memory dicts")
+    parser.add_argument('--editions', type=int, default=20, help="Editions besides the Arabic text")
+    parser.add_argument('--lookups', type=int, default=100000, help="Random lookups timed")
+    args = parser.parse_args()
+
+    coords = QuranCoords(AYAH_COUNTS, {})
+    names = ['arabic'] + [f"en.edition{i}" for i in range(args.editions)]
+    rng = random.Random(0)
+    rows = {name: [(number, synthetic_text(rng, name, number)) for number in range(1, coords.total_ayahs + 1)]
+            for name in names}
+
+    tmp = tempfile.TemporaryDirectory()
+    path = Path(tmp.name) / 'quran_corpus.bin'
+    size = write_corpus(path, AYAH_COUNTS, rows)
+
+    # dicts: what loading ayah_data into Python costs (rows arrive as UTF-8 from the driver)
+    fetched = {name: [(coords.key(number), text.encode('utf-8')) for number, text in pairs]
+               for name, pairs in rows.items()}
+    del rows
+    tracemalloc.start()
+    start = time.perf_counter()
+    dicts = {name: {key: raw.decode('utf-8') for key, raw in pairs} for name, pairs in fetched.items()}
+    dict_startup = time.perf_counter() - start
+    dict_heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del fetched
+
+    start = time.perf_counter()
+    QuranCorpus(path).close()
+    corpus_startup = time.perf_counter() - start
+
+    tracemalloc.start()
+    corpus = QuranCorpus(path)
+    corpus_heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    queries = [(rng.choice(names), coords.key(rng.randint(1, coords.total_ayahs))) for _ in range(args.lookups)]
+    start = time.perf_counter()
+    for name, key in queries:
+        dicts[name][key]
+    dict_lookup = (time.perf_counter() - start) / len(queries)
+    start = time.perf_counter()
+    for name, key in queries:
+        corpus.text(name, key)
+    corpus_lookup = (time.perf_counter() - start) / len(queries)
+    same = all(corpus.text(name, key) == dicts[name][key] for name, key in queries[:5000])
+
+    print("\n" + "="*70)
+    print(f"PACKED CORPUS BENCHMARK ({len(names)} editions x {coords.total_ayahs:,} ayahs, "
+          f"file {size / 1e6:.1f} MB)")
+    print("="*70)
+    print(f"  {'':<8} {'startup':>12} {'heap held':>12} {'lookup':>10}")
+    print(f"  {'dicts':<8} {dict_startup * 1000:>10.1f}ms {dict_heap / 1e6:>10.1f}MB "
+          f"{dict_lookup * 1e9:>8.0f}ns")
+    print(f"  {'corpus':<8} {corpus_startup * 1e6:>10.0f}µs {corpus_heap / 1e3:>10.1f}KB "
+          f"{corpus_lookup * 1e9:>8.0f}ns")
+    print(f"\n  {'✅ identical texts' if same else '❌ TEXTS DIFFER'}")
+    print("="*70 + "\n")
+    corpus.close()
+    tmp.cleanup()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Serial vs Concurrent Edition Fetching
+=================================================
+
+Serves synthetic AlQuran.cloud payloads from a local fixture HTTP server
+(with simulated network latency) and times these fetch strategies:
+
+- legacy:     one fresh requests.get() connection per URL, one after another
+- serial:     shared keep-alive session, one URL at a time
+- concurrent: shared keep-alive session, all URLs in parallel
+- revalidate: concurrent, with a warm on-disk cache (HTTP 304 replays)
+- offline:    cache replay only, no network
+
+Each strategy must return identical payloads, so the run doubles as a
+check that the concurrent path still honours fetch_api's retry semantics
+(use --flaky to make every URL fail once with HTTP 503 first).
+
+Usage:
+    python benchmarks/bench_fetch.py
+    python benchmarks/bench_fetch.py --latency 0.3 --concurrency 6 --flaky
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import http_client  # noqa: E402
+import import_quran  # noqa: E402
+
+# ============================================================================
+# FIXTURE SERVER
+# ============================================================================
+
+def build_fixture(edition: str) -> bytes:
+    """Build a full-size (114 surahs / 6,236 ayahs) edition payload."""
+    surahs = []
+    number = 0
+    for surah_number in range(1, 115):
+        ayahs = []
+        for ayah_number in range(1, 55 + (surah_number % 3)):
+            number += 1
+            ayahs.append({
+                'number': number,
+                'numberInSurah': ayah_number,
+                'text': f"{edition} {surah_number}:{ayah_number} " + "lorem ipsum " * 12,
+            })
+        surahs.append({'number': surah_number, 'ayahs': ayahs})
+    return json.dumps({'code': 200, 'data': {'surahs': surahs}}).encode('utf-8')
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves /v1/<path> from an in-memory fixture map with artificial latency."""
+
+    protocol_version = 'HTTP/1.1'  # allow keep-alive
+    fixtures = {}
+    latency = 0.0
+    flaky = False
+    failed_once = set()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        time.sleep(self.latency)
+
+        if self.flaky:
+            with self.lock:
+                first_hit = self.path not in self.failed_once
+                self.failed_once.add(self.path)
+            if first_hit:
+                self._send(503, b'{"code": 503}')
+                return
+
+        body = self.fixtures.get(self.path)
+        if body is None:
+            self._send(404, b'{"code": 404}')
+            return
+
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            self._send(304, b'', etag)
+        else:
+            self._send(200, body, etag)
+
+    def _send(self, status: int, body: bytes, etag: str = None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def start_server(latency: float, flaky: bool) -> ThreadingHTTPServer:
+    """Start the fixture server on an ephemeral port and point the importer at it."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    import_quran.API_BASE = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    FixtureHandler.latency = latency
+    FixtureHandler.flaky = flaky
+    for url in import_quran.source_urls():
+        path = url[len(import_quran.API_BASE.rsplit('/v1', 1)[0]):]
+        FixtureHandler.fixtures[path] = build_fixture(path.rsplit('/', 1)[-1])
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# ============================================================================
+# STRATEGIES
+# ============================================================================
+
+def legacy_fetch(url: str):
+    """The original fetch_api: a brand-new connection per request."""
+    session = requests.Session()
+    try:
+        data = http_client.get_json(url, session=session)
+    finally:
+        session.close()
+    return data['data']
+
+def run_legacy(concurrency: int):
+    return {url: legacy_fetch(url) for url in import_quran.source_urls()}
+
+def run_serial(concurrency: int):
+    http_client.configure_session(1)
+    return {url: import_quran.fetch_api(url) for url in import_quran.source_urls()}
+
+def run_concurrent(concurrency: int):
+    return import_quran.prefetch_sources(concurrency)
+
+def run_revalidate(concurrency: int):
+    return import_quran.prefetch_sources(concurrency)
+
+def run_offline(concurrency: int):
+    return import_quran.prefetch_sources(concurrency)
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serial vs concurrent edition fetching")
+    parser.add_argument('--latency', type=float, default=0.2, help="Simulated per-request latency (s)")
+    parser.add_argument('--concurrency', type=int, default=http_client.DEFAULT_CONCURRENCY)
+    parser.add_argument('--flaky', action='store_true', help="Fail each URL once with HTTP 503")
+    args = parser.parse_args()
+
+    strategies = [('legacy', run_legacy), ('serial', run_serial), ('concurrent', run_concurrent),
+                  ('revalidate', run_revalidate), ('offline', run_offline)]
+    timings = {}
+    reference = None
+    cache_dir = tempfile.TemporaryDirectory()
+
+    server = start_server(args.latency, args.flaky)
+    try:
+        for name, strategy in strategies:
+            FixtureHandler.failed_once.clear()
+            if name == 'revalidate':
+                http_client.configure_cache(cache_dir.name)
+                import_quran.prefetch_sources(args.concurrency)  # warm the cache
+                FixtureHandler.failed_once.clear()
+            elif name == 'offline':
+                http_client.configure_cache(cache_dir.name, offline=True)
+
+            start = time.perf_counter()
+            result = strategy(args.concurrency)
+            timings[name] = time.perf_counter() - start
+
+            payloads = list(result.values())
+            if reference is None:
+                reference = payloads
+            elif payloads != reference:
+                print(f"❌ {name} returned different payloads than legacy")
+                sys.exit(1)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("\n" + "="*70)
+    print(f"FETCH BENCHMARK ({len(import_quran.source_urls())} URLs, "
+          f"{args.latency:.2f}s latency, concurrency={args.concurrency})")
+    print("="*70)
+    for name, _ in strategies:
+        speedup = timings['legacy'] / timings[name]
+        print(f"  {name:<12} {timings[name]:8.3f}s   {speedup:5.2f}x vs legacy")
+    print("="*70 + "\n")
+    cache_dir.cleanup()
+
+if __name__ == "__main__":
+    main()
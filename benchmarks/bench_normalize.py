@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Arabic Normalization
+================================
+
+Times text_clean generation over two synthetic, fully vocalized corpora:
+Quran-sized with ayah-length texts (6,236 texts of 5-60 words) and
+hadith-length texts (40-250 words):
+
+- legacy:      the old remove_diacritics (one str.replace per mark, 14 marks)
+- legacy-full: the same replace loop extended to every 'search' level mapping
+- diacritics:  arabic_normalizer.normalize per text, 'diacritics' level
+- search:      arabic_normalizer.normalize per text, 'search' level
+- batch:       arabic_normalizer.normalize_many over the whole list, 'search'
+
+The 'diacritics' output must equal the legacy output once the marks the
+legacy function missed (dagger alef, Quranic signs, tatweel) are removed
+as well, so the run doubles as a correctness check.
+
+Usage:
+    python benchmarks/bench_normalize.py
+    python benchmarks/bench_normalize.py --ayahs 50000 --hadiths 20000 --repeat 10
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import arabic_normalizer  # noqa: E402
+
+# Vocalized words with dagger alef, wasla, tatweel and annotation marks
+WORDS = [
+    'بِسْمِ', 'ٱللَّهِ', 'ٱلرَّحْمَٰنِ', 'ٱلرَّحِيمِ', 'ٱلْحَمْدُ', 'لِلَّهِ', 'رَبِّ', 'ٱلْعَٰلَمِينَ',
+    'مَٰلِكِ', 'يَوْمِ', 'ٱلدِّينِ', 'إِيَّاكَ', 'نَعْبُدُ', 'وَإِيَّاكَ', 'نَسْتَعِينُ', 'ٱهْدِنَا',
+    'ٱلصِّرَٰطَ', 'ٱلْمُسْتَقِيمَ', 'أَنْعَمْتَ', 'عَلَيْهِمْ', 'غَيْرِ', 'ٱلْمَغْضُوبِ', 'ٱلضَّآلِّينَ',
+    'ذَٰلِكَ', 'ٱلْكِتَٰبُ', 'لَا', 'رَيْبَ', 'فِيهِ', 'هُدًى', 'لِّلْمُتَّقِينَ', 'ٱلصَّلَوٰةَ', 'ۖ', 'ۚ', 'ۗ',
+    'يُؤْمِنُونَ', 'بِٱلْغَيْبِ', 'وَيُقِيمُونَ', 'رَزَقْنَٰهُمْ', 'يُنفِقُونَ', 'الــرحمن', 'جَنَّةٌ',
+]
+
+# ============================================================================
+# BASELINE
+# ============================================================================
+
+LEGACY_DIACRITICS = [chr(c) for c in range(0x064B, 0x0659)]
+
+def remove_diacritics(arabic_text: str) -> str:
+    """The pre-arabic_normalizer implementation from import_quran.py."""
+    clean_text = arabic_text
+    for diacritic in LEGACY_DIACRITICS:
+        clean_text = clean_text.replace(diacritic, '')
+    return clean_text
+
+SEARCH_MAPPINGS = [(chr(code), chr(replacement) if replacement is not None else '')
+                   for code, replacement in enumerate(arabic_normalizer.translation_table('search'))
+                   if replacement != code]
+
+def replace_all(arabic_text: str) -> str:
+    """The legacy replace loop, covering everything the 'search' level does."""
+    clean_text = arabic_text
+    for mark, replacement in SEARCH_MAPPINGS:
+        clean_text = clean_text.replace(mark, replacement)
+    return clean_text
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def timed(func, texts, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(texts)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+def run(texts, repeat):
+    strategies = [
+        ('legacy', lambda items: [remove_diacritics(text) for text in items]),
+        ('legacy-full', lambda items: [replace_all(text) for text in items]),
+        ('diacritics', lambda items: [arabic_normalizer.normalize(text, 'diacritics') for text in items]),
+        ('search', lambda items: [arabic_normalizer.normalize(text) for text in items]),
+        ('batch', lambda items: arabic_normalizer.normalize_many(items)),
+    ]
+    results = {name: timed(func, texts, repeat) for name, func in strategies}
+
+    legacy_rest = arabic_normalizer.normalize_many(results['legacy'][0], 'diacritics')
+    same = (legacy_rest == results['diacritics'][0]
+            and results['legacy-full'][0] == results['search'][0] == results['batch'][0])
+
+    chars = sum(len(text) for text in texts)
+    baseline = results['legacy'][1]
+    for name, (_, elapsed) in results.items():
+        print(f"  {name:<12} {elapsed * 1000:>8.1f} ms  {chars / elapsed / 1e6:>7.1f}M chars/s  "
+              f"{baseline / elapsed:>5.1f}x")
+    return same
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Arabic normalization")
+    parser.add_argument('--ayahs', type=int, default=6236, help="Texts in the ayah-length corpus")
+    parser.add_argument('--hadiths', type=int, default=6236, help="Texts in the hadith-length corpus")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per strategy (best is reported)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    corpora = [
+        ('ayah-length', [' '.join(rng.choices(WORDS, k=rng.randint(5, 60))) for _ in range(args.ayahs)]),
+        ('hadith-length', [' '.join(rng.choices(WORDS, k=rng.randint(40, 250))) for _ in range(args.hadiths)]),
+    ]
+
+    print("\n" + "="*70)
+    print("ARABIC NORMALIZATION BENCHMARK")
+    print("="*70)
+    same = True
+    for name, texts in corpora:
+        chars = sum(len(text) for text in texts)
+        print(f"\n{name}: {len(texts):,} texts, {chars / 1e6:.1f}M chars, {chars / len(texts):.0f} chars/text")
+        same &= run(texts, args.repeat)
+    print(f"\n  {'✅ outputs consistent' if same else '❌ OUTPUTS DIFFER'}")
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    main()
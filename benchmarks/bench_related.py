@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Related Ayahs and Hadiths
+=====================================
+
+Times the two halves of related.py on synthetic data at the corpus sizes
+(6,236 ayahs, ~35,000 hadiths):
+
+- lsa:         TF-IDF + randomized SVD over a Zipf-distributed corpus
+- precompute:  all-pairs top-k for ayahs/hadiths in both directions, batched
+               matrix products + argpartition (related.top_k)
+- per-row:     the loop it replaces (one dot product and a full argsort per
+               item), timed on a sample and extrapolated to every item
+
+Sampled rows of the batched tables must equal a full argsort of the exact
+scores, so the run doubles as a check of the argpartition selection.
+
+Usage:
+    python benchmarks/bench_related.py
+    python benchmarks/bench_related.py --dimensions 1536 --skip-lsa     # embedding-sized vectors
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import related  # noqa: E402
+
+def synthetic_vectors(rng: numpy.random.Generator, count: int, dimensions: int, topics: int = 500) -> numpy.ndarray:
+    """Rows scattered around random topic centres, normalized."""
+    centres = rng.standard_normal((topics, dimensions), dtype=numpy.float32)
+    vectors = centres[rng.integers(0, topics, count)] + 0.8 * rng.standard_normal((count, dimensions), dtype=numpy.float32)
+    return related.normalize_rows(vectors)
+
+def bench_lsa(args):
+    rng = random.Random(0)
+    vocabulary = [f"w{i}" for i in range(args.vocabulary)]
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(args.vocabulary)))   # Zipf
+    documents = [' '.join(rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(10, 120)))
+                 for _ in range(args.ayahs + args.hadiths)]
+    start = time.perf_counter()
+    matrix, terms = related.tfidf_matrix(documents)
+    tfidf_s = time.perf_counter() - start
+    start = time.perf_counter()
+    vectors = related.lsa_vectors(matrix, args.dimensions)
+    lsa_s = time.perf_counter() - start
+    print(f"\n  lsa: {matrix.shape[0]:,} documents x {len(terms):,} terms, {len(matrix.values):,} nonzeros")
+    print(f"       tf-idf {tfidf_s:.1f}s, randomized SVD to {vectors.shape[1]} dimensions {lsa_s:.1f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark related-item precomputation")
+    parser.add_argument('--ayahs', type=int, default=6236)
+    parser.add_argument('--hadiths', type=int, default=35000)
+    parser.add_argument('--dimensions', type=int, default=related.DIMENSIONS)
+    parser.add_argument('-k', type=int, default=related.TOP_K)
+    parser.add_argument('--vocabulary', type=int, default=30000, help="Synthetic LSA vocabulary size")
+    parser.add_argument('--sample', type=int, default=200, help="Rows timed with the per-row loop and verified")
+    parser.add_argument('--skip-lsa', action='store_true')
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("RELATED ITEMS BENCHMARK")
+    print("="*70)
+    if not args.skip_lsa:
+        bench_lsa(args)
+
+    rng = numpy.random.default_rng(0)
+    sets = {'ayahs': synthetic_vectors(rng, args.ayahs, args.dimensions),
+            'hadiths': synthetic_vectors(rng, args.hadiths, args.dimensions)}
+    print(f"\n  precompute: top-{args.k}, {args.dimensions} dimensions")
+    print(f"  {'pair':<18} {'pairs':>15} {'batched':>9} {'per-row (est.)':>15}  speedup")
+
+    consistent = True
+    total_batched = total_loop = 0.0
+    for query, target in itertools.product(sets, repeat=2):
+        queries, targets = sets[query], sets[target]
+        exclude = numpy.arange(len(queries)) if query == target else None
+        start = time.perf_counter()
+        positions, _ = related.top_k(queries, targets, args.k, exclude)
+        batched_s = time.perf_counter() - start
+
+        sample = rng.choice(len(queries), min(args.sample, len(queries)), replace=False)
+        start = time.perf_counter()
+        for row in sample:
+            scores = targets @ queries[row]
+            if exclude is not None:
+                scores[row] = -numpy.inf
+            expected = numpy.argsort(-scores, kind='stable')[:args.k]
+            consistent &= set(expected.tolist()) == set(positions[row].tolist())
+        loop_s = (time.perf_counter() - start) / len(sample) * len(queries)
+
+        total_batched += batched_s
+        total_loop += loop_s
+        print(f"  {query + ' -> ' + target:<18} {len(queries) * len(targets):>15,} {batched_s:>8.1f}s "
+              f"{loop_s:>14.1f}s  {loop_s / batched_s:>6.1f}x")
+    print(f"  {'all':<18} {'':>15} {total_batched:>8.1f}s {total_loop:>14.1f}s  {total_loop / total_batched:>6.1f}x")
+
+    print(f"\n  {'✅ batched top-k matches full argsort' if consistent else '❌ TOP-K DIFFERS FROM FULL ARGSORT'}")
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark - BM25 Index vs MySQL FULLTEXT
+========================================
+
+Runs the queries from verify_database.py test_fulltext_search (plus a few
+that MySQL's stopword list and minimum token length get wrong) against:
+
+- mysql:     MATCH ... AGAINST in natural language mode, top-k ordered by relevance
+- maxscore:  search_index.SearchIndex.search (MaxScore early termination)
+- full:      the same index scoring every match (exhaustive=True)
+
+For each query it reports median latency, how many rows each side matches,
+recall of the index against the MySQL match set, and the top-k overlap.
+maxscore and full must return the same scores, so the run doubles as a
+correctness check of the early termination.
+
+Needs a MySQL server with the imported data (DB_CONFIG from import_quran.py)
+and indexes built with `python search_index.py build`. --synthetic skips
+MySQL and compares maxscore with full on a generated Zipf-distributed corpus.
+
+Usage:
+    python benchmarks/bench_search.py
+    python benchmarks/bench_search.py -k 20 --repeat 20
+    python benchmarks/bench_search.py --synthetic --docs 125000
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import search_index  # noqa: E402
+
+QUERIES = {
+    'ayah_data': ['Paradise', 'gardens beneath which rivers flow', 'mercy', 'Isa son of Maryam', 'who is he'],
+    'hadiths': ['prayer', 'fasting in Ramadan', 'intentions', 'the best of you', 'wudu'],
+}
+
+MYSQL_QUERIES = {
+    'ayah_data': """
+        SELECT ad.id FROM ayah_data ad
+        JOIN editions e ON ad.edition_id = e.id
+        WHERE MATCH(ad.text) AGAINST(%s IN NATURAL LANGUAGE MODE)
+        AND e.type = 'translation'
+    """,
+    'hadiths': """
+        SELECT id FROM hadiths
+        WHERE MATCH(text_english) AGAINST(%s IN NATURAL LANGUAGE MODE)
+    """,
+}
+MYSQL_RANKING = {
+    'ayah_data': "ORDER BY MATCH(ad.text) AGAINST(%s IN NATURAL LANGUAGE MODE) DESC LIMIT %s",
+    'hadiths': "ORDER BY MATCH(text_english) AGAINST(%s IN NATURAL LANGUAGE MODE) DESC LIMIT %s",
+}
+
+def timed(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times) * 1000
+
+def same_scores(a, b) -> bool:
+    return len(a) == len(b) and all(abs(x[-1] - y[-1]) < 1e-6 for x, y in zip(a, b))
+
+# ============================================================================
+# MYSQL COMPARISON
+# ============================================================================
+
+def compare_mysql(args):
+    import mysql.connector
+    from import_quran import DB_CONFIG
+
+    connection = mysql.connector.connect(**DB_CONFIG)
+    cursor = connection.cursor()
+    consistent = True
+    try:
+        for source, queries in QUERIES.items():
+            index, load_ms = timed(lambda: search_index.SearchIndex.load(source), 1)
+            print(f"\n{source}: {index.total_docs:,} documents, {len(index.terms):,} terms, loaded in {load_ms:.1f} ms")
+            print(f"  {'query':<34} {'mysql':>9} {'maxscore':>9} {'full':>9}   {'matched':>15}  {'recall':>6}  top-{args.k}")
+
+            for query in queries:
+                def mysql_top():
+                    cursor.execute(MYSQL_QUERIES[source] + MYSQL_RANKING[source], (query, query, args.k))
+                    return [row[0] for row in cursor.fetchall()]
+                mysql_ids, mysql_ms = timed(mysql_top, args.repeat)
+                cursor.execute(MYSQL_QUERIES[source], (query,))
+                mysql_matched = {row[0] for row in cursor.fetchall()}
+
+                fast, fast_ms = timed(lambda: index.search(query, args.k), args.repeat)
+                full, full_ms = timed(lambda: index.search(query, args.k, exhaustive=True), args.repeat)
+                consistent &= same_scores(fast, full)
+
+                index_matched = set(index.matching_row_ids(query).tolist())
+                recall = len(mysql_matched & index_matched) / len(mysql_matched) if mysql_matched else 1.0
+                overlap = len(set(mysql_ids) & {row_id for row_id, _, _ in fast})
+                print(f"  {query[:34]:<34} {mysql_ms:>7.2f}ms {fast_ms:>7.2f}ms {full_ms:>7.2f}ms   "
+                      f"{len(mysql_matched):>6,}/{len(index_matched):<8,} {recall:>6.1%}  {overlap}/{len(mysql_ids)}")
+    finally:
+        cursor.close()
+        connection.close()
+    return consistent
+
+# ============================================================================
+# SYNTHETIC
+# ============================================================================
+
+def compare_synthetic(args):
+    rng = random.Random(0)
+    vocabulary = [f"w{i}" for i in range(args.vocabulary)]
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(args.vocabulary)))   # Zipf
+    builder = search_index.IndexBuilder()
+    start = time.perf_counter()
+    for doc in range(args.docs):
+        builder.add(doc + 1, doc % 20 + 1, f"doc{doc}", ' '.join(rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(5, 60))))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'synthetic.idx'
+        size = builder.write(path, 'synthetic', {f"g{i}": i for i in range(1, 21)})
+        build_s = time.perf_counter() - start
+        index, load_ms = timed(lambda: search_index.SearchIndex(path), 1)
+        print(f"\nsynthetic: {args.docs:,} documents, {len(index.terms):,} terms, {len(builder._docs):,} postings, "
+              f"{size / 1e6:.1f} MB ({size / len(builder._docs):.2f} B/posting), "
+              f"built in {build_s:.1f}s, loaded in {load_ms:.1f} ms")
+        print(f"  {'query':<34} {'maxscore':>9} {'full':>9}  speedup")
+
+        consistent = True
+        queries = [' '.join(f"w{rng.randint(0, n)}" for n in (3, 30, 300, 3000)[:size_q])
+                   for size_q in (1, 2, 3, 4) for _ in range(2)]
+        queries.append('w0 w1 w2 w3 w4 w5')
+        for query in queries:
+            fast, fast_ms = timed(lambda: index.search(query, args.k), args.repeat)
+            full, full_ms = timed(lambda: index.search(query, args.k, exhaustive=True), args.repeat)
+            consistent &= same_scores(fast, full)
+            print(f"  {query:<34} {fast_ms:>7.2f}ms {full_ms:>7.2f}ms  {full_ms / fast_ms:>6.1f}x")
+        index.close()
+    return consistent
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the BM25 index against MySQL FULLTEXT")
+    parser.add_argument('-k', type=int, default=10, help="Top-k results per query")
+    parser.add_argument('--repeat', type=int, default=10, help="Runs per query (median is reported)")
+    parser.add_argument('--synthetic', action='store_true', help="Skip MySQL; use a generated corpus")
+    parser.add_argument('--docs', type=int, default=125000, help="Synthetic documents")
+    parser.add_argument('--vocabulary', type=int, default=30000, help="Synthetic vocabulary size")
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("BM25 SEARCH BENCHMARK")
+    print("="*70)
+    consistent = compare_synthetic(args) if args.synthetic else compare_mysql(args)
+    print(f"\n  {'✅ maxscore matches full scoring' if consistent else '❌ MAXSCORE RESULTS DIFFER'}")
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    main()
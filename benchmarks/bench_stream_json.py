@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Loaded vs Streaming Payload Parsing
+===============================================
+
+Measures peak Python heap (tracemalloc) while turning a hadith collection
+and a Quran edition into insert-ready tuples, two ways:
+
+- loaded:    fetch the whole JSON document(s), build the full row list
+             (the --stream-less importer path)
+- streaming: parse items incrementally from the cached gzip body and hand
+             rows on in STREAM_BATCH_ROWS batches (the --stream path)
+
+Synthetic payloads are written to a temporary response cache and replayed
+in offline mode, so no network or database is needed. Both paths must
+produce identical rows.
+
+Usage:
+    python benchmarks/bench_stream_json.py
+    python benchmarks/bench_stream_json.py --hadiths 30000
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import http_client  # noqa: E402
+import import_hadith  # noqa: E402
+import import_quran  # noqa: E402
+from bulk_load import STREAM_BATCH_ROWS, chunked  # noqa: E402
+
+COLLECTION = {'identifier': 'bench', 'slug': 'bench'}
+NARRATION = 'حَدَّثَنَا الْحُمَيْدِيُّ عَبْدُ اللَّهِ بْنُ الزُّبَيْرِ قَالَ حَدَّثَنَا سُفْيَانُ '
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def hadith_edition(count: int, language: str) -> bytes:
+    text = NARRATION if language == 'ara' else 'Narrated Abu Huraira: The Prophet (ﷺ) said ... '
+    hadiths = [{
+        'hadithnumber': i + 1,
+        'arabicnumber': i + 1,
+        'text': f"{text * 12} {i}",
+        'grades': [{'name': 'Al-Albani', 'grade': 'Sahih'}],
+        'reference': {'book': i // 100 + 1, 'hadith': i % 100 + 1},
+    } for i in range(count)]
+    sections = {str(n): f"Book {n}" for n in range(1, count // 100 + 2)}
+    return json.dumps({'metadata': {'name': 'Bench', 'sections': sections}, 'hadiths': hadiths},
+                      ensure_ascii=False).encode('utf-8')
+
+def quran_edition() -> bytes:
+    surahs = []
+    for surah_number in range(1, 115):
+        ayahs = [{
+            'number': surah_number * 1000 + n,
+            'text': f"{NARRATION * 3} {surah_number}:{n}",
+            'numberInSurah': n,
+            'juz': 1, 'manzil': 1, 'page': 1, 'ruku': 1, 'hizbQuarter': 1, 'sajda': False,
+        } for n in range(1, 55 + (surah_number % 3))]
+        surahs.append({'number': surah_number, 'name': 'سورة', 'ayahs': ayahs})
+    return json.dumps({'code': 200, 'status': 'OK', 'data': {'surahs': surahs}},
+                      ensure_ascii=False).encode('utf-8')
+
+# ============================================================================
+# PATHS UNDER TEST
+# ============================================================================
+
+def consume(rows) -> str:
+    """Hand rows on in insert-sized batches, returning a digest of everything seen."""
+    digest = hashlib.md5()
+    for batch in chunked(rows, STREAM_BATCH_ROWS):
+        for row in batch:
+            digest.update(repr(row).encode('utf-8'))
+    return digest.hexdigest()
+
+def hadith_loaded():
+    payload = import_hadith.fetch_collection(COLLECTION)
+    prepared = import_hadith.prepare_collection(payload, 1)
+    del payload
+    return consume(prepared['hadiths'])
+
+def hadith_streaming():
+    prepared = import_hadith.stream_collection(COLLECTION, 1)
+    return consume(prepared['hadiths'])
+
+QURAN_IDS = import_quran.QuranIds([54 + n % 3 for n in range(1, 115)])
+
+def quran_loaded():
+    quran_data = import_quran.fetch_api(f"{import_quran.API_BASE}/quran/quran-uthmani")
+    surah_ayahs = ((s['number'], a) for s in quran_data['surahs'] for a in s['ayahs'])
+    rows = list(import_quran.iter_ayah_rows(surah_ayahs, QURAN_IDS))
+    del quran_data
+    return consume(rows)
+
+def quran_streaming():
+    url = f"{import_quran.API_BASE}/quran/quran-uthmani"
+    return consume(import_quran.iter_ayah_rows(import_quran.stream_surah_ayahs(url), QURAN_IDS))
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, elapsed
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loaded vs streaming payload parsing")
+    parser.add_argument('--hadiths', type=int, default=7500, help="Hadiths in the synthetic collection")
+    args = parser.parse_args()
+
+    cache_dir = tempfile.TemporaryDirectory()
+    http_client.configure_cache(cache_dir.name)
+    cache = http_client.get_cache()
+    for language in ('ara', 'eng'):
+        body = hadith_edition(args.hadiths, language)
+        cache.store(f"{import_hadith.CDN_BASE}/{language}-bench.json", body, {})
+        print(f"  {language}-bench.json: {len(body) / 1e6:.1f} MB")
+    body = quran_edition()
+    cache.store(f"{import_quran.API_BASE}/quran/quran-uthmani", body, {})
+    print(f"  quran-uthmani: {len(body) / 1e6:.1f} MB")
+    del body
+    http_client.configure_cache(cache_dir.name, offline=True)
+
+    cases = [
+        ('hadith', hadith_loaded, hadith_streaming),
+        ('quran', quran_loaded, quran_streaming),
+    ]
+    results = []
+    for name, loaded, streaming in cases:
+        loaded_digest, loaded_peak, loaded_time = measure(loaded)
+        stream_digest, stream_peak, stream_time = measure(streaming)
+        results.append((name, loaded_peak, loaded_time, stream_peak, stream_time, loaded_digest == stream_digest))
+
+    print("\n" + "="*70)
+    print(f"STREAMING PARSE BENCHMARK ({args.hadiths:,} hadiths, batches of {STREAM_BATCH_ROWS:,})")
+    print("="*70)
+    print(f"  {'payload':<8} {'loaded peak':>12} {'time':>7} {'stream peak':>12} {'time':>7} {'peak ratio':>10}")
+    for name, loaded_peak, loaded_time, stream_peak, stream_time, same in results:
+        print(f"  {name:<8} {loaded_peak / 1e6:>10.1f}MB {loaded_time:>6.2f}s "
+              f"{stream_peak / 1e6:>10.1f}MB {stream_time:>6.2f}s {loaded_peak / stream_peak:>9.1f}x  "
+              f"{'✅ identical rows' if same else '❌ ROWS DIFFER'}")
+    print("="*70 + "\n")
+    cache_dir.cleanup()
+
+if __name__ == "__main__":
+    main()
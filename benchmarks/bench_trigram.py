@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Trigram Spelling Index
+==================================
+
+Builds trigram_index.TrigramIndex over synthetic vocabularies of growing size
+(standing in for more editions being indexed) and times suggestions for
+misspelled words (1-2 random edits of a vocabulary term):
+
+- trigram:  candidate generation from shared trigrams + bounded verification
+- scan:     bounded edit distance against every term in the vocabulary
+
+Every suggestion list must equal the full scan's, so the run doubles as a
+check that the trigram count and length filters never drop a true match.
+
+Usage:
+    python benchmarks/bench_trigram.py
+    python benchmarks/bench_trigram.py --sizes 10000 100000 400000 --queries 200
+"""
+
+import argparse
+import random
+import statistics
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from trigram_index import TrigramIndex, max_edits  # noqa: E402
+
+LETTERS = string.ascii_lowercase
+
+def synthetic_vocabulary(rng: random.Random, size: int) -> list:
+    terms = set()
+    while len(terms) < size:
+        terms.add(''.join(rng.choices(LETTERS, k=max(2, int(rng.gauss(7, 2.5))))))
+    return sorted(terms)
+
+def misspell(rng: random.Random, word: str) -> str:
+    for _ in range(rng.randint(1, max(1, max_edits(word)))):
+        i = rng.randrange(len(word))
+        operation = rng.choice('isdt')
+        if operation == 'i':
+            word = word[:i] + rng.choice(LETTERS) + word[i:]
+        elif operation == 's':
+            word = word[:i] + rng.choice(LETTERS) + word[i + 1:]
+        elif operation == 'd' and len(word) > 2:
+            word = word[:i] + word[i + 1:]
+        elif operation == 't' and i + 1 < len(word):
+            word = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark trigram spelling suggestions")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 50000, 200000], help="Vocabulary sizes")
+    parser.add_argument('--queries', type=int, default=100, help="Misspelled queries per size")
+    parser.add_argument('--scan-queries', type=int, default=20, help="Queries also answered by a full scan")
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("TRIGRAM SPELLING BENCHMARK")
+    print("="*70)
+    print(f"  {'terms':>9} {'build':>9} {'arrays':>9} {'trigram p50':>12} {'p99':>9} {'scan p50':>10}")
+
+    consistent = True
+    for size in args.sizes:
+        rng = random.Random(size)
+        terms = synthetic_vocabulary(rng, size)
+        frequencies = [rng.randint(1, 1000) for _ in terms]
+        start = time.perf_counter()
+        index = TrigramIndex(terms, frequencies)
+        build_s = time.perf_counter() - start
+
+        queries = [misspell(rng, rng.choice(terms)) for _ in range(args.queries)]
+        times = []
+        for query in queries:
+            start = time.perf_counter()
+            index.suggest(query)
+            times.append((time.perf_counter() - start) * 1000)
+
+        scan_times = []
+        for query in queries[:args.scan_queries]:
+            start = time.perf_counter()
+            expected = index.brute_force(query, max_edits(query))
+            scan_times.append((time.perf_counter() - start) * 1000)
+            consistent &= index.suggest(query) == expected
+
+        times.sort()
+        print(f"  {size:>9,} {build_s:>8.2f}s {index.nbytes / 1e6:>7.1f}MB {statistics.median(times):>10.2f}ms "
+              f"{times[int(len(times) * 0.99) - 1]:>7.2f}ms {statistics.median(scan_times):>8.1f}ms")
+
+    print(f"\n  {'✅ trigram suggestions match the full scan' if consistent else '❌ SUGGESTIONS DIFFER FROM SCAN'}")
+    print("="*70 + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Bulk Load Helpers
+==============================================
+
+Row-loading engines shared by the importers.
+
+Engines:
+- executemany: 500-row INSERT IGNORE batches (works everywhere)
+- load-data:   streams rows into a temporary TSV file and issues
+               LOAD DATA LOCAL INFILE, MySQL's native bulk loader. Falls back
+               to executemany when the server or client disallows local infile.
+
+The load-data engine needs the connection opened with
+allow_local_infile=True and the server started with local_infile=ON.
+
+Deferred indexes:
+    FULLTEXT and non-unique secondary indexes can be dropped before a bulk
+    load and rebuilt once at the end (deferred_indexes); unique keys and
+    indexes a foreign key needs stay. Every dropped index is first recorded
+    in the import_index_state table, so a crashed run is healed by the next
+    one (restore_deferred_indexes).
+
+Requirements:
+    pip install mysql-connector-python
+"""
+
+import itertools
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import mysql.connector
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+BATCH_SIZE = 500  # Number of records to insert at once (executemany engine)
+LOAD_DATA_CHUNK_ROWS = 50000  # Rows per LOAD DATA statement
+STREAM_BATCH_ROWS = 2000  # Rows pulled from an iterator per insert_stream batch
+
+ENGINES = ('executemany', 'load-data')
+DEFAULT_ENGINE = 'executemany'
+
+# Error numbers meaning "LOAD DATA LOCAL is not allowed here"
+LOCAL_INFILE_DISABLED_ERRORS = {
+    1148,  # ER_NOT_ALLOWED_COMMAND
+    2068,  # CR_LOAD_DATA_LOCAL_INFILE_REJECTED
+    3948,  # ER_CLIENT_LOCAL_FILES_DISABLED
+}
+
+_engine = DEFAULT_ENGINE
+
+# MySQL's default LOAD DATA escaping (FIELDS ESCAPED BY '\\')
+_TSV_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\0': '\\0',
+})
+
+def set_engine(engine: str):
+    """Select the engine used by batch_insert for the rest of the process."""
+    global _engine
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown bulk-load engine '{engine}' (expected one of {ENGINES})")
+    _engine = engine
+
+def get_engine() -> str:
+    return _engine
+
+def add_engine_argument(parser):
+    """Add the shared --engine option to an argparse parser."""
+    parser.add_argument('--engine', choices=ENGINES, default=DEFAULT_ENGINE,
+                        help="Row-loading engine (load-data needs local_infile enabled on the server)")
+
+# ============================================================================
+# EXECUTEMANY ENGINE
+# ============================================================================
+
+def insert_executemany(cursor, table: str, columns: List[str], data: List[tuple],
+                       ignore_duplicates: bool = True,
+                       on_batch: Optional[Callable[[int], None]] = None) -> int:
+    """Insert rows with executemany in BATCH_SIZE chunks."""
+    if not data:
+        return 0
+
+    placeholders = ', '.join(['%s'] * len(columns))
+    columns_str = ', '.join(columns)
+    ignore_clause = 'IGNORE' if ignore_duplicates else ''
+    sql = f"INSERT {ignore_clause} INTO {table} ({columns_str}) VALUES ({placeholders})"
+
+    inserted = 0
+    for i in range(0, len(data), BATCH_SIZE):
+        batch = data[i:i + BATCH_SIZE]
+        cursor.executemany(sql, batch)
+        inserted += cursor.rowcount
+        print(f"    📝 Inserted {min(i + BATCH_SIZE, len(data))}/{len(data)} records")
+        if on_batch:
+            on_batch(min(i + BATCH_SIZE, len(data)))
+
+    return inserted
+
+# ============================================================================
+# LOAD DATA ENGINE
+# ============================================================================
+
+def tsv_field(value: Any) -> str:
+    """Encode one value for LOAD DATA's default TSV format (NULL -> \\N)."""
+    if value is None:
+        return '\\N'
+    return str(value).translate(_TSV_ESCAPES)
+
+def write_tsv(f, rows: Iterable[tuple]) -> int:
+    """Write rows to an open text file as escaped TSV; returns the row count."""
+    count = 0
+    for row in rows:
+        f.write('\t'.join([tsv_field(value) for value in row]))
+        f.write('\n')
+        count += 1
+    return count
+
+def insert_load_data(cursor, table: str, columns: List[str], data: List[tuple],
+                     ignore_duplicates: bool = True,
+                     on_batch: Optional[Callable[[int], None]] = None) -> int:
+    """Insert rows via a temporary TSV file and LOAD DATA LOCAL INFILE."""
+    if not data:
+        return 0
+
+    columns_str = ', '.join(columns)
+    ignore_clause = 'IGNORE' if ignore_duplicates else ''
+    sql = (
+        f"LOAD DATA LOCAL INFILE %s {ignore_clause} INTO TABLE {table} "
+        "CHARACTER SET utf8mb4 "
+        "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+        "LINES TERMINATED BY '\\n' "
+        f"({columns_str})"
+    )
+
+    inserted = 0
+    for i in range(0, len(data), LOAD_DATA_CHUNK_ROWS):
+        fd, path = tempfile.mkstemp(prefix=f"{table}_", suffix='.tsv')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                write_tsv(f, data[i:i + LOAD_DATA_CHUNK_ROWS])
+            cursor.execute(sql, (path,))
+            inserted += cursor.rowcount
+        finally:
+            os.unlink(path)
+        print(f"    📝 Loaded {min(i + LOAD_DATA_CHUNK_ROWS, len(data))}/{len(data)} records")
+        if on_batch:
+            on_batch(min(i + LOAD_DATA_CHUNK_ROWS, len(data)))
+
+    return inserted
+
+# ============================================================================
+# UPSERT
+# ============================================================================
+
+def batch_upsert(cursor, table: str, columns: List[str], data: List[tuple],
+                 update_columns: List[str]) -> int:
+    """INSERT ... ON DUPLICATE KEY UPDATE in BATCH_SIZE chunks (used by delta imports)."""
+    if not data:
+        return 0
+
+    placeholders = ', '.join(['%s'] * len(columns))
+    columns_str = ', '.join(columns)
+    updates = ', '.join(f"{column} = VALUES({column})" for column in update_columns)
+    sql = (f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders}) "
+           f"ON DUPLICATE KEY UPDATE {updates}")
+
+    affected = 0
+    for i in range(0, len(data), BATCH_SIZE):
+        cursor.executemany(sql, data[i:i + BATCH_SIZE])
+        affected += cursor.rowcount
+        print(f"    📝 Upserted {min(i + BATCH_SIZE, len(data))}/{len(data)} records")
+
+    return affected
+
+# ============================================================================
+# DISPATCH
+# ============================================================================
+
+def batch_insert(cursor, table: str, columns: List[str], data: List[tuple],
+                 ignore_duplicates: bool = True, engine: Optional[str] = None,
+                 on_batch: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Perform batch insert with the configured engine and proper error handling.
+
+    `on_batch(rows_done)` runs after every executed batch/chunk, e.g. to
+    checkpoint and commit (see import_journal).
+    """
+    engine = engine or _engine
+    if engine == 'load-data':
+        try:
+            return insert_load_data(cursor, table, columns, data, ignore_duplicates, on_batch)
+        except mysql.connector.Error as err:
+            if err.errno not in LOCAL_INFILE_DISABLED_ERRORS:
+                raise
+            print(f"    ⚠ LOAD DATA LOCAL INFILE not allowed ({err}); falling back to executemany")
+            set_engine('executemany')
+
+    return insert_executemany(cursor, table, columns, data, ignore_duplicates, on_batch)
+
+def chunked(rows: Iterable[tuple], size: int) -> Iterator[List[tuple]]:
+    """Yield lists of up to `size` rows from any iterable."""
+    iterator = iter(rows)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def insert_stream(cursor, table: str, columns: List[str], rows: Iterable[tuple],
+                  skip: int = 0, batch_rows: int = STREAM_BATCH_ROWS,
+                  ignore_duplicates: bool = True,
+                  on_batch: Optional[Callable[[int], None]] = None) -> Tuple[int, int]:
+    """
+    batch_insert for rows produced lazily (e.g. parsed from a streamed
+    payload): at most `batch_rows` rows are held at once.
+
+    The first `skip` rows are consumed without inserting (resuming after
+    already committed rows). `on_batch(rows_done)` counts inserted-or-attempted
+    rows across all batches. Returns (rows inserted, rows consumed incl. skipped).
+    A list is already in memory and goes to batch_insert in one call.
+    """
+    if isinstance(rows, list):
+        inserted = batch_insert(cursor, table, columns, rows[skip:], ignore_duplicates, on_batch=on_batch)
+        return inserted, len(rows)
+
+    iterator = iter(rows)
+    consumed = sum(1 for _ in itertools.islice(iterator, skip))
+    inserted = done = 0
+
+    for batch in chunked(iterator, batch_rows):
+        consumed += len(batch)
+        batch_on_batch = None
+        if on_batch:
+            batch_on_batch = lambda rows_done, base=done: on_batch(base + rows_done)
+        inserted += batch_insert(cursor, table, columns, batch, ignore_duplicates, on_batch=batch_on_batch)
+        done += len(batch)
+
+    return inserted, consumed
+
+# ============================================================================
+# DEFERRED INDEXES
+# ============================================================================
+
+INDEX_STATE_TABLE = 'import_index_state'
+
+class IndexTimings:
+    """Seconds spent dropping and rebuilding deferred indexes."""
+
+    def __init__(self):
+        self.drop_seconds = 0.0
+        self.build_seconds = 0.0
+        self.rebuilt = 0
+
+def table_exists(cursor, table: str) -> bool:
+    cursor.execute("""
+        SELECT COUNT(*) FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    """, (table,))
+    return cursor.fetchone()[0] > 0
+
+def ensure_index_state_table(cursor):
+    """
+    Create the index bookkeeping table (see schema.sql) if it is missing, or
+    add the index_type column to one created before migration 007.
+    """
+    if table_exists(cursor, INDEX_STATE_TABLE):
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = 'index_type'
+        """, (INDEX_STATE_TABLE,))
+        if cursor.fetchone()[0] == 0:
+            cursor.execute(f"ALTER TABLE {INDEX_STATE_TABLE} "
+                           "ADD COLUMN index_type VARCHAR(16) NOT NULL DEFAULT 'FULLTEXT' AFTER index_name")
+        return
+    cursor.execute(f"""
+        CREATE TABLE {INDEX_STATE_TABLE} (
+          table_name VARCHAR(64) NOT NULL,
+          index_name VARCHAR(64) NOT NULL,
+          index_type VARCHAR(16) NOT NULL DEFAULT 'FULLTEXT',
+          column_list VARCHAR(512) NOT NULL,
+          dropped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+          PRIMARY KEY (table_name, index_name)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+
+def secondary_indexes(cursor, table: str) -> Dict[str, Tuple[str, List[str]]]:
+    """
+    Return {index_name: (index_type, [columns])} for the indexes on `table`
+    that can be deferred: FULLTEXT indexes and non-unique BTREE indexes.
+
+    PRIMARY and UNIQUE keys are never returned (INSERT IGNORE and the
+    upserts depend on them), nor is an index a foreign key needs: one whose
+    leading columns are the foreign key's and that no unique key also
+    starts with. Prefix lengths are kept, e.g. 'title(191)'.
+    """
+    cursor.execute("""
+        SELECT INDEX_NAME, INDEX_TYPE, NON_UNIQUE, COLUMN_NAME, SUB_PART
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        ORDER BY INDEX_NAME, SEQ_IN_INDEX
+    """, (table,))
+    indexes: Dict[str, Tuple[str, List[str]]] = {}
+    unique: Dict[str, List[str]] = {}
+    for index_name, index_type, non_unique, column_name, sub_part in cursor.fetchall():
+        if not non_unique:
+            unique.setdefault(index_name, []).append(column_name)
+            continue
+        column = f"{column_name}({sub_part})" if sub_part else column_name
+        indexes.setdefault(index_name, (index_type, []))[1].append(column)
+
+    cursor.execute("""
+        SELECT CONSTRAINT_NAME, COLUMN_NAME
+        FROM information_schema.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND REFERENCED_TABLE_NAME IS NOT NULL
+        ORDER BY CONSTRAINT_NAME, ORDINAL_POSITION
+    """, (table,))
+    foreign_keys: Dict[str, List[str]] = {}
+    for constraint_name, column_name in cursor.fetchall():
+        foreign_keys.setdefault(constraint_name, []).append(column_name)
+    uncovered = [columns for columns in foreign_keys.values()
+                 if not any(key[:len(columns)] == columns for key in unique.values())]
+
+    return {name: (index_type, columns) for name, (index_type, columns) in indexes.items()
+            if index_type in ('FULLTEXT', 'BTREE')
+            and not any(columns[:len(fk)] == fk for fk in uncovered)}
+
+def drop_deferred_indexes(cursor, connection, tables: List[str]) -> int:
+    """Record, then drop, every deferrable secondary index on `tables`."""
+    ensure_index_state_table(cursor)
+    dropped = 0
+
+    for table in tables:
+        indexes = secondary_indexes(cursor, table)
+        if not indexes:
+            continue
+
+        # Record before dropping so a crash can never lose a definition
+        cursor.executemany(f"""
+            INSERT INTO {INDEX_STATE_TABLE} (table_name, index_name, index_type, column_list)
+            VALUES (%s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE index_type = VALUES(index_type), column_list = VALUES(column_list)
+        """, [(table, name, index_type, ','.join(columns)) for name, (index_type, columns) in indexes.items()])
+        connection.commit()
+
+        drops = ', '.join(f"DROP INDEX {name}" for name in indexes)
+        cursor.execute(f"ALTER TABLE {table} {drops}")
+        dropped += len(indexes)
+        print(f"   🗑  Dropped {len(indexes)} secondary index(es) on {table}: {', '.join(indexes)}")
+
+    return dropped
+
+def restore_deferred_indexes(cursor, connection, tables: List[str]) -> int:
+    """
+    Rebuild the indexes recorded in import_index_state for `tables`.
+
+    Only the caller's own tables are touched, so an importer never rebuilds
+    (and blocks on) indexes another importer is deferring concurrently.
+
+    The BTREE indexes of a table are added together in one ALTER (one
+    sorted build per index, a single table pass); InnoDB builds one FULLTEXT
+    index per ALTER statement, so those get one each.
+    """
+    if not tables or not table_exists(cursor, INDEX_STATE_TABLE):
+        return 0
+    ensure_index_state_table(cursor)
+
+    placeholders = ', '.join(['%s'] * len(tables))
+    cursor.execute(f"SELECT table_name, index_name, index_type, column_list FROM {INDEX_STATE_TABLE} "
+                   f"WHERE table_name IN ({placeholders}) "
+                   "ORDER BY table_name, index_type, index_name", tuple(tables))
+    pending: Dict[str, List[Tuple[str, str, str]]] = {}
+    for table, index_name, index_type, column_list in cursor.fetchall():
+        pending.setdefault(table, []).append((index_name, index_type, column_list))
+    rebuilt = 0
+
+    for table, indexes in pending.items():
+        cursor.execute("""
+            SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """, (table,))
+        existing = {row[0] for row in cursor.fetchall()}
+        missing = [index for index in indexes if index[0] not in existing]
+
+        statements = []
+        btree = [f"ADD INDEX {name} ({columns})" for name, index_type, columns in missing if index_type == 'BTREE']
+        if btree:
+            statements.append((f"{len(btree)} index(es)", ', '.join(btree)))
+        statements += [(f"FULLTEXT {name} ({columns})", f"ADD FULLTEXT INDEX {name} ({columns})")
+                       for name, index_type, columns in missing if index_type == 'FULLTEXT']
+
+        for label, clause in statements:
+            print(f"   🔨 Building {label} on {table}...")
+            start = time.perf_counter()
+            cursor.execute(f"ALTER TABLE {table} {clause}")
+            print(f"      ✅ {time.perf_counter() - start:.2f} seconds")
+        rebuilt += len(missing)
+
+        cursor.execute(f"DELETE FROM {INDEX_STATE_TABLE} WHERE table_name = %s", (table,))
+        connection.commit()
+
+    return rebuilt
+
+@contextmanager
+def deferred_indexes(cursor, connection, tables: List[str], enabled: bool = True):
+    """
+    Drop the secondary indexes on `tables` (FULLTEXT and non-unique BTREE,
+    see secondary_indexes) for the duration of a bulk load.
+
+    Indexes on `tables` left behind by a crashed run are restored first when
+    deferral is disabled, or simply kept dropped (and rebuilt at the end)
+    when it is enabled; indexes recorded for other tables are left to the
+    importer that owns them. If the load raises, the indexes stay dropped
+    and recorded until the next run. Yields an IndexTimings with drop/build
+    durations.
+    """
+    timings = IndexTimings()
+
+    if not enabled:
+        start = time.perf_counter()
+        timings.rebuilt = restore_deferred_indexes(cursor, connection, tables)
+        timings.build_seconds = time.perf_counter() - start
+        yield timings
+        return
+
+    print("\n🗂  Deferring secondary indexes until the load completes...")
+    start = time.perf_counter()
+    drop_deferred_indexes(cursor, connection, tables)
+    timings.drop_seconds = time.perf_counter() - start
+
+    yield timings
+
+    print("\n🗂  Rebuilding deferred indexes...")
+    start = time.perf_counter()
+    timings.rebuilt = restore_deferred_indexes(cursor, connection, tables)
+    timings.build_seconds = time.perf_counter() - start
+
+def add_defer_indexes_argument(parser):
+    """Add the shared --defer-indexes option to an argparse parser."""
+    parser.add_argument('--defer-indexes', action='store_true',
+                        help="Drop FULLTEXT and non-unique secondary indexes during the load "
+                             "and rebuild them once at the end")
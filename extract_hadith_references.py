@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Hadith → Ayah Reference Extractor
+==============================================================
+
+Scans every hadith and fills hadith_ayah_references with the Quran verses
+it cites or quotes.
+
+Detectors:
+- citation:  explicit verse numbers in the English text, e.g. "(2:255)",
+             "(V.2:255)", "(Surat Al-Baqara 2.255-257)"
+- surah:     a surah named without a verse ("Surat al-Baqara", "سورة البقرة");
+             linked to the surah's first ayah
+- quotation: verbatim Arabic ayah text inside text_arabic, found with an
+             index of 5-word shingles over the normalized ayahs.text_clean
+             corpus (no hadith × ayah nested loop)
+
+Each (hadith, ayah) pair is stored once, with the strongest match type
+(citation > quotation > surah). Hadiths are read in id-ordered chunks and
+the references bulk-inserted per chunk, so the full run is a few minutes.
+
+Usage:
+    python extract_hadith_references.py
+    python extract_hadith_references.py --rebuild          # replace existing references
+    python extract_hadith_references.py --types citation quotation
+
+Requirements:
+    pip install mysql-connector-python
+"""
+
+import argparse
+import mysql.connector
+import re
+import sys
+import time
+from collections import Counter
+from typing import List, Dict, Iterator, Optional, Tuple
+
+import bulk_load
+from arabic_normalizer import normalize
+from bulk_load import batch_insert
+from import_hadith import DB_CONFIG
+
+# ============================================================================
+# EXTRACTION CONFIGURATION
+# ============================================================================
+
+MATCH_TYPES = ('citation', 'quotation', 'surah')  # strongest first
+
+SHINGLE_WORDS = 5        # words per quotation shingle
+MIN_SHARED_SHINGLES = 2  # at consecutive positions, i.e. 6 consecutive words (or a whole 5-word ayah)
+MAX_SHINGLE_AYAHS = 8    # shingles shared by more ayahs are formulaic; ignored
+MAX_CITATION_RANGE = 30  # longest "2:255-285" style range expanded
+HADITH_CHUNK_SIZE = 2000
+
+NON_ARABIC_LETTERS = re.compile(r'[^ء-ي\s]+')
+
+PARENTHESIZED = re.compile(r'[(\[]([^()\[\]]{1,80})[)\]]')
+VERSE_NUMBER = re.compile(r'(\d{1,3})\s*[.:]\s*(\d{1,3})(?:\s*[-–]\s*(\d{1,3}))?')
+SURAH_WORD = re.compile(r"\bs[uū]r(?:a|ah|at|ate)\b[\s\-]*", re.IGNORECASE)
+NAME_WORDS = re.compile(r"[A-Za-z'’`\-]+")
+FOLLOWING_VERSE = re.compile(r"^[\s,:]*(?:verse|ayah|ayat|aya|v\.)?\s*(\d{1,3})\b", re.IGNORECASE)
+ARTICLE = re.compile(r"^(?:al|an|ar|as|at|ad|adh|az|ash|ath)[\-\s]+")
+
+# ============================================================================
+# NORMALIZATION
+# ============================================================================
+
+def normalize_arabic(text: str) -> str:
+    """Fold Uthmani/imla'i spelling differences and strip non-letters."""
+    text = normalize(text or '', 'search')   # marks dropped, letter variants folded
+    return ' '.join(NON_ARABIC_LETTERS.sub(' ', text).split())
+
+def name_key(name: str) -> str:
+    """Spelling-insensitive key for transliterated surah names (Al-Baqarah → baqara)."""
+    key = ARTICLE.sub('', name.lower().replace('’', "'").replace('`', "'"))
+    key = re.sub(r'[^a-z]', '', key)
+    key = re.sub(r'ee|ii', 'i', key)
+    key = re.sub(r'oo|uu', 'u', key)
+    key = re.sub(r'(.)\1+', r'\1', key)
+    return key[:-1] if key.endswith('h') and len(key) > 3 else key
+
+# ============================================================================
+# EXTRACTOR
+# ============================================================================
+
+class ReferenceExtractor:
+    """Indexes the Quran once, then finds references in any number of hadiths."""
+
+    def __init__(self, surahs: List[Tuple[int, str, str, int]],
+                 ayahs: List[Tuple[int, int, int, str]],
+                 types: Tuple[str, ...] = MATCH_TYPES):
+        """
+        surahs: (surah_number, name_english, name_arabic, ayah_count)
+        ayahs:  (ayah_id, surah_number, ayah_number, text_clean)
+        """
+        self.types = types
+        self.ayah_ids: Dict[Tuple[int, int], int] = {}
+        self.ayah_counts = {number: count for number, _, _, count in surahs}
+
+        self.english_names: Dict[str, int] = {}
+        self.arabic_names: Dict[str, int] = {}
+        for number, name_english, name_arabic, _ in surahs:
+            self.english_names[name_key(name_english)] = number
+            arabic = normalize_arabic(name_arabic).split()
+            if arabic and arabic[0] == 'سوره':
+                arabic = arabic[1:]
+            if arabic:
+                self.arabic_names[' '.join(arabic)] = number
+
+        # Shingle index: 5-word tuple -> ayah ids; ayah id -> shingles it has
+        postings: Dict[Tuple[str, ...], List[int]] = {}
+        self.shingle_counts: Dict[int, int] = {}
+        for ayah_id, surah_number, ayah_number, text_clean in ayahs:
+            self.ayah_ids[(surah_number, ayah_number)] = ayah_id
+            words = normalize_arabic(text_clean).split()
+            shingles = {tuple(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+            self.shingle_counts[ayah_id] = len(shingles)
+            for shingle in shingles:
+                postings.setdefault(shingle, []).append(ayah_id)
+        self.shingles = {s: ids for s, ids in postings.items() if len(ids) <= MAX_SHINGLE_AYAHS}
+
+    # ------------------------------------------------------------------------
+    # Detectors
+    # ------------------------------------------------------------------------
+
+    def _verse(self, surah: int, ayah: int) -> Optional[int]:
+        if 1 <= surah <= 114 and 1 <= ayah <= self.ayah_counts.get(surah, 0):
+            return self.ayah_ids.get((surah, ayah))
+        return None
+
+    def _verse_range(self, surah: int, first: int, last: Optional[int]) -> Iterator[int]:
+        last = first if last is None or last < first or last - first > MAX_CITATION_RANGE else last
+        for ayah in range(first, last + 1):
+            ayah_id = self._verse(surah, ayah)
+            if ayah_id:
+                yield ayah_id
+
+    def citations(self, text: str) -> Iterator[int]:
+        """Ayah ids cited as surah:verse numbers inside (...) or [...]."""
+        for group in PARENTHESIZED.finditer(text or ''):
+            for match in VERSE_NUMBER.finditer(group.group(1)):
+                yield from self._verse_range(int(match.group(1)), int(match.group(2)),
+                                             int(match.group(3)) if match.group(3) else None)
+
+    def surah_mentions(self, text_english: str, normalized_arabic: List[str]) -> Iterator[Tuple[int, bool]]:
+        """(ayah id, verse given) for surahs named in either text."""
+        for match in SURAH_WORD.finditer(text_english or ''):
+            words = list(NAME_WORDS.finditer(text_english, match.end(), match.end() + 60))[:3]
+            for size in range(len(words), 0, -1):
+                surah = self.english_names.get(name_key(' '.join(w.group() for w in words[:size])))
+                if surah:
+                    # "Surat al-Baqara, verse 255" / "Surat al-Baqara: 255"
+                    verse = FOLLOWING_VERSE.match(text_english[words[size - 1].end():])
+                    ayah_id = self._verse(surah, int(verse.group(1))) if verse else None
+                    if ayah_id:
+                        yield ayah_id, True
+                    else:
+                        yield self.ayah_ids.get((surah, 1)), False
+                    break
+
+        for i, word in enumerate(normalized_arabic):
+            if word.endswith('سوره') and len(word) <= 6:
+                for size in (2, 1):
+                    surah = self.arabic_names.get(' '.join(normalized_arabic[i + 1:i + 1 + size]))
+                    if surah:
+                        yield self.ayah_ids.get((surah, 1)), False
+                        break
+
+    def quotations(self, words: List[str]) -> Iterator[int]:
+        """
+        Ayah ids whose text appears verbatim (≥ 6 consecutive words) in `words`.
+
+        An ayah matches when it shares the shingles starting at two adjacent
+        word offsets of the hadith; an ayah with a single shingle (5 words)
+        matches on that shingle alone.
+        """
+        found = set()
+        previous: set = set()
+        for i in range(len(words) - SHINGLE_WORDS + 1):
+            current = set(self.shingles.get(tuple(words[i:i + SHINGLE_WORDS]), ()))
+            for ayah_id in current - found:
+                if ayah_id in previous or self.shingle_counts[ayah_id] < MIN_SHARED_SHINGLES:
+                    found.add(ayah_id)
+                    yield ayah_id
+            previous = current
+
+    def extract(self, text_arabic: str, text_english: str) -> Dict[int, str]:
+        """{ayah_id: strongest match type} for one hadith."""
+        found: Dict[int, str] = {}
+
+        def add(ayah_id: Optional[int], match_type: str):
+            if ayah_id and (ayah_id not in found or
+                            MATCH_TYPES.index(match_type) < MATCH_TYPES.index(found[ayah_id])):
+                found[ayah_id] = match_type
+
+        words = normalize_arabic(text_arabic).split()
+        if 'citation' in self.types:
+            for ayah_id in self.citations(text_english):
+                add(ayah_id, 'citation')
+        if 'quotation' in self.types:
+            for ayah_id in self.quotations(words):
+                add(ayah_id, 'quotation')
+        if 'surah' in self.types or 'citation' in self.types:
+            for ayah_id, verse_given in self.surah_mentions(text_english, words):
+                if verse_given and 'citation' in self.types:
+                    add(ayah_id, 'citation')
+                elif not verse_given and 'surah' in self.types:
+                    add(ayah_id, 'surah')
+        return found
+
+# ============================================================================
+# DATABASE
+# ============================================================================
+
+def load_quran(cursor) -> Tuple[List[tuple], List[tuple]]:
+    cursor.execute("SELECT surah_number, name_english, name_arabic, ayah_count FROM surahs")
+    surahs = cursor.fetchall()
+    cursor.execute("""
+        SELECT a.id, s.surah_number, a.ayah_number, a.text_clean
+        FROM ayahs a
+        JOIN surahs s ON s.id = a.surah_id
+    """)
+    return surahs, cursor.fetchall()
+
+def iter_hadith_chunks(cursor, chunk_size: int = HADITH_CHUNK_SIZE) -> Iterator[List[tuple]]:
+    """(id, text_arabic, text_english) rows in id order, `chunk_size` at a time."""
+    last_id = 0
+    while True:
+        cursor.execute("""
+            SELECT id, text_arabic, text_english FROM hadiths
+            WHERE id > %s ORDER BY id LIMIT %s
+        """, (last_id, chunk_size))
+        rows = cursor.fetchall()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Extract hadith → ayah references")
+    parser.add_argument('--types', nargs='+', choices=MATCH_TYPES, default=list(MATCH_TYPES),
+                        help="Detectors to run (default: all)")
+    parser.add_argument('--rebuild', action='store_true',
+                        help="Delete existing references before extracting")
+    parser.add_argument('--chunk-size', type=int, default=HADITH_CHUNK_SIZE,
+                        help="Hadiths read and written per transaction")
+    bulk_load.add_engine_argument(parser)
+    return parser.parse_args()
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+    bulk_load.set_engine(args.engine)
+
+    print("\n" + "="*70)
+    print("ISLAMIC KNOWLEDGE DATABASE - HADITH → AYAH REFERENCE EXTRACTOR")
+    print("="*70)
+
+    # Connect to database
+    print("\n🔌 Connecting to MySQL database...")
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG, allow_local_infile=(args.engine == 'load-data'))
+        cursor = connection.cursor(buffered=True)
+        print("   ✅ Connected successfully\n")
+    except mysql.connector.Error as err:
+        print(f"   ❌ Error: {err}")
+        sys.exit(1)
+
+    try:
+        start_time = time.time()
+
+        print("📖 Indexing the Quran...")
+        surahs, ayahs = load_quran(cursor)
+        extractor = ReferenceExtractor(surahs, ayahs, tuple(args.types))
+        print(f"   ✅ {len(ayahs):,} ayahs, {len(extractor.shingles):,} distinctive {SHINGLE_WORDS}-word shingles")
+
+        if args.rebuild:
+            cursor.execute("DELETE FROM hadith_ayah_references")
+            connection.commit()
+            print("   🗑  Cleared existing references")
+
+        print("\n🔎 Scanning hadiths...")
+        scanned = 0
+        referencing = 0
+        counts: Counter = Counter()
+        scan_seconds = 0.0
+        columns = ['hadith_id', 'ayah_id', 'match_type']
+
+        for chunk in iter_hadith_chunks(cursor, args.chunk_size):
+            scan_start = time.time()
+            rows = []
+            for hadith_id, text_arabic, text_english in chunk:
+                found = extractor.extract(text_arabic, text_english or '')
+                if found:
+                    referencing += 1
+                for ayah_id, match_type in found.items():
+                    rows.append((hadith_id, ayah_id, match_type))
+                    counts[match_type] += 1
+            scan_seconds += time.time() - scan_start
+
+            batch_insert(cursor, 'hadith_ayah_references', columns, rows)
+            connection.commit()
+            scanned += len(chunk)
+            print(f"   {scanned:,} hadiths scanned, {sum(counts.values()):,} references")
+
+        elapsed_time = time.time() - start_time
+
+        # Summary
+        print("\n" + "="*70)
+        print("EXTRACTION COMPLETED SUCCESSFULLY!")
+        print("="*70)
+        print(f"\nStatistics:")
+        print(f"  - Hadiths scanned: {scanned:,}")
+        print(f"  - Hadiths with references: {referencing:,}")
+        for match_type in MATCH_TYPES:
+            print(f"  - {match_type.capitalize()} references: {counts[match_type]:,}")
+
+        cursor.execute("SELECT COUNT(*) FROM hadith_ayah_references")
+        print(f"  - Rows in hadith_ayah_references: {cursor.fetchone()[0]:,}")
+        print(f"\nTime Elapsed: {elapsed_time:.2f} seconds")
+        if scan_seconds:
+            print(f"  - Matching: {scan_seconds:.2f} seconds ({scanned / scan_seconds:,.0f} hadiths/s)")
+        print("="*70 + "\n")
+
+    except Exception as e:
+        print(f"\n❌ Error during extraction: {e}")
+        connection.rollback()
+        sys.exit(1)
+    finally:
+        cursor.close()
+        connection.close()
+        print("🔌 Database connection closed\n")
+
+if __name__ == "__main__":
+    main()
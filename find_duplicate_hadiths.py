@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Near-Duplicate Hadith Finder
+=========================================================
+
+Groups hadiths that are the same narration with minor wording differences
+(across and within collections) and stores the clusters in hadith_clusters.
+
+How it works:
+- Each hadith text is normalized (diacritics, letter variants, punctuation)
+  and cut into overlapping 3-word shingles, hashed to 32 bits
+- NumPy computes 120-permutation MinHash signatures in vectorized chunks
+- LSH banding (24 bands x 5 rows) buckets signatures that agree on a whole
+  band; only hadiths sharing a bucket are ever compared, so the run is
+  sub-quadratic in the number of hadiths
+- Candidate pairs are verified by signature agreement (estimated Jaccard
+  similarity) and merged into clusters with union-find
+
+Clusters are computed per language: ara/eng use hadiths.text_arabic /
+text_english, any other code uses that language's hadith_data translations.
+
+Usage:
+    python find_duplicate_hadiths.py
+    python find_duplicate_hadiths.py --language eng --threshold 0.6
+    python find_duplicate_hadiths.py --language urd
+
+Requirements:
+    pip install mysql-connector-python numpy
+"""
+
+import argparse
+import mysql.connector
+import re
+import sys
+import time
+import zlib
+from typing import List, Iterator, Tuple
+
+import numpy as np
+
+import bulk_load
+from bulk_load import batch_insert
+from extract_hadith_references import normalize_arabic
+from import_hadith import DB_CONFIG
+
+# ============================================================================
+# MINHASH CONFIGURATION
+# ============================================================================
+
+SHINGLE_WORDS = 3
+BANDS = 24                    # 24 bands x 5 rows: candidate threshold ~ (1/24)^(1/5) = 0.53,
+ROWS_PER_BAND = 5             # so pairs at 0.7 similarity are found with probability > 0.98
+NUM_PERMUTATIONS = BANDS * ROWS_PER_BAND
+DEFAULT_THRESHOLD = 0.7       # minimum estimated Jaccard similarity to link two hadiths
+MAX_BUCKET_SIZE = 500         # larger buckets are boilerplate; compared to their first member only
+SIGNATURE_CHUNK_SHINGLES = 200_000  # shingles hashed per NumPy step (bounds memory)
+HADITH_CHUNK_SIZE = 5000
+SEED = 1
+
+MERSENNE_PRIME = np.uint64(4294967291)  # largest prime below 2**32
+MAX_HASH = np.uint32(0xFFFFFFFF)
+
+WORD = re.compile(r'\w+')
+
+# ============================================================================
+# SHINGLES AND SIGNATURES
+# ============================================================================
+
+def tokenize(text: str, language: str) -> List[str]:
+    if language == 'ara':
+        return normalize_arabic(text).split()
+    return WORD.findall((text or '').lower())
+
+def shingle_hashes(words: List[str]) -> np.ndarray:
+    """Distinct 32-bit hashes of the 3-word shingles (the whole text if shorter)."""
+    if len(words) < SHINGLE_WORDS:
+        shingles = {' '.join(words)} if words else set()
+    else:
+        shingles = {' '.join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+    return np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+class MinHasher:
+    """Universal hash family h_i(x) = (a_i * x + b_i) mod p, shared by all signatures."""
+
+    def __init__(self, num_permutations: int = NUM_PERMUTATIONS, seed: int = SEED):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, int(MERSENNE_PRIME), size=(num_permutations, 1), dtype=np.uint64)
+        self.b = rng.integers(0, int(MERSENNE_PRIME), size=(num_permutations, 1), dtype=np.uint64)
+
+    def signatures(self, docs: List[np.ndarray]) -> np.ndarray:
+        """(len(docs), num_permutations) uint32 signatures; every doc needs >= 1 shingle."""
+        result = np.empty((len(docs), self.a.shape[0]), dtype=np.uint32)
+        start = 0
+        while start < len(docs):
+            # Take docs until the chunk holds SIGNATURE_CHUNK_SHINGLES shingles
+            end, total = start, 0
+            while end < len(docs) and (end == start or total + len(docs[end]) <= SIGNATURE_CHUNK_SHINGLES):
+                total += len(docs[end])
+                end += 1
+            chunk = docs[start:end]
+            values = np.concatenate(chunk)
+            offsets = np.cumsum([0] + [len(d) for d in chunk[:-1]])
+            # a * x < 2**64 since both are < 2**32, so uint64 never overflows here
+            hashed = (self.a * values[None, :] % MERSENNE_PRIME + self.b) % MERSENNE_PRIME
+            result[start:end] = np.minimum.reduceat(hashed, offsets, axis=1).T.astype(np.uint32)
+            start = end
+        return result
+
+# ============================================================================
+# LSH AND CLUSTERING
+# ============================================================================
+
+def candidate_pairs(signatures: np.ndarray, bands: int = BANDS) -> np.ndarray:
+    """(k, 2) row-index pairs sharing at least one LSH band bucket."""
+    rows = signatures.shape[1] // bands
+    pairs = []
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows))).ravel()
+        _, bucket, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        bucket = bucket.ravel()
+
+        shared = np.flatnonzero(counts[bucket] > 1)
+        if not len(shared):
+            continue
+        order = shared[np.argsort(bucket[shared], kind='stable')]
+        boundaries = np.flatnonzero(np.diff(bucket[order])) + 1
+        for members in np.split(order, boundaries):
+            if len(members) > MAX_BUCKET_SIZE:
+                pairs.append(np.column_stack([np.full(len(members) - 1, members[0]), members[1:]]))
+            else:
+                i, j = np.triu_indices(len(members), k=1)
+                pairs.append(np.column_stack([members[i], members[j]]))
+
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.concatenate(pairs), axis=0)
+
+def estimated_similarity(signatures: np.ndarray, pairs: np.ndarray, chunk: int = 100_000) -> np.ndarray:
+    """Fraction of matching MinHash values per pair (≈ Jaccard similarity)."""
+    scores = np.empty(len(pairs), dtype=np.float32)
+    for start in range(0, len(pairs), chunk):
+        left = signatures[pairs[start:start + chunk, 0]]
+        right = signatures[pairs[start:start + chunk, 1]]
+        scores[start:start + chunk] = (left == right).mean(axis=1)
+    return scores
+
+def cluster(count: int, pairs: np.ndarray) -> np.ndarray:
+    """Union-find over `pairs`; returns the root index for each of `count` items."""
+    parent = np.arange(count)
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in pairs:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    return np.array([find(i) for i in range(count)])
+
+def find_clusters(hadith_ids: np.ndarray, signatures: np.ndarray,
+                  threshold: float = DEFAULT_THRESHOLD) -> List[tuple]:
+    """
+    (hadith_id, cluster_id, similarity, cluster_size) for every hadith that
+    has at least one near-duplicate. cluster_id is the smallest hadith id in
+    the cluster; similarity is the best score to another member.
+    """
+    pairs = candidate_pairs(signatures)
+    scores = estimated_similarity(signatures, pairs)
+    keep = scores >= threshold
+    pairs, scores = pairs[keep], scores[keep]
+    print(f"   ✅ {len(keep):,} LSH candidate pairs, {len(pairs):,} verified (≥ {threshold:.2f})")
+
+    best = np.zeros(len(hadith_ids), dtype=np.float32)
+    np.maximum.at(best, pairs[:, 0], scores)
+    np.maximum.at(best, pairs[:, 1], scores)
+
+    roots = cluster(len(hadith_ids), pairs)  # rows are in ascending id order: root = min id
+    sizes = np.bincount(roots, minlength=len(hadith_ids))
+    return [(int(hadith_ids[i]), int(hadith_ids[roots[i]]), round(float(best[i]), 4), int(sizes[roots[i]]))
+            for i in np.flatnonzero(sizes[roots] > 1)]
+
+# ============================================================================
+# DATABASE
+# ============================================================================
+
+def iter_texts(cursor, language: str, chunk_size: int = HADITH_CHUNK_SIZE) -> Iterator[List[tuple]]:
+    """(hadith_id, text) rows of one language in hadith id order, chunk by chunk."""
+    if language in ('ara', 'eng'):
+        column = 'text_arabic' if language == 'ara' else 'text_english'
+        query = f"SELECT id, {column} FROM hadiths WHERE id > %s ORDER BY id LIMIT %s"
+        params: Tuple = ()
+    else:
+        query = """
+            SELECT hd.hadith_id, hd.text FROM hadith_data hd
+            JOIN hadith_editions he ON he.id = hd.edition_id
+            WHERE he.language = %s AND hd.hadith_id > %s
+            ORDER BY hd.hadith_id LIMIT %s
+        """
+        params = (language,)
+
+    last_id = 0
+    while True:
+        cursor.execute(query, params + (last_id, chunk_size))
+        rows = cursor.fetchall()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Cluster near-duplicate hadiths with MinHash/LSH")
+    parser.add_argument('--language', default='ara',
+                        help="ara / eng (hadiths table) or a hadith_data language code (default: ara)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Minimum estimated Jaccard similarity (default: {DEFAULT_THRESHOLD})")
+    bulk_load.add_engine_argument(parser)
+    return parser.parse_args()
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+    bulk_load.set_engine(args.engine)
+
+    print("\n" + "="*70)
+    print("ISLAMIC KNOWLEDGE DATABASE - NEAR-DUPLICATE HADITH FINDER")
+    print("="*70)
+
+    # Connect to database
+    print("\n🔌 Connecting to MySQL database...")
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG, allow_local_infile=(args.engine == 'load-data'))
+        cursor = connection.cursor(buffered=True)
+        print("   ✅ Connected successfully\n")
+    except mysql.connector.Error as err:
+        print(f"   ❌ Error: {err}")
+        sys.exit(1)
+
+    try:
+        start_time = time.time()
+        hasher = MinHasher()
+
+        print(f"🔢 Computing MinHash signatures ({args.language})...")
+        hadith_ids: List[int] = []
+        signatures: List[np.ndarray] = []
+        skipped = 0
+        for chunk in iter_texts(cursor, args.language):
+            docs = []
+            for hadith_id, text in chunk:
+                hashes = shingle_hashes(tokenize(text, args.language))
+                if len(hashes):
+                    hadith_ids.append(hadith_id)
+                    docs.append(hashes)
+                else:
+                    skipped += 1
+            if docs:
+                signatures.append(hasher.signatures(docs))
+            print(f"   {len(hadith_ids):,} hadiths signed")
+        signature_time = time.time() - start_time
+
+        if not hadith_ids:
+            print("   ❌ No hadith text found for this language")
+            sys.exit(1)
+
+        print("\n🪣 Bucketing with LSH and verifying candidates...")
+        cluster_start = time.time()
+        rows = find_clusters(np.array(hadith_ids), np.vstack(signatures), args.threshold)
+        cluster_time = time.time() - cluster_start
+
+        print("\n💾 Storing clusters...")
+        cursor.execute("DELETE FROM hadith_clusters WHERE language = %s", (args.language,))
+        columns = ['hadith_id', 'language', 'cluster_id', 'similarity', 'cluster_size']
+        batch_insert(cursor, 'hadith_clusters', columns,
+                     [(hadith_id, args.language, cluster_id, similarity, size)
+                      for hadith_id, cluster_id, similarity, size in rows])
+        connection.commit()
+
+        elapsed_time = time.time() - start_time
+        cluster_count = len({row[1] for row in rows})
+
+        # Summary
+        print("\n" + "="*70)
+        print("CLUSTERING COMPLETED SUCCESSFULLY!")
+        print("="*70)
+        print(f"\nStatistics:")
+        print(f"  - Hadiths compared: {len(hadith_ids):,} ({skipped:,} without text skipped)")
+        print(f"  - Clusters: {cluster_count:,}")
+        print(f"  - Hadiths in clusters: {len(rows):,}")
+        print(f"\nTime Elapsed: {elapsed_time:.2f} seconds")
+        print(f"  - Signatures: {signature_time:.2f} seconds")
+        print(f"  - LSH + clustering: {cluster_time:.2f} seconds")
+        print("="*70 + "\n")
+
+    except Exception as e:
+        print(f"\n❌ Error during clustering: {e}")
+        connection.rollback()
+        sys.exit(1)
+    finally:
+        cursor.close()
+        connection.close()
+        print("🔌 Database connection closed\n")
+
+if __name__ == "__main__":
+    main()
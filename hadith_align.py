@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Hadith Edition Alignment
+=====================================================
+
+Joins the language editions of one hadith collection on the hadith number
+instead of on list position.
+
+Editions on the hadith-api CDN do not always have the same length or order
+(a hadith missing from one translation shifts every later one), so pairing
+by index silently attaches text to the wrong hadith. align_editions is a
+hash join: every edition but one is loaded into a dict keyed by hadith
+number, and the remaining edition - the largest when sizes are known, else
+the first - is streamed against those indexes. One pass aligns any number
+of languages in O(total hadiths).
+
+Keys that are missing from some editions are still yielded (with None for
+the absent languages) and reported, so nothing is dropped silently.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SAMPLE_KEYS = 5  # unmatched keys printed per language
+
+Hadith = Dict[str, Any]
+
+# ============================================================================
+# KEYS
+# ============================================================================
+
+def hadith_key(hadith: Hadith, position: int) -> str:
+    """
+    Join key: the hadithnumber (1 and 1.0 compare equal), else the
+    book:hadith reference, else the position within the edition.
+    """
+    number = hadith.get('hadithnumber')
+    if number is not None:
+        if isinstance(number, float) and number.is_integer():
+            number = int(number)
+        return str(number)
+    reference = hadith.get('reference') or {}
+    if 'book' in reference and 'hadith' in reference:
+        return f"{reference['book']}:{reference['hadith']}"
+    return f"#{position + 1}"
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+class AlignmentReport:
+    """Matched/unmatched counts per language for one aligned collection."""
+
+    def __init__(self, languages: List[str]):
+        self.languages = languages
+        self.aligned = 0
+        self.complete = 0
+        self.missing: Dict[str, List[str]] = {language: [] for language in languages}
+        self.duplicates: Dict[str, int] = {language: 0 for language in languages}
+
+    @property
+    def clean(self) -> bool:
+        return not any(self.missing.values()) and not any(self.duplicates.values())
+
+    def print_summary(self, label: str):
+        print(f"   🔗 Aligned {label}: {self.complete:,} of {self.aligned:,} hadiths present in all of "
+              f"{', '.join(self.languages)}")
+        for language in self.languages:
+            missing = self.missing[language]
+            if missing:
+                sample = ', '.join(missing[:SAMPLE_KEYS]) + (', ...' if len(missing) > SAMPLE_KEYS else '')
+                print(f"      ⚠ {language}: {len(missing):,} hadith(s) missing (e.g. {sample})")
+            if self.duplicates[language]:
+                print(f"      ⚠ {language}: {self.duplicates[language]:,} duplicate key(s) ignored")
+
+# ============================================================================
+# HASH JOIN
+# ============================================================================
+
+def _build_index(hadiths: Iterable[Hadith], language: str, report: AlignmentReport) -> Dict[str, Hadith]:
+    index: Dict[str, Hadith] = {}
+    for position, hadith in enumerate(hadiths):
+        key = hadith_key(hadith, position)
+        if key in index:
+            report.duplicates[language] += 1
+            continue
+        index[key] = hadith
+    return index
+
+def align_editions(editions: Dict[str, Iterable[Hadith]], probe: Optional[str] = None,
+                   label: str = '') -> Iterator[Dict[str, Optional[Hadith]]]:
+    """
+    Yield {language: hadith or None} for every hadith number in any edition.
+
+    `editions` maps language to an iterable of hadith objects. The `probe`
+    edition is streamed (default: the largest sized edition, else the
+    first); all others are indexed first. Output follows the probe order,
+    followed by keys that only other editions have. A summary of missing and
+    duplicate keys is printed once the join is exhausted.
+    """
+    languages = list(editions)
+    if probe is None:
+        sized = all(hasattr(items, '__len__') for items in editions.values())
+        probe = max(languages, key=lambda language: len(editions[language])) if sized else languages[0]
+
+    report = AlignmentReport(languages)
+    indexes = {language: _build_index(items, language, report)
+               for language, items in editions.items() if language != probe}
+
+    def emit(row: Dict[str, Optional[Hadith]], key: str):
+        report.aligned += 1
+        absent = [language for language in languages if row.get(language) is None]
+        for language in absent:
+            report.missing[language].append(key)
+        if not absent:
+            report.complete += 1
+        return row
+
+    seen = set()
+    for position, hadith in enumerate(editions[probe]):
+        key = hadith_key(hadith, position)
+        if key in seen:
+            report.duplicates[probe] += 1
+            continue
+        seen.add(key)
+        row = {probe: hadith}
+        for language, index in indexes.items():
+            row[language] = index.pop(key, None)
+        yield emit(row, key)
+
+    # Keys the probe edition never had
+    for language, index in indexes.items():
+        for key in list(index):
+            row = {probe: None}
+            for other, other_index in indexes.items():
+                row[other] = other_index.pop(key, None)
+            yield emit(row, key)
+
+    report.print_summary(label or probe)
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Shared HTTP Client
+===============================================
+
+Pooled HTTP helpers shared by the data importers.
+
+Features:
+- One keep-alive requests.Session per process (connections are reused
+  instead of re-negotiating TCP/TLS for every download)
+- Per-URL retry with exponential backoff
+- Concurrent fetching of many URLs with a configurable concurrency limit
+- Process-wide request rate limit shared by all fetch threads
+- Streaming text reads (iter_text) for payloads too large to hold in memory,
+  written through to the cache as they arrive
+- Content-addressed on-disk response cache (gzip-compressed bodies) that
+  revalidates with ETag/Last-Modified, plus a strict offline replay mode
+
+Cache layout:
+    <cache_dir>/index/<sha256(url)>.json         url, validators, body digest
+    <cache_dir>/objects/<aa>/<sha256(body)>.gz   compressed response body
+
+Requirements:
+    pip install requests
+"""
+
+import codecs
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_CONCURRENCY = 6  # quran-uthmani + /meta + four translation editions
+MAX_RETRIES = 3
+REQUEST_TIMEOUT = 30  # seconds
+DEFAULT_CACHE_DIR = '.http_cache'
+DEFAULT_RATE_LIMIT = 5.0  # network requests per second (0 = unlimited)
+STREAM_CHUNK_SIZE = 64 * 1024  # bytes per read in iter_text
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_cache: Optional['ResponseCache'] = None
+_offline = False
+_rate_limiter: Optional['RateLimiter'] = None
+
+class OfflineCacheMiss(Exception):
+    """Raised in offline mode when a URL has never been cached."""
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+class ResponseCache:
+    """Content-addressed store of HTTP response bodies keyed by URL."""
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR):
+        self.root = root
+        os.makedirs(os.path.join(root, 'index'), exist_ok=True)
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+
+    def _index_path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.root, 'index', f"{key}.json")
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.root, 'objects', digest[:2], f"{digest}.gz")
+
+    def _write_atomic(self, path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the index entry for `url` if its body is still on disk."""
+        try:
+            with open(self._index_path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('url') != url or not os.path.exists(self.object_path(entry['digest'])):
+            return None
+        return entry
+
+    def read(self, entry: Dict[str, Any]) -> bytes:
+        with gzip.open(self.object_path(entry['digest']), 'rb') as f:
+            return f.read()
+
+    def iter_text(self, entry: Dict[str, Any], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+        """Yield a cached body as decoded text, `chunk_size` characters at a time."""
+        with gzip.open(self.object_path(entry['digest']), 'rt', encoding='utf-8') as f:
+            while True:
+                text = f.read(chunk_size)
+                if not text:
+                    return
+                yield text
+
+    def _write_index(self, url: str, digest: str, size: int, headers) -> Dict[str, Any]:
+        entry = {
+            'url': url,
+            'digest': digest,
+            'size': size,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'stored_at': time.time(),
+        }
+        self._write_atomic(self._index_path(url), json.dumps(entry).encode('utf-8'))
+        return entry
+
+    def store(self, url: str, body: bytes, headers) -> Dict[str, Any]:
+        """Store `body` (deduplicated by digest) and index it under `url`."""
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self.object_path(digest)
+        if not os.path.exists(object_path):
+            self._write_atomic(object_path, gzip.compress(body, compresslevel=6))
+        return self._write_index(url, digest, len(body), headers)
+
+    def writer(self, url: str) -> 'CacheWriter':
+        """Start storing a body that arrives in pieces (see CacheWriter)."""
+        return CacheWriter(self, url)
+
+    @staticmethod
+    def validators(entry: Dict[str, Any]) -> Dict[str, str]:
+        """Conditional-request headers for revalidating a cached entry."""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+class CacheWriter:
+    """
+    Compresses and hashes a streamed body into a temporary object file.
+    commit() moves it to its content address and indexes it; abort() (or
+    never committing a partial download) leaves the cache untouched.
+    """
+
+    def __init__(self, cache: ResponseCache, url: str):
+        self.cache = cache
+        self.url = url
+        self.size = 0
+        self._digest = hashlib.sha256()
+        fd, self._tmp_path = tempfile.mkstemp(dir=os.path.join(cache.root, 'objects'), suffix='.tmp')
+        self._raw = os.fdopen(fd, 'wb')
+        self._gzip = gzip.GzipFile(fileobj=self._raw, mode='wb', compresslevel=6)
+
+    def write(self, data: bytes):
+        self._gzip.write(data)
+        self._digest.update(data)
+        self.size += len(data)
+
+    def _close(self):
+        self._gzip.close()
+        self._raw.close()
+
+    def abort(self):
+        self._close()
+        os.unlink(self._tmp_path)
+
+    def commit(self, headers) -> Dict[str, Any]:
+        self._close()
+        digest = self._digest.hexdigest()
+        object_path = self.cache.object_path(digest)
+        if os.path.exists(object_path):
+            os.unlink(self._tmp_path)
+        else:
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            os.replace(self._tmp_path, object_path)
+        return self.cache._write_index(self.url, digest, self.size, headers)
+
+def configure_cache(cache_dir: Optional[str] = DEFAULT_CACHE_DIR, offline: bool = False):
+    """Enable the response cache (None disables it); offline replays cache only."""
+    global _cache, _offline
+    if offline and not cache_dir:
+        raise ValueError("Offline mode requires a cache directory")
+    _cache = ResponseCache(cache_dir) if cache_dir else None
+    _offline = offline
+
+def get_cache() -> Optional[ResponseCache]:
+    return _cache
+
+def add_cache_arguments(parser):
+    """Add the shared --cache-dir/--no-cache/--offline options to an argparse parser."""
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f"HTTP response cache directory (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Always download, never read or write the response cache")
+    parser.add_argument('--offline', action='store_true',
+                        help="Replay responses from the cache only; fail on any cache miss")
+
+def configure_cache_from_args(args):
+    """Apply the options added by add_cache_arguments."""
+    if args.offline and args.no_cache:
+        raise SystemExit("--offline cannot be combined with --no-cache")
+    configure_cache(None if args.no_cache else args.cache_dir, offline=args.offline)
+
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+class RateLimiter:
+    """Spaces requests at least 1/rate seconds apart across all threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until this caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+def configure_rate_limit(rate: Optional[float] = DEFAULT_RATE_LIMIT):
+    """Limit network requests to `rate` per second (None or 0 disables)."""
+    global _rate_limiter
+    _rate_limiter = RateLimiter(rate) if rate and rate > 0 else None
+
+def add_rate_limit_argument(parser):
+    """Add the shared --rate-limit option to an argparse parser."""
+    parser.add_argument('--rate-limit', type=float, default=DEFAULT_RATE_LIMIT,
+                        help=f"Maximum API requests per second across all threads "
+                             f"(default: {DEFAULT_RATE_LIMIT:g}, 0 = unlimited)")
+
+# ============================================================================
+# SESSION MANAGEMENT
+# ============================================================================
+
+def _build_session(pool_size: int) -> requests.Session:
+    """Create a session whose adapter keeps up to `pool_size` connections alive."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max(pool_size, 1), pool_maxsize=max(pool_size, 1))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def configure_session(pool_size: int = DEFAULT_CONCURRENCY) -> requests.Session:
+    """(Re)create the shared session with a connection pool of `pool_size`."""
+    global _session
+    session = _build_session(pool_size)
+    with _session_lock:
+        previous, _session = _session, session
+    if previous is not None:
+        previous.close()
+    return session
+
+def get_session() -> requests.Session:
+    """Return the shared keep-alive session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _build_session(DEFAULT_CONCURRENCY)
+        return _session
+
+# ============================================================================
+# FETCH HELPERS
+# ============================================================================
+
+def _fetch(url: str, parse: Callable[[bytes], Any], session: Optional[requests.Session],
+           max_retries: int) -> Any:
+    """
+    GET `url` and return `parse(body)`, going through the cache if enabled.
+
+    With a cache, a stored response is revalidated (HTTP 304 replays it from
+    disk); in offline mode the network is never touched. Bodies are only
+    cached once `parse` accepts them, so truncated downloads are retried.
+    """
+    entry = _cache.lookup(url) if _cache else None
+    if _offline:
+        if entry is None:
+            raise OfflineCacheMiss(f"Not in cache (offline mode): {url}")
+        print(f"    Replaying from cache: {url}")
+        return parse(_cache.read(entry))
+
+    session = session or get_session()
+    headers = ResponseCache.validators(entry) if entry else {}
+    for attempt in range(max_retries):
+        try:
+            if _rate_limiter:
+                _rate_limiter.wait()
+            print(f"    Fetching: {url}")
+            response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            if response.status_code == 304 and entry is not None:
+                print(f"    ✓ Not modified, using cache")
+                return parse(_cache.read(entry))
+            response.raise_for_status()
+            body = response.content
+            result = parse(body)
+            if _cache:
+                _cache.store(url, body, response.headers)
+            return result
+        except (requests.RequestException, ValueError) as e:
+            print(f"    ⚠ Attempt {attempt + 1}/{max_retries} failed: {e}")
+            if attempt < max_retries - 1:
+                time.sleep(2 ** attempt)  # Exponential backoff
+            else:
+                raise
+    raise Exception("Max retries exceeded")
+
+def fetch_bytes(url: str, session: Optional[requests.Session] = None, max_retries: int = MAX_RETRIES) -> bytes:
+    """GET `url` over the shared session (and cache) and return the raw body."""
+    return _fetch(url, bytes, session, max_retries)
+
+def get_json(url: str, session: Optional[requests.Session] = None, max_retries: int = MAX_RETRIES) -> Any:
+    """GET `url` over the shared session (and cache) and decode JSON, with retry logic."""
+    return _fetch(url, json.loads, session, max_retries)
+
+def iter_text(url: str, session: Optional[requests.Session] = None, max_retries: int = MAX_RETRIES,
+              chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Stream `url` as decoded UTF-8 text chunks without holding the whole body.
+
+    Cached bodies stream from their gzip file (offline, or after a 304). A
+    fresh download is written through to the cache as it streams and only
+    indexed once it has been read to the end. Retries cover establishing the
+    response; a failure mid-body propagates to the consumer.
+    """
+    entry = _cache.lookup(url) if _cache else None
+    if _offline:
+        if entry is None:
+            raise OfflineCacheMiss(f"Not in cache (offline mode): {url}")
+        print(f"    Streaming from cache: {url}")
+        yield from _cache.iter_text(entry, chunk_size)
+        return
+
+    session = session or get_session()
+    headers = ResponseCache.validators(entry) if entry else {}
+    for attempt in range(max_retries):
+        try:
+            if _rate_limiter:
+                _rate_limiter.wait()
+            print(f"    Streaming: {url}")
+            response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True)
+            if not (response.status_code == 304 and entry is not None):
+                response.raise_for_status()
+            break
+        except requests.RequestException as e:
+            print(f"    ⚠ Attempt {attempt + 1}/{max_retries} failed: {e}")
+            if attempt < max_retries - 1:
+                time.sleep(2 ** attempt)  # Exponential backoff
+            else:
+                raise
+
+    with response:
+        if response.status_code == 304:
+            print(f"    ✓ Not modified, streaming from cache")
+            yield from _cache.iter_text(entry, chunk_size)
+            return
+
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        writer = _cache.writer(url) if _cache else None
+        try:
+            for data in response.iter_content(chunk_size):
+                if writer:
+                    writer.write(data)
+                text = decoder.decode(data)
+                if text:
+                    yield text
+            text = decoder.decode(b'', final=True)
+            if text:
+                yield text
+        except BaseException:
+            if writer:
+                writer.abort()
+            raise
+        if writer:
+            writer.commit(response.headers)
+
+def fetch_many(urls: Iterable[str], fetch: Callable[[str], Any],
+               concurrency: int = DEFAULT_CONCURRENCY) -> Dict[str, Any]:
+    """
+    Fetch every URL with `fetch`, running up to `concurrency` requests at once.
+
+    Each URL keeps the retry/backoff behaviour of `fetch`. The returned dict
+    preserves the order of `urls`; the first failure is re-raised once all
+    in-flight requests have finished.
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if concurrency <= 1 or len(unique_urls) <= 1:
+        return {url: fetch(url) for url in unique_urls}
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(unique_urls))) as executor:
+        futures = {url: executor.submit(fetch, url) for url in unique_urls}
+        return {url: future.result() for url, future in futures.items()}
@@ -18,16 +18,40 @@ Data Source: fawazahmed0/hadith-api CDN
 
 Usage:
     python import_hadith.py
+    python import_hadith.py --fetch-workers 2 --queue-size 1
+    python import_hadith.py --workers 6        # one pooled connection per collection
+    python import_hadith.py --offline          # replay from .http_cache only
+    python import_hadith.py --engine load-data # bulk-load via LOAD DATA LOCAL INFILE
+    python import_hadith.py --defer-indexes    # build FULLTEXT indexes once at the end
+    python import_hadith.py --delta            # upsert only new/changed hadiths
+    python import_hadith.py --resume           # continue after a crashed/killed run
+    python import_hadith.py --stream           # parse hadiths incrementally (flat memory)
+    python import_hadith.py --backfill-clean   # fill text_clean for rows imported earlier
 
 Requirements:
     pip install mysql-connector-python requests
 """
 
+import argparse
+import itertools
 import mysql.connector
-import requests
+import mysql.connector.pooling
 import sys
+import threading
 import time
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+import bulk_load
+import http_client
+import json_stream
+from arabic_normalizer import BATCH_TEXTS as NORMALIZE_BATCH, normalize_many
+from bulk_load import batch_insert, batch_upsert, chunked, insert_stream
+from delta_import import DeltaSummary, content_hash, delta_upsert_stream, existing_hashes
+from hadith_align import align_editions, hadith_key
+from import_journal import ImportJournal
+from import_pipeline import DEFAULT_QUEUE_SIZE, Pipeline, print_stats
 
 # ============================================================================
 # DATABASE CONFIGURATION
@@ -52,6 +76,10 @@ CDN_BASE = 'https://cdn.jsdelivr.net/gh/fawazahmed0/hadith-api@1/editions'
 # The six major hadith collections are already inserted via schema.sql
 # We just need to fetch and import the actual hadiths
 
+MAX_POOL_SIZE = 32  # mysql.connector.pooling limit
+BACKFILL_CHUNK_SIZE = 1000  # hadiths normalized and committed per --backfill-clean chunk
+CHAPTER_ID_STRIDE = 100000  # hadith_chapters.id = collection_id * stride + chapter_number
+
 HADITH_COLLECTIONS = [
     {'identifier': 'bukhari', 'slug': 'bukhari'},
     {'identifier': 'muslim', 'slug': 'muslim'},
@@ -61,47 +89,50 @@ HADITH_COLLECTIONS = [
     {'identifier': 'ibnmajah', 'slug': 'ibnmajah'},
 ]
 
-BATCH_SIZE = 500
-
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
 def fetch_json(url: str) -> Dict[str, Any]:
-    """Fetch JSON data from CDN with retry logic."""
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            print(f"    Fetching: {url}")
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            print(f"    ⚠ Attempt {attempt + 1}/{max_retries} failed: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
-            else:
-                raise
-    raise Exception("Max retries exceeded")
+    """Fetch JSON data from CDN with retry logic (through the response cache)."""
+    return http_client.get_json(url)
 
-def batch_insert(cursor, table: str, columns: List[str], data: List[tuple], ignore_duplicates: bool = True) -> int:
-    """Perform batch insert with proper error handling."""
-    if not data:
-        return 0
+class CollectionTimings:
+    """Per-collection fetch/prepare/store seconds, recorded from any thread."""
 
-    placeholders = ', '.join(['%s'] * len(columns))
-    columns_str = ', '.join(columns)
-    ignore_clause = 'IGNORE' if ignore_duplicates else ''
-    sql = f"INSERT {ignore_clause} INTO {table} ({columns_str}) VALUES ({placeholders})"
+    PHASES = ('fetch', 'prepare', 'store')
 
-    inserted = 0
-    for i in range(0, len(data), BATCH_SIZE):
-        batch = data[i:i + BATCH_SIZE]
-        cursor.executemany(sql, batch)
-        inserted += cursor.rowcount
-        print(f"    📝 Inserted {min(i + BATCH_SIZE, len(data))}/{len(data)} records")
+    def __init__(self):
+        self.seconds: Dict[str, Dict[str, float]] = {}
+        self.hadiths: Dict[str, int] = {}
+        self._lock = threading.Lock()
 
-    return inserted
+    @contextmanager
+    def phase(self, slug: str, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                phases = self.seconds.setdefault(slug, dict.fromkeys(self.PHASES, 0.0))
+                phases[phase] += elapsed
+
+    def print_summary(self, wall_seconds: float):
+        """Print one row per collection and the overlap achieved over `wall_seconds`."""
+        if not self.seconds:
+            return
+        print(f"\nPer-Collection Timings:")
+        print(f"  {'collection':<12} {'hadiths':>8} {'fetch':>8} {'prepare':>8} {'store':>8} {'total':>8}")
+        serial_seconds = 0.0
+        for slug, phases in self.seconds.items():
+            total = sum(phases.values())
+            serial_seconds += total
+            print(f"  {slug:<12} {self.hadiths.get(slug, 0):>8,} {phases['fetch']:>7.2f}s "
+                  f"{phases['prepare']:>7.2f}s {phases['store']:>7.2f}s {total:>7.2f}s")
+        if wall_seconds > 0:
+            print(f"  Sum of collections: {serial_seconds:.2f}s in {wall_seconds:.2f}s wall "
+                  f"({serial_seconds / wall_seconds:.2f}x overlap)")
 
 # ============================================================================
 # MAIN IMPORT FUNCTIONS
@@ -116,38 +147,23 @@ def get_collection_id(cursor, slug: str) -> int:
     else:
         raise Exception(f"Collection '{slug}' not found in database. Please run schema.sql first.")
 
-def import_hadith_collection(cursor, connection, collection: Dict[str, str]) -> Tuple[int, int]:
-    """Import a single hadith collection."""
+def fetch_collection(collection: Dict[str, str]) -> Dict[str, Any]:
+    """Download the Arabic and English editions of a collection."""
     identifier = collection['identifier']
-    slug = collection['slug']
 
-    print(f"\n{'='*70}")
-    print(f"IMPORTING: {slug.upper()}")
-    print(f"{'='*70}\n")
-
-    # Get collection ID
-    collection_id = get_collection_id(cursor, slug)
-    print(f"📚 Collection ID: {collection_id}")
-
-    # Fetch Arabic and English data
-    print("\n1️⃣  Fetching Arabic text...")
-    arabic_url = f"{CDN_BASE}/ara-{identifier}.json"
-    arabic_data = fetch_json(arabic_url)
+    print(f"\n📥 Fetching {collection['slug']}...")
+    arabic_data = fetch_json(f"{CDN_BASE}/ara-{identifier}.json")
+    english_data = fetch_json(f"{CDN_BASE}/eng-{identifier}.json")
 
-    print("2️⃣  Fetching English translation...")
-    english_url = f"{CDN_BASE}/eng-{identifier}.json"
-    english_data = fetch_json(english_url)
+    print(f"   ✅ Retrieved {len(arabic_data.get('hadiths', []))} {collection['slug']} hadiths")
+    return {'collection': collection, 'arabic': arabic_data, 'english': english_data}
 
-    total_hadiths = len(arabic_data.get('hadiths', []))
-    print(f"\n   ✅ Retrieved {total_hadiths} hadiths")
+def chapter_rows(metadata: Optional[Dict[str, Any]], collection_id: int) -> List[tuple]:
+    """Chapter tuples from an edition's metadata.sections."""
+    chapter_data = []
+    if metadata and metadata.get('sections'):
+        sections = metadata['sections']
 
-    # Import chapters if available
-    chapter_map = {}
-    if arabic_data.get('metadata') and arabic_data['metadata'].get('sections'):
-        print("\n3️⃣  Importing chapters...")
-        sections = arabic_data['metadata']['sections']
-
-        chapter_data = []
         if isinstance(sections, dict):
             for chapter_num, chapter_name in sections.items():
                 chapter_data.append((
@@ -156,14 +172,195 @@ def import_hadith_collection(cursor, connection, collection: Dict[str, str]) ->
                     str(chapter_name),
                     None  # chapter_name_arabic
                 ))
+    return chapter_data
+
+def hadith_row(arabic_hadith: Dict[str, Any], english_hadith: Optional[Dict[str, Any]],
+               index: int, collection_id: int, text_clean: str) -> tuple:
+    """
+    One hadiths tuple (chapter *number* in the chapter_id slot, content hash
+    last). A hadith without an English counterpart gets NULL text_english.
+
+    text_clean is derived from text_arabic, so it is left out of the content
+    hash: rows imported before the column existed keep matching in delta
+    mode and are filled in by --backfill-clean instead.
+    """
+    # Chapter number if available (resolved to an id at insert time)
+    chapter_num = None
+    if 'reference' in arabic_hadith and 'book' in arabic_hadith['reference']:
+        chapter_num = arabic_hadith['reference']['book']
+
+    # Extract grade
+    grade = None
+    if 'grades' in arabic_hadith and len(arabic_hadith['grades']) > 0:
+        grade = arabic_hadith['grades'][0].get('grade')
+
+    row = (
+        collection_id,
+        chapter_num,
+        hadith_key(arabic_hadith, index),  # the join key translations are matched on
+        arabic_hadith['reference'].get('hadith') if 'reference' in arabic_hadith else None,
+        arabic_hadith.get('text', ''),
+        english_hadith.get('text', '') if english_hadith else None,
+        None,  # narrator_chain (not available in this dataset)
+        grade
+    )
+
+    return row[:5] + (text_clean,) + row[5:] + (content_hash(row[1:]),)
+
+def hadith_rows(aligned: Iterable[Dict[str, Optional[Dict[str, Any]]]],
+                collection_id: int) -> Iterator[tuple]:
+    """
+    Build hadiths tuples from aligned {'ara', 'eng'} editions, normalizing
+    text_clean a batch at a time (one vectorized pass per batch).
+    """
+    numbered = (
+        (i, editions) for i, editions in enumerate(aligned)
+        if editions['ara'] is not None  # text_arabic is required; reported by the alignment
+    )
+    for batch in chunked(numbered, NORMALIZE_BATCH):
+        cleaned = normalize_many([editions['ara'].get('text', '') for _, editions in batch])
+        for (i, editions), text_clean in zip(batch, cleaned):
+            yield hadith_row(editions['ara'], editions['eng'], i, collection_id, text_clean)
+
+def prepare_collection(payload: Dict[str, Any], collection_id: int) -> Dict[str, Any]:
+    """
+    Build chapter and hadith tuples for a fetched collection.
+
+    Hadith tuples carry the chapter *number* in the chapter_id slot; it is
+    resolved to a database id by store_collection once chapters exist.
+    """
+    arabic_data = payload['arabic']
+    english_data = payload['english']
+
+    chapter_data = chapter_rows(arabic_data.get('metadata'), collection_id)
+
+    # Join the editions on hadith number (not list position)
+    aligned = align_editions({'ara': arabic_data.get('hadiths', []), 'eng': english_data.get('hadiths', [])},
+                             label=payload['collection']['slug'])
+    hadith_data = list(hadith_rows(aligned, collection_id))
+
+    print(f"   ✅ Prepared {len(hadith_data)} {payload['collection']['slug']} hadiths")
+
+    return {
+        'collection': payload['collection'],
+        'collection_id': collection_id,
+        'chapters': chapter_data,
+        'hadiths': hadith_data,
+    }
+
+def stream_collection(collection: Dict[str, str], collection_id: int) -> Dict[str, Any]:
+    """
+    Like fetch_collection + prepare_collection, but Arabic hadiths are
+    parsed incrementally (from the streamed response or cached file) as the
+    tuples are consumed, joined against a hash index of the English edition.
+    Only the English edition and the chapter list are loaded up front.
+
+    The English edition is read to the end before the Arabic request is
+    opened, so the Arabic response never sits idle while it downloads.
+
+    The returned 'hadiths' is a one-shot iterator for store_collection.
+    """
+    identifier = collection['identifier']
+    print(f"\n📥 Streaming {collection['slug']}...")
+
+    path = ('hadiths', '*')
+    english = [hadith for _, hadith in
+               json_stream.iter_items(http_client.iter_text(f"{CDN_BASE}/eng-{identifier}.json"), path)]
+    arabic = json_stream.iter_items(http_client.iter_text(f"{CDN_BASE}/ara-{identifier}.json"), path)
+
+    # metadata precedes the hadiths array, so it is known once the first hadith is read
+    first = next(arabic, None)
+    metadata = first[0][0].get('metadata') if first else None
+
+    def hadiths() -> Iterator[tuple]:
+        if first is None:
+            return
+        # The Arabic edition streams against a hash index of the English one
+        aligned = align_editions({
+            'ara': (hadith for _, hadith in itertools.chain([first], arabic)),
+            'eng': english,
+        }, probe='ara', label=collection['slug'])
+        yield from hadith_rows(aligned, collection_id)
+
+    return {
+        'collection': collection,
+        'collection_id': collection_id,
+        'chapters': chapter_rows(metadata, collection_id),
+        'hadiths': hadiths(),
+    }
+
+def chapter_id(collection_id: int, chapter_number: int) -> int:
+    """Canonical hadith_chapters id, so chapter ids never have to be read back."""
+    return collection_id * CHAPTER_ID_STRIDE + chapter_number
+
+def canonical_chapter_ids(cursor, collection_id: int, chapters: List[tuple]) -> bool:
+    """
+    True if the collection's chapters can be stored under canonical ids:
+    every chapter number fits the stride and no stored chapter of the
+    collection has an AUTO_INCREMENT id from an earlier import.
+    """
+    if any(not 0 <= row[1] < CHAPTER_ID_STRIDE for row in chapters):
+        return False
+    cursor.execute("""
+        SELECT COUNT(*) FROM hadith_chapters
+        WHERE collection_id = %s AND id <> collection_id * %s + chapter_number
+    """, (collection_id, CHAPTER_ID_STRIDE))
+    return cursor.fetchone()[0] == 0
+
+def update_collection_totals(cursor, collection_ids: List[int]):
+    """Recount total_hadiths from the table (so re-runs that skip rows stay correct)."""
+    if not collection_ids:
+        return
+    placeholders = ', '.join(['%s'] * len(collection_ids))
+    cursor.execute(f"""
+        UPDATE hadith_collections hc
+        SET total_hadiths = (SELECT COUNT(*) FROM hadiths h WHERE h.collection_id = hc.id)
+        WHERE hc.id IN ({placeholders})
+    """, tuple(collection_ids))
+
+def store_collection(cursor, connection, prepared: Dict[str, Any],
+                     delta: Optional[DeltaSummary] = None,
+                     journal: Optional[ImportJournal] = None,
+                     update_total: bool = True) -> Tuple[int, int]:
+    """
+    Insert a prepared collection's chapters and hadiths, then commit (upsert
+    changes in delta mode).
+
+    With a journal, every hadith batch is checkpointed in the transaction
+    that commits it, and a partially imported collection restarts after its
+    last committed batch. Parallel workers pass update_total=False and leave
+    the total_hadiths recount to the coordinating connection.
+    """
+    slug = prepared['collection']['slug']
+    collection_id = prepared['collection_id']
 
-        if chapter_data:
-            columns = ['collection_id', 'chapter_number', 'chapter_name_english', 'chapter_name_arabic']
-            inserted_chapters = batch_insert(cursor, 'hadith_chapters', columns, chapter_data)
-            connection.commit()
-            print(f"   ✅ Imported {inserted_chapters} chapters")
+    print(f"\n{'='*70}")
+    print(f"IMPORTING: {slug.upper()}")
+    print(f"{'='*70}\n")
+    print(f"📚 Collection ID: {collection_id}")
 
-            # Create chapter mapping
+    # Import chapters if available
+    chapter_map = {}
+    if prepared['chapters']:
+        print("\n1️⃣  Importing chapters...")
+        columns = ['collection_id', 'chapter_number', 'chapter_name_english', 'chapter_name_arabic']
+        chapters = prepared['chapters']
+        canonical = canonical_chapter_ids(cursor, collection_id, chapters)
+        if canonical:
+            columns = ['id'] + columns
+            chapters = [(chapter_id(collection_id, row[1]),) + row for row in chapters]
+        if delta is not None:
+            inserted_chapters = batch_upsert(cursor, 'hadith_chapters', columns, chapters, columns[-2:])
+        else:
+            inserted_chapters = batch_insert(cursor, 'hadith_chapters', columns, chapters)
+        connection.commit()
+        print(f"   ✅ Imported {inserted_chapters} chapters")
+
+        # Create chapter mapping (computed; only AUTO_INCREMENT ids are read back)
+        if canonical:
+            chapter_map = {row[2]: row[0] for row in chapters}
+        else:
+            print("   ⚠ Chapter ids are not canonical; loading them")
             cursor.execute("""
                 SELECT id, chapter_number
                 FROM hadith_chapters
@@ -171,68 +368,273 @@ def import_hadith_collection(cursor, connection, collection: Dict[str, str]) ->
             """, (collection_id,))
             chapter_map = {row[1]: row[0] for row in cursor.fetchall()}
 
-    # Import hadiths
-    print("\n4️⃣  Preparing hadith data...")
-    hadith_data = []
-
-    for i, arabic_hadith in enumerate(arabic_data.get('hadiths', [])):
-        english_hadith = english_data['hadiths'][i] if i < len(english_data.get('hadiths', [])) else None
-
-        if not english_hadith:
-            continue
-
-        # Get chapter ID if available
-        chapter_id = None
-        if 'reference' in arabic_hadith and 'book' in arabic_hadith['reference']:
-            chapter_num = arabic_hadith['reference']['book']
-            chapter_id = chapter_map.get(chapter_num)
-
-        # Extract grade
-        grade = None
-        if 'grades' in arabic_hadith and len(arabic_hadith['grades']) > 0:
-            grade = arabic_hadith['grades'][0].get('grade')
-
-        hadith_data.append((
-            collection_id,
-            chapter_id,
-            str(arabic_hadith.get('hadithnumber', i + 1)),
-            arabic_hadith['reference'].get('hadith') if 'reference' in arabic_hadith else None,
-            arabic_hadith.get('text', ''),
-            english_hadith.get('text', ''),
-            None,  # narrator_chain (not available in this dataset)
-            grade
-        ))
-
-    print(f"   ✅ Prepared {len(hadith_data)} hadiths")
+    # Resolve chapter numbers to ids (lazily when 'hadiths' is a stream)
+    hadith_data = (
+        row[:1] + (chapter_map.get(row[1]),) + row[2:]
+        for row in prepared['hadiths']
+    )
+    if isinstance(prepared['hadiths'], list):
+        hadith_data = list(hadith_data)
 
     # Batch insert hadiths
-    print("\n5️⃣  Inserting hadiths into database...")
+    print("\n2️⃣  Inserting hadiths into database...")
     columns = [
         'collection_id', 'chapter_id', 'reference_number',
-        'hadith_in_chapter', 'text_arabic', 'text_english',
-        'narrator_chain', 'grade'
+        'hadith_in_chapter', 'text_arabic', 'text_clean', 'text_english',
+        'narrator_chain', 'grade', 'content_hash'
     ]
-    inserted_hadiths = batch_insert(cursor, 'hadiths', columns, hadith_data)
+    if delta is not None:
+        key_columns = ['collection_id', 'reference_number']
+        existing = existing_hashes(cursor, 'hadiths', key_columns, 'collection_id = %s', (collection_id,))
+        summary, total_rows = delta_upsert_stream(cursor, 'hadiths', columns, hadith_data, key_columns, existing)
+        delta.add(summary)
+        inserted_hadiths = summary.written
+    else:
+        offset = journal.resume_offset(slug) if journal else 0
+        if offset:
+            print(f"   ⏩ Resuming after {offset:,} committed hadiths")
+        on_batch = journal.batch_committer(slug, offset) if journal else None
+        inserted_hadiths, total_rows = insert_stream(cursor, 'hadiths', columns, hadith_data,
+                                                     skip=offset, on_batch=on_batch)
     connection.commit()
 
-    # Update total hadiths count
-    cursor.execute("""
-        UPDATE hadith_collections
-        SET total_hadiths = %s
-        WHERE id = %s
-    """, (inserted_hadiths, collection_id))
+    if update_total:
+        update_collection_totals(cursor, [collection_id])
+    if journal:
+        journal.complete(slug, total_rows)
     connection.commit()
 
     print(f"\n✅ Completed {slug}: {inserted_hadiths} hadiths, {len(chapter_map)} chapters")
 
     return inserted_hadiths, len(chapter_map)
 
+def backfill_text_clean(cursor, connection, recompute: bool = False,
+                        chunk_size: int = BACKFILL_CHUNK_SIZE) -> int:
+    """
+    Fill hadiths.text_clean for rows imported before the column existed
+    (or recompute every row, e.g. after a normalizer change).
+
+    Rows are read in id order with keyset pagination and each chunk is
+    updated and committed on its own, so row locks are only held for one
+    chunk and the table stays available while the backfill runs.
+    """
+    condition = '' if recompute else 'AND text_clean IS NULL'
+    updated = 0
+    last_id = 0
+
+    while True:
+        cursor.execute(f"""
+            SELECT id, text_arabic FROM hadiths
+            WHERE id > %s {condition}
+            ORDER BY id LIMIT %s
+        """, (last_id, chunk_size))
+        rows = cursor.fetchall()
+        if not rows:
+            break
+
+        cleaned = normalize_many([text_arabic for _, text_arabic in rows])
+        cursor.executemany("UPDATE hadiths SET text_clean = %s WHERE id = %s",
+                           [(text_clean, hadith_id) for (hadith_id, _), text_clean in zip(rows, cleaned)])
+        connection.commit()
+
+        updated += len(rows)
+        last_id = rows[-1][0]
+        print(f"    📝 Normalized {updated:,} hadiths (id ≤ {last_id})")
+
+    return updated
+
+def import_hadith_collection(cursor, connection, collection: Dict[str, str]) -> Tuple[int, int]:
+    """Import a single hadith collection (fetch, prepare and insert in sequence)."""
+    collection_id = get_collection_id(cursor, collection['slug'])
+    payload = fetch_collection(collection)
+    return store_collection(cursor, connection, prepare_collection(payload, collection_id))
+
+def pending_collections(collections: List[Dict[str, str]],
+                        journal: Optional[ImportJournal]) -> List[Dict[str, str]]:
+    """Drop the collections the journal marks completed."""
+    if not journal:
+        return collections
+    for collection in collections:
+        if journal.is_completed(collection['slug']):
+            print(f"   ⏭  Skipping {collection['slug']} (completed in an earlier run)")
+    return [c for c in collections if not journal.is_completed(c['slug'])]
+
+def import_collections(cursor, connection, collections: List[Dict[str, str]],
+                       fetch_workers: int = 1, queue_size: int = DEFAULT_QUEUE_SIZE,
+                       delta: Optional[DeltaSummary] = None,
+                       journal: Optional[ImportJournal] = None,
+                       timings: Optional[CollectionTimings] = None,
+                       stream: bool = False) -> Tuple[int, int]:
+    """
+    Import collections through a fetch -> prepare -> insert pipeline.
+
+    The next collection downloads and its tuples are built while the current
+    one is written; at most `queue_size` collections wait between stages.
+    Collections the journal marks completed are skipped entirely.
+
+    With `stream`, collections are instead imported one at a time, parsing
+    and inserting Arabic hadiths in fixed-size batches against the English
+    edition (see stream_collection), so the Arabic edition is never held in
+    memory.
+    """
+    collections = pending_collections(collections, journal)
+    collection_ids = {c['slug']: get_collection_id(cursor, c['slug']) for c in collections}
+    timings = timings or CollectionTimings()
+    totals = [0, 0]
+
+    if stream:
+        for collection in collections:
+            slug = collection['slug']
+            with timings.phase(slug, 'store'):
+                prepared = stream_collection(collection, collection_ids[slug])
+                hadiths, chapters = store_collection(cursor, connection, prepared, delta, journal)
+            timings.hadiths[slug] = hadiths
+            totals[0] += hadiths
+            totals[1] += chapters
+        return totals[0], totals[1]
+
+    def fetch(collection):
+        with timings.phase(collection['slug'], 'fetch'):
+            return fetch_collection(collection)
+
+    def prepare(payload):
+        slug = payload['collection']['slug']
+        with timings.phase(slug, 'prepare'):
+            return prepare_collection(payload, collection_ids[slug])
+
+    def insert(prepared) -> int:
+        slug = prepared['collection']['slug']
+        with timings.phase(slug, 'store'):
+            hadiths, chapters = store_collection(cursor, connection, prepared, delta, journal)
+        timings.hadiths[slug] = hadiths
+        totals[0] += hadiths
+        totals[1] += chapters
+        return hadiths
+
+    pipeline = Pipeline(queue_size)
+    pipeline.add_stage('fetch', fetch, workers=fetch_workers,
+                       rows=lambda p: len(p['arabic'].get('hadiths', [])))
+    pipeline.add_stage('prepare', prepare, rows=lambda p: len(p['hadiths']))
+
+    start = time.perf_counter()
+    stats = pipeline.run(collections, insert, sink_rows=lambda inserted: inserted)
+    print_stats(stats, time.perf_counter() - start)
+
+    return totals[0], totals[1]
+
+def create_connection_pool(size: int, allow_local_infile: bool = False):
+    """A pool of `size` connections for parallel collection workers."""
+    return mysql.connector.pooling.MySQLConnectionPool(
+        pool_name='hadith_import', pool_size=size,
+        allow_local_infile=allow_local_infile, **DB_CONFIG
+    )
+
+def import_collections_parallel(cursor, connection, pool, collections: List[Dict[str, str]],
+                                workers: int, delta: Optional[DeltaSummary] = None,
+                                journal: Optional[ImportJournal] = None,
+                                timings: Optional[CollectionTimings] = None,
+                                stream: bool = False) -> Tuple[int, int]:
+    """
+    Import whole collections concurrently, one pooled connection per worker.
+
+    Collections only share their parent hadith_collections rows, so each
+    worker fetches, prepares and stores its collection in its own
+    transactions. The total_hadiths recount runs once on the coordinating
+    `connection` after every worker has committed, so workers never lock
+    each other's rows. The first failure cancels collections that have not
+    started and is re-raised once running workers finish.
+    """
+    collections = pending_collections(collections, journal)
+    collection_ids = {c['slug']: get_collection_id(cursor, c['slug']) for c in collections}
+    timings = timings or CollectionTimings()
+
+    def work(collection) -> Tuple[int, int, Optional[DeltaSummary]]:
+        slug = collection['slug']
+        worker_delta = DeltaSummary() if delta is not None else None
+        worker_connection = pool.get_connection()
+        worker_cursor = worker_connection.cursor(buffered=True)
+        try:
+            if stream:
+                # Parsing happens while storing, so it is timed as 'store'
+                prepared = stream_collection(collection, collection_ids[slug])
+            else:
+                with timings.phase(slug, 'fetch'):
+                    payload = fetch_collection(collection)
+                with timings.phase(slug, 'prepare'):
+                    prepared = prepare_collection(payload, collection_ids[slug])
+                del payload
+            worker_journal = journal.for_connection(worker_cursor, worker_connection) if journal else None
+            with timings.phase(slug, 'store'):
+                hadiths, chapters = store_collection(worker_cursor, worker_connection, prepared,
+                                                     worker_delta, worker_journal, update_total=False)
+            timings.hadiths[slug] = hadiths
+            return hadiths, chapters, worker_delta
+        except Exception:
+            worker_connection.rollback()
+            raise
+        finally:
+            worker_cursor.close()
+            worker_connection.close()  # returns it to the pool
+
+    total_hadiths = total_chapters = 0
+    executor = ThreadPoolExecutor(max_workers=max(1, min(workers, len(collections))))
+    try:
+        futures = [executor.submit(work, collection) for collection in collections]
+        for future in futures:
+            hadiths, chapters, worker_delta = future.result()
+            total_hadiths += hadiths
+            total_chapters += chapters
+            if worker_delta is not None:
+                delta.add(worker_delta)
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+
+    # Recount every collection, including ones completed by an earlier --resume run
+    update_collection_totals(cursor, [get_collection_id(cursor, c['slug']) for c in HADITH_COLLECTIONS])
+    connection.commit()
+
+    return total_hadiths, total_chapters
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Import hadith collections into IslamicKnowledgeDB")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Collections imported in parallel, each on its own pooled connection "
+                             f"(1 = single-connection pipeline, max {MAX_POOL_SIZE})")
+    parser.add_argument('--fetch-workers', type=int, default=1,
+                        help="Collections downloaded in parallel by the fetch stage (--workers 1 only)")
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE,
+                        help="Collections buffered between pipeline stages (bounds memory)")
+    http_client.add_cache_arguments(parser)
+    bulk_load.add_engine_argument(parser)
+    bulk_load.add_defer_indexes_argument(parser)
+    parser.add_argument('--delta', action='store_true',
+                        help="Compare content hashes and upsert only new or changed hadiths")
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip collections finished by an earlier run and continue mid-collection")
+    parser.add_argument('--stream', action='store_true',
+                        help="Parse hadiths incrementally and insert them in fixed-size batches "
+                             "(flat memory; bypasses the prepare pipeline)")
+    parser.add_argument('--backfill-clean', nargs='?', const='missing', choices=('missing', 'all'),
+                        help="Only fill text_clean for already-imported hadiths (missing rows, "
+                             "or all rows to recompute) and exit")
+    args = parser.parse_args()
+    if not 1 <= args.workers <= MAX_POOL_SIZE:
+        parser.error(f"--workers must be between 1 and {MAX_POOL_SIZE}")
+    return args
+
 def main():
     """Main execution function."""
+    args = parse_args()
+    http_client.configure_cache_from_args(args)
+    bulk_load.set_engine(args.engine)
+
     print("\n" + "="*70)
     print("ISLAMIC KNOWLEDGE DATABASE - HADITH DATA IMPORTER")
     print("="*70)
@@ -246,23 +648,54 @@ def main():
     # Connect to database
     print("\n🔌 Connecting to MySQL database...")
     try:
-        connection = mysql.connector.connect(**DB_CONFIG)
+        connection = mysql.connector.connect(**DB_CONFIG, allow_local_infile=(args.engine == 'load-data'))
         cursor = connection.cursor(buffered=True)
         print("   ✅ Connected successfully\n")
     except mysql.connector.Error as err:
         print(f"   ❌ Error: {err}")
         sys.exit(1)
 
+    if args.backfill_clean:
+        try:
+            start_time = time.time()
+            print(f"🧹 Backfilling hadiths.text_clean ({args.backfill_clean} rows)...")
+            updated = backfill_text_clean(cursor, connection, recompute=(args.backfill_clean == 'all'))
+            print(f"\n✅ Normalized {updated:,} hadiths in {time.time() - start_time:.2f} seconds\n")
+        except mysql.connector.Error as err:
+            print(f"\n❌ Error during backfill: {err}")
+            connection.rollback()
+            sys.exit(1)
+        finally:
+            cursor.close()
+            connection.close()
+            print("🔌 Database connection closed\n")
+        return
+
     try:
         start_time = time.time()
-        total_hadiths = 0
-        total_chapters = 0
+        timings = CollectionTimings()
 
         # Import each collection
-        for collection in HADITH_COLLECTIONS:
-            hadiths, chapters = import_hadith_collection(cursor, connection, collection)
-            total_hadiths += hadiths
-            total_chapters += chapters
+        with bulk_load.deferred_indexes(cursor, connection, ['hadiths'],
+                                        enabled=args.defer_indexes) as index_timings:
+            load_start = time.time()
+            delta = DeltaSummary() if args.delta else None
+            journal = ImportJournal(cursor, connection, 'hadith', resume=args.resume)
+            if args.workers > 1:
+                workers = min(args.workers, len(HADITH_COLLECTIONS))
+                print(f"🧵 Importing with {workers} workers on a connection pool")
+                pool = create_connection_pool(workers, allow_local_infile=(args.engine == 'load-data'))
+                total_hadiths, total_chapters = import_collections_parallel(
+                    cursor, connection, pool, HADITH_COLLECTIONS, workers,
+                    delta=delta, journal=journal, timings=timings, stream=args.stream
+                )
+            else:
+                total_hadiths, total_chapters = import_collections(
+                    cursor, connection, HADITH_COLLECTIONS,
+                    fetch_workers=args.fetch_workers, queue_size=args.queue_size,
+                    delta=delta, journal=journal, timings=timings, stream=args.stream
+                )
+            load_time = time.time() - load_start
 
         elapsed_time = time.time() - start_time
 
@@ -285,6 +718,8 @@ def main():
         print(f"  - Collections: {collection_count}")
         print(f"  - Chapters: {chapter_count}")
         print(f"  - Total Hadiths: {hadith_count}")
+        if delta is not None:
+            print(f"  - Delta: {delta}")
         print(f"\nBreakdown by Collection:")
 
         cursor.execute("""
@@ -296,7 +731,12 @@ def main():
         for row in cursor.fetchall():
             print(f"  - {row[0]}: {row[1]:,} hadiths")
 
+        timings.print_summary(load_time)
+
         print(f"\nTime Elapsed: {elapsed_time:.2f} seconds")
+        print(f"  - Row load: {load_time:.2f} seconds")
+        print(f"  - Index build: {index_timings.build_seconds:.2f} seconds "
+              f"({index_timings.rebuilt} index(es))")
         print("\n✅ You can now query the hadith database!")
         print("="*70 + "\n")
 
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Hadith Translations Importer
+=========================================================
+
+This script imports hadith translations in any language served by the
+hadith-api CDN (Urdu, Indonesian, Turkish, Bengali, ...) into the
+hadith_editions / hadith_data tables.
+
+Run import_hadith.py first: translations are attached to the hadiths it
+created, matched on hadith number.
+
+Features:
+- Discovers the available (collection, language) editions from editions.json
+- Imports any set of languages and collections in parallel, one pooled
+  connection per worker
+- Streams every edition (flat memory) and joins it to the stored hadiths
+  with a hash index, reporting hadiths missing on either side
+- Same engine / deferred index / delta / resume options as the other importers
+
+Data Source: fawazahmed0/hadith-api CDN
+
+Usage:
+    python import_hadith_translations.py --list                 # show available languages
+    python import_hadith_translations.py --languages urd ind tur ben
+    python import_hadith_translations.py --languages urd --collections bukhari muslim
+    python import_hadith_translations.py --workers 8 --engine load-data --defer-indexes
+    python import_hadith_translations.py --languages urd --delta
+
+Requirements:
+    pip install mysql-connector-python requests
+"""
+
+import argparse
+import mysql.connector
+import mysql.connector.pooling
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+import bulk_load
+import http_client
+import json_stream
+from bulk_load import insert_stream
+from delta_import import DeltaSummary, content_hash, delta_upsert_stream, existing_hashes
+from hadith_align import align_editions
+from import_hadith import (CDN_BASE, DB_CONFIG, HADITH_COLLECTIONS, MAX_POOL_SIZE, CollectionTimings,
+                           get_collection_id)
+from import_journal import ImportJournal
+
+# ============================================================================
+# API CONFIGURATION
+# ============================================================================
+
+CATALOG_URL = CDN_BASE + '.json'  # .../editions.json
+
+# Stored in the hadiths table itself by import_hadith.py
+BASE_LANGUAGES = ('ara', 'eng')
+
+# ============================================================================
+# CATALOG
+# ============================================================================
+
+def fetch_catalog() -> List[Dict[str, str]]:
+    """
+    List every translation edition of the six collections:
+    [{'slug': 'urd-bukhari', 'collection': 'bukhari', 'language': 'urd', ...}]
+    """
+    catalog = http_client.get_json(CATALOG_URL)
+    collections = {c['identifier']: c['slug'] for c in HADITH_COLLECTIONS}
+    editions = []
+
+    for identifier, book in catalog.items():
+        if identifier not in collections:
+            continue
+        for entry in book.get('collection', []):
+            slug = entry['name']
+            language = slug.split('-', 1)[0]
+            editions.append({
+                'slug': slug,
+                'identifier': identifier,
+                'collection': collections[identifier],
+                'language': language,
+                'language_name': entry.get('language'),
+                'author': entry.get('author'),
+            })
+
+    return editions
+
+def select_editions(catalog: List[Dict[str, str]], languages: Optional[List[str]],
+                    collections: Optional[List[str]]) -> List[Dict[str, str]]:
+    """
+    Editions matching the requested languages (default: all but ara/eng) and
+    collections.
+
+    hadith_editions holds one edition per (collection, language), so when the
+    CDN serves several (e.g. urd-bukhari and urd-bukhari1) only the first is
+    kept and the others are reported as skipped.
+    """
+    selected = []
+    chosen: Dict[Tuple[str, str], str] = {}
+    for edition in catalog:
+        if languages and edition['language'] not in languages:
+            continue
+        if not languages and edition['language'] in BASE_LANGUAGES:
+            continue
+        if collections and edition['collection'] not in collections:
+            continue
+        key = (edition['collection'], edition['language'])
+        if key in chosen:
+            print(f"   ⚠ Skipping {edition['slug']}: {chosen[key]} already provides "
+                  f"{edition['language']} {edition['collection']}")
+            continue
+        chosen[key] = edition['slug']
+        selected.append(edition)
+
+    if languages:
+        available = {(e['language'], e['collection']) for e in catalog}
+        for language in languages:
+            for collection in collections or [c['slug'] for c in HADITH_COLLECTIONS]:
+                if (language, collection) not in available:
+                    print(f"   ⚠ No {language} edition of {collection} on the CDN")
+    return selected
+
+def print_catalog(catalog: List[Dict[str, str]]):
+    languages: Dict[str, List[str]] = {}
+    names = {}
+    for edition in catalog:
+        languages.setdefault(edition['language'], []).append(edition['collection'])
+        names[edition['language']] = edition['language_name']
+    print(f"\n{'code':<6} {'language':<14} collections")
+    for language in sorted(languages):
+        print(f"{language:<6} {names[language] or '':<14} {', '.join(languages[language])}")
+
+# ============================================================================
+# MAIN IMPORT FUNCTIONS
+# ============================================================================
+
+def ensure_hadith_edition(cursor, connection, edition: Dict[str, str], collection_id: int) -> Optional[int]:
+    """
+    Create the hadith_editions row if needed and return its id.
+
+    Returns None (with a warning) when an earlier run stored a different
+    edition for the same (collection, language): the upsert would otherwise
+    hand back that edition's id and its rows would swallow these ones.
+    """
+    cursor.execute("SELECT slug FROM hadith_editions WHERE collection_id = %s AND language = %s",
+                   (collection_id, edition['language']))
+    row = cursor.fetchone()
+    if row and row[0] != edition['slug']:
+        print(f"   ⚠ Skipping {edition['slug']}: {row[0]} is already stored as the "
+              f"{edition['language']} edition of {edition['collection']}")
+        return None
+
+    cursor.execute("""
+        INSERT INTO hadith_editions (slug, collection_id, language, language_name, author, source_api)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE id=LAST_INSERT_ID(id)
+    """, (edition['slug'], collection_id, edition['language'], edition['language_name'],
+          edition['author'], CDN_BASE))
+
+    edition_id = cursor.lastrowid
+    if edition_id == 0:
+        cursor.execute("SELECT id FROM hadith_editions WHERE slug = %s", (edition['slug'],))
+        edition_id = cursor.fetchone()[0]
+
+    connection.commit()
+    return edition_id
+
+def load_hadith_refs(cursor, collection_id: int) -> List[Dict[str, Any]]:
+    """
+    Stored hadiths of a collection as join inputs ({'hadithnumber', 'id'}).
+
+    import_hadith.py stores reference_number as the hadith_key of the Arabic
+    hadith, so it joins as-is; rows imported before that stored integral
+    numbers as e.g. '1.0', which are folded to '1' the way hadith_key does.
+    """
+    cursor.execute("SELECT reference_number, id FROM hadiths WHERE collection_id = %s", (collection_id,))
+    refs = []
+    for reference, hadith_id in cursor.fetchall():
+        if reference.endswith('.0') and reference[:-2].isdigit():
+            reference = reference[:-2]
+        refs.append({'hadithnumber': reference, 'id': hadith_id})
+    return refs
+
+def translation_rows(edition: Dict[str, str], edition_id: int,
+                     stored: List[Dict[str, Any]]) -> Iterator[tuple]:
+    """
+    (hadith_id, edition_id, text, content_hash) tuples, streamed from the
+    edition and joined to the stored hadiths on hadith number.
+    """
+    chunks = http_client.iter_text(f"{CDN_BASE}/{edition['slug']}.json")
+    translated = (hadith for _, hadith in json_stream.iter_items(chunks, ('hadiths', '*')))
+
+    aligned = align_editions({edition['language']: translated, 'db': stored},
+                             probe=edition['language'], label=edition['slug'])
+    for match in aligned:
+        hadith, row = match[edition['language']], match['db']
+        if hadith is None or row is None or not hadith.get('text'):
+            continue
+        yield (row['id'], edition_id, hadith['text'], content_hash((hadith['text'],)))
+
+def import_edition(cursor, connection, edition: Dict[str, str], collection_id: int, edition_id: int,
+                   delta: Optional[DeltaSummary] = None,
+                   journal: Optional[ImportJournal] = None) -> int:
+    """Stream one translation edition into hadith_data and commit."""
+    slug = edition['slug']
+    print(f"\n📥 Importing {slug}...")
+
+    rows = translation_rows(edition, edition_id, load_hadith_refs(cursor, collection_id))
+    columns = ['hadith_id', 'edition_id', 'text', 'content_hash']
+    if delta is not None:
+        key_columns = ['hadith_id', 'edition_id']
+        existing = existing_hashes(cursor, 'hadith_data', key_columns, 'edition_id = %s', (edition_id,))
+        summary, total_rows = delta_upsert_stream(cursor, 'hadith_data', columns, rows, key_columns, existing)
+        delta.add(summary)
+        inserted = summary.written
+    else:
+        offset = journal.resume_offset(slug) if journal else 0
+        if offset:
+            print(f"   ⏩ Resuming after {offset:,} committed rows")
+        on_batch = journal.batch_committer(slug, offset) if journal else None
+        inserted, total_rows = insert_stream(cursor, 'hadith_data', columns, rows,
+                                             skip=offset, on_batch=on_batch)
+    if journal:
+        journal.complete(slug, total_rows)
+    connection.commit()
+
+    print(f"   ✅ Completed {slug} ({inserted:,} translations)")
+    return inserted
+
+def import_editions(cursor, connection, pool, editions: List[Dict[str, str]], workers: int,
+                    delta: Optional[DeltaSummary] = None,
+                    journal: Optional[ImportJournal] = None,
+                    timings: Optional[CollectionTimings] = None) -> int:
+    """
+    Import editions concurrently, one pooled connection per worker thread.
+
+    Edition rows are created up front on the coordinating connection; each
+    worker then streams, joins and inserts one edition in its own
+    transactions. The first failure cancels editions not yet started.
+    """
+    if journal:
+        for edition in editions:
+            if journal.is_completed(edition['slug']):
+                print(f"   ⏭  Skipping {edition['slug']} (completed in an earlier run)")
+        editions = [e for e in editions if not journal.is_completed(e['slug'])]
+
+    collection_ids = {c['slug']: get_collection_id(cursor, c['slug']) for c in HADITH_COLLECTIONS}
+    edition_ids = {e['slug']: ensure_hadith_edition(cursor, connection, e, collection_ids[e['collection']])
+                   for e in editions}
+    editions = [e for e in editions if edition_ids[e['slug']] is not None]
+    timings = timings or CollectionTimings()
+
+    def work(edition) -> Tuple[int, Optional[DeltaSummary]]:
+        slug = edition['slug']
+        worker_delta = DeltaSummary() if delta is not None else None
+        worker_connection = pool.get_connection()
+        worker_cursor = worker_connection.cursor(buffered=True)
+        try:
+            worker_journal = journal.for_connection(worker_cursor, worker_connection) if journal else None
+            with timings.phase(slug, 'store'):
+                inserted = import_edition(worker_cursor, worker_connection, edition,
+                                          collection_ids[edition['collection']], edition_ids[slug],
+                                          worker_delta, worker_journal)
+            timings.hadiths[slug] = inserted
+            return inserted, worker_delta
+        except Exception:
+            worker_connection.rollback()
+            raise
+        finally:
+            worker_cursor.close()
+            worker_connection.close()  # returns it to the pool
+
+    total = 0
+    executor = ThreadPoolExecutor(max_workers=max(1, min(workers, len(editions))))
+    try:
+        futures = [executor.submit(work, edition) for edition in editions]
+        for future in futures:
+            inserted, worker_delta = future.result()
+            total += inserted
+            if worker_delta is not None:
+                delta.add(worker_delta)
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+
+    return total
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Import hadith translations into IslamicKnowledgeDB")
+    parser.add_argument('--languages', nargs='+', metavar='CODE',
+                        help="CDN language codes to import (default: every language except ara/eng)")
+    parser.add_argument('--collections', nargs='+', metavar='SLUG',
+                        choices=[c['slug'] for c in HADITH_COLLECTIONS],
+                        help="Only these collections (default: all six)")
+    parser.add_argument('--list', action='store_true',
+                        help="Print the available languages and exit")
+    parser.add_argument('--workers', type=int, default=4,
+                        help=f"Editions imported in parallel, each on its own pooled connection "
+                             f"(max {MAX_POOL_SIZE})")
+    http_client.add_cache_arguments(parser)
+    http_client.add_rate_limit_argument(parser)
+    bulk_load.add_engine_argument(parser)
+    bulk_load.add_defer_indexes_argument(parser)
+    parser.add_argument('--delta', action='store_true',
+                        help="Compare content hashes and upsert only new or changed translations")
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip editions finished by an earlier run and continue mid-edition")
+    args = parser.parse_args()
+    if not 1 <= args.workers <= MAX_POOL_SIZE:
+        parser.error(f"--workers must be between 1 and {MAX_POOL_SIZE}")
+    return args
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+    http_client.configure_cache_from_args(args)
+    http_client.configure_rate_limit(args.rate_limit)
+    bulk_load.set_engine(args.engine)
+
+    print("\n" + "="*70)
+    print("ISLAMIC KNOWLEDGE DATABASE - HADITH TRANSLATIONS IMPORTER")
+    print("="*70)
+    print("\nData Source: fawazahmed0/hadith-api CDN")
+    print("Target Database: IslamicKnowledgeDB")
+
+    print("\n📚 Reading edition catalog...")
+    catalog = fetch_catalog()
+    if args.list:
+        print_catalog(catalog)
+        return
+    editions = select_editions(catalog, args.languages, args.collections)
+    if not editions:
+        print("   ❌ No editions match the given --languages/--collections")
+        sys.exit(1)
+    languages = sorted({e['language'] for e in editions})
+    print(f"   ✅ {len(editions)} editions in {len(languages)} language(s): {', '.join(languages)}")
+    print("="*70)
+
+    # Connect to database
+    print("\n🔌 Connecting to MySQL database...")
+    allow_local_infile = args.engine == 'load-data'
+    workers = min(args.workers, len(editions))
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG, allow_local_infile=allow_local_infile)
+        cursor = connection.cursor(buffered=True)
+        pool = mysql.connector.pooling.MySQLConnectionPool(
+            pool_name='hadith_translations', pool_size=workers,
+            allow_local_infile=allow_local_infile, **DB_CONFIG
+        )
+        print("   ✅ Connected successfully\n")
+    except mysql.connector.Error as err:
+        print(f"   ❌ Error: {err}")
+        sys.exit(1)
+
+    try:
+        start_time = time.time()
+        timings = CollectionTimings()
+        http_client.configure_session(workers * 2)
+
+        with bulk_load.deferred_indexes(cursor, connection, ['hadith_data'],
+                                        enabled=args.defer_indexes) as index_timings:
+            load_start = time.time()
+            delta = DeltaSummary() if args.delta else None
+            journal = ImportJournal(cursor, connection, 'hadith_translations', resume=args.resume)
+            print(f"🧵 Importing with {workers} workers on a connection pool")
+            import_editions(cursor, connection, pool, editions, workers,
+                            delta=delta, journal=journal, timings=timings)
+            load_time = time.time() - load_start
+
+        elapsed_time = time.time() - start_time
+
+        # Summary
+        print("\n" + "="*70)
+        print("IMPORT COMPLETED SUCCESSFULLY!")
+        print("="*70)
+
+        cursor.execute("""
+            SELECT he.language, COUNT(DISTINCT he.id), COUNT(hd.id)
+            FROM hadith_editions he
+            LEFT JOIN hadith_data hd ON hd.edition_id = he.id
+            GROUP BY he.language
+            ORDER BY he.language
+        """)
+
+        print(f"\nStatistics:")
+        for language, edition_count, row_count in cursor.fetchall():
+            print(f"  - {language}: {edition_count} edition(s), {row_count:,} hadiths")
+        if delta is not None:
+            print(f"  - Delta: {delta}")
+
+        timings.print_summary(load_time)
+
+        print(f"\nTime Elapsed: {elapsed_time:.2f} seconds")
+        print(f"  - Row load: {load_time:.2f} seconds")
+        print(f"  - Index build: {index_timings.build_seconds:.2f} seconds "
+              f"({index_timings.rebuilt} index(es))")
+        print("\n✅ Translations are ready to query!")
+        print("="*70 + "\n")
+
+    except Exception as e:
+        print(f"\n❌ Error during import: {e}")
+        import traceback
+        traceback.print_exc()
+        connection.rollback()
+        sys.exit(1)
+    finally:
+        cursor.close()
+        connection.close()
+        print("🔌 Database connection closed\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Import Journal
+===========================================
+
+Checkpoints for restartable imports, stored in the import_journal table.
+
+Each importer records its units of work (a hadith collection, a Quran
+edition, ...) and, after every committed batch, how many rows of that unit
+are safely in the database. The checkpoint is written in the same
+transaction as the batch it describes, so the journal never runs ahead
+of the data.
+
+A normal run clears the importer's journal and starts over; a --resume run
+skips completed units and restarts a partially imported unit at its last
+committed batch.
+
+Requirements:
+    pip install mysql-connector-python
+"""
+
+import copy
+from typing import Callable, Dict, Tuple
+
+from bulk_load import table_exists
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+JOURNAL_TABLE = 'import_journal'
+
+STATUS_IN_PROGRESS = 'in_progress'
+STATUS_COMPLETED = 'completed'
+
+# ============================================================================
+# JOURNAL
+# ============================================================================
+
+class ImportJournal:
+    """Per-importer view of the import_journal table."""
+
+    def __init__(self, cursor, connection, importer: str, resume: bool = False):
+        self.cursor = cursor
+        self.connection = connection
+        self.importer = importer
+        self.resume = resume
+        self.entries: Dict[str, Tuple[str, int]] = {}
+
+        self._ensure_table()
+        if resume:
+            self._load()
+        else:
+            self.cursor.execute(f"DELETE FROM {JOURNAL_TABLE} WHERE importer = %s", (importer,))
+            self.connection.commit()
+
+    def for_connection(self, cursor, connection) -> 'ImportJournal':
+        """
+        Same journal, writing through another connection (one per worker
+        thread). Entries are shared; each worker only touches its own units.
+        """
+        journal = copy.copy(self)
+        journal.cursor = cursor
+        journal.connection = connection
+        return journal
+
+    def _ensure_table(self):
+        """Create the journal table (see schema.sql) if it is missing."""
+        if table_exists(self.cursor, JOURNAL_TABLE):
+            return
+        self.cursor.execute(f"""
+            CREATE TABLE {JOURNAL_TABLE} (
+              importer VARCHAR(32) NOT NULL,
+              unit VARCHAR(100) NOT NULL,
+              status ENUM('{STATUS_IN_PROGRESS}', '{STATUS_COMPLETED}') NOT NULL,
+              rows_committed INT UNSIGNED NOT NULL DEFAULT 0,
+              updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+              PRIMARY KEY (importer, unit)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """)
+
+    def _load(self):
+        self.cursor.execute(f"""
+            SELECT unit, status, rows_committed FROM {JOURNAL_TABLE}
+            WHERE importer = %s
+        """, (self.importer,))
+        self.entries = {unit: (status, rows) for unit, status, rows in self.cursor.fetchall()}
+
+        completed = sum(1 for status, _ in self.entries.values() if status == STATUS_COMPLETED)
+        partial = len(self.entries) - completed
+        print(f"   📒 Resuming {self.importer}: {completed} unit(s) completed, {partial} partially imported")
+
+    # ------------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------------
+
+    def is_completed(self, unit: str) -> bool:
+        return self.entries.get(unit, (None, 0))[0] == STATUS_COMPLETED
+
+    def resume_offset(self, unit: str) -> int:
+        """Rows of `unit` already committed by an earlier run (0 if none)."""
+        status, rows = self.entries.get(unit, (None, 0))
+        return rows if status == STATUS_IN_PROGRESS else 0
+
+    # ------------------------------------------------------------------------
+    # Updates (the caller commits, together with the data they describe)
+    # ------------------------------------------------------------------------
+
+    def _write(self, unit: str, status: str, rows_committed: int):
+        self.cursor.execute(f"""
+            INSERT INTO {JOURNAL_TABLE} (importer, unit, status, rows_committed)
+            VALUES (%s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE status = VALUES(status), rows_committed = VALUES(rows_committed)
+        """, (self.importer, unit, status, rows_committed))
+        self.entries[unit] = (status, rows_committed)
+
+    def checkpoint(self, unit: str, rows_committed: int):
+        """Record progress inside the current transaction."""
+        self._write(unit, STATUS_IN_PROGRESS, rows_committed)
+
+    def complete(self, unit: str, rows_committed: int = 0):
+        """Mark `unit` finished inside the current transaction."""
+        self._write(unit, STATUS_COMPLETED, rows_committed)
+
+    def batch_committer(self, unit: str, offset: int = 0) -> Callable[[int], None]:
+        """
+        Return an on_batch callback for bulk_load.batch_insert that
+        checkpoints `offset + rows done` and commits after every batch.
+        """
+        def on_batch(rows_done: int):
+            self.checkpoint(unit, offset + rows_done)
+            self.connection.commit()
+        return on_batch
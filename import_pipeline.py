@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Import Pipeline
+============================================
+
+Producer/consumer pipeline used by the importers to overlap network
+downloads, tuple preparation and MySQL inserts.
+
+    items -> [fetch] -> queue -> [transform] -> queue -> sink (insert + commit)
+
+Features:
+- Each stage runs in its own thread(s); the sink runs on the calling thread,
+  so the MySQL connection/cursor never crosses threads
+- Bounded queues between stages give backpressure: a fast producer blocks
+  instead of piling payloads up in memory
+- Per-stage counters (items, rows, busy time, time starved for input and
+  time blocked on output) to show which stage is the bottleneck
+- The first exception in any stage stops the whole pipeline and is
+  re-raised to the caller
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Optional
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_QUEUE_SIZE = 2  # Payloads buffered between two stages
+POLL_INTERVAL = 0.1  # seconds
+
+_DONE = object()
+
+class PipelineStopped(Exception):
+    """Raised inside worker threads once another stage has failed."""
+
+# ============================================================================
+# STATISTICS
+# ============================================================================
+
+class StageStats:
+    """Throughput counters for one pipeline stage."""
+
+    def __init__(self, name: str, workers: int = 1):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.rows = 0
+        self.busy_seconds = 0.0
+        self.starved_seconds = 0.0  # waiting on an empty input queue
+        self.blocked_seconds = 0.0  # waiting on a full output queue (backpressure)
+        self._lock = threading.Lock()
+
+    def record(self, rows: int, busy: float):
+        with self._lock:
+            self.items += 1
+            self.rows += rows
+            self.busy_seconds += busy
+
+    def add_wait(self, starved: float = 0.0, blocked: float = 0.0):
+        with self._lock:
+            self.starved_seconds += starved
+            self.blocked_seconds += blocked
+
+    @property
+    def rows_per_second(self) -> float:
+        """Rows processed per second of busy time (per worker)."""
+        return self.rows / self.busy_seconds if self.busy_seconds else 0.0
+
+def print_stats(stats: List[StageStats], elapsed: float):
+    """Print a per-stage throughput table and flag the bottleneck stage."""
+    bottleneck = max(stats, key=lambda s: s.busy_seconds / s.workers, default=None)
+
+    print(f"\n   ⏱  Pipeline stages ({elapsed:.2f}s wall clock):")
+    print(f"      {'stage':<10} {'items':>6} {'rows':>9} {'busy s':>8} {'rows/s':>9} "
+          f"{'starved s':>10} {'blocked s':>10}")
+    for s in stats:
+        marker = '  ← bottleneck' if s is bottleneck else ''
+        print(f"      {s.name:<10} {s.items:>6} {s.rows:>9,} {s.busy_seconds:>8.2f} "
+              f"{s.rows_per_second:>9,.0f} {s.starved_seconds:>10.2f} {s.blocked_seconds:>10.2f}{marker}")
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+
+class _Stage:
+    def __init__(self, name: str, func: Callable[[Any], Any], workers: int,
+                 rows: Optional[Callable[[Any], int]]):
+        self.name = name
+        self.func = func
+        self.workers = max(workers, 1)
+        self.rows = rows or (lambda result: 1)
+        self.stats = StageStats(name, self.workers)
+
+class Pipeline:
+    """
+    A chain of threaded stages feeding a sink on the calling thread.
+
+    Stage functions take one item and return the item for the next stage;
+    returning None drops the item. `rows` callables tell the counters how
+    many rows an output represents (defaults to 1 per item).
+    """
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.queue_size = max(queue_size, 1)
+        self.stages: List[_Stage] = []
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._error_lock = threading.Lock()
+
+    def add_stage(self, name: str, func: Callable[[Any], Any], workers: int = 1,
+                  rows: Optional[Callable[[Any], int]] = None) -> 'Pipeline':
+        self.stages.append(_Stage(name, func, workers, rows))
+        return self
+
+    # ------------------------------------------------------------------------
+    # Queue helpers (poll so a failure elsewhere can interrupt blocking calls)
+    # ------------------------------------------------------------------------
+
+    def _put(self, q: queue.Queue, item: Any, stats: Optional[StageStats] = None):
+        start = time.perf_counter()
+        while True:
+            if self._stop.is_set():
+                raise PipelineStopped()
+            try:
+                q.put(item, timeout=POLL_INTERVAL)
+                break
+            except queue.Full:
+                continue
+        if stats:
+            stats.add_wait(blocked=time.perf_counter() - start)
+
+    def _get(self, q: queue.Queue, stats: Optional[StageStats] = None) -> Any:
+        start = time.perf_counter()
+        while True:
+            if self._stop.is_set():
+                raise PipelineStopped()
+            try:
+                item = q.get(timeout=POLL_INTERVAL)
+                break
+            except queue.Empty:
+                continue
+        if stats:
+            stats.add_wait(starved=time.perf_counter() - start)
+        return item
+
+    def _fail(self, exc: BaseException):
+        with self._error_lock:
+            if self._error is None:
+                self._error = exc
+        self._stop.set()
+
+    # ------------------------------------------------------------------------
+    # Threads
+    # ------------------------------------------------------------------------
+
+    def _feed(self, items: Iterable[Any], out_q: queue.Queue):
+        try:
+            for item in items:
+                self._put(out_q, item)
+            self._put(out_q, _DONE)
+        except PipelineStopped:
+            pass
+        except BaseException as exc:
+            self._fail(exc)
+
+    def _work(self, stage: _Stage, in_q: queue.Queue, out_q: queue.Queue, remaining: List[int],
+              remaining_lock: threading.Lock):
+        try:
+            while True:
+                item = self._get(in_q, stage.stats)
+                if item is _DONE:
+                    self._put(in_q, _DONE)  # let sibling workers see it too
+                    with remaining_lock:
+                        remaining[0] -= 1
+                        last = remaining[0] == 0
+                    if last:
+                        self._put(out_q, _DONE)
+                    return
+
+                start = time.perf_counter()
+                result = stage.func(item)
+                if result is None:
+                    stage.stats.record(0, time.perf_counter() - start)
+                    continue
+                stage.stats.record(stage.rows(result), time.perf_counter() - start)
+                self._put(out_q, result, stage.stats)
+        except PipelineStopped:
+            pass
+        except BaseException as exc:
+            self._fail(exc)
+
+    # ------------------------------------------------------------------------
+    # Run
+    # ------------------------------------------------------------------------
+
+    def run(self, items: Iterable[Any], sink: Callable[[Any], Any], sink_name: str = 'insert',
+            sink_rows: Optional[Callable[[Any], int]] = None) -> List[StageStats]:
+        """
+        Push `items` through every stage into `sink` (called on this thread).
+
+        Returns the per-stage statistics, sink last.
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._feed, args=(items, queues[0]), daemon=True)]
+        for i, stage in enumerate(self.stages):
+            remaining, remaining_lock = [stage.workers], threading.Lock()
+            for _ in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[i], queues[i + 1], remaining, remaining_lock),
+                    daemon=True,
+                ))
+
+        sink_stats = StageStats(sink_name)
+        sink_rows = sink_rows or (lambda result: 1)
+
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                item = self._get(queues[-1], sink_stats)
+                if item is _DONE:
+                    break
+                start = time.perf_counter()
+                result = sink(item)
+                sink_stats.record(sink_rows(result), time.perf_counter() - start)
+        except PipelineStopped:
+            pass
+        except BaseException as exc:
+            self._fail(exc)
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+
+        if self._error is not None:
+            raise self._error
+
+        return [stage.stats for stage in self.stages] + [sink_stats]
@@ -7,25 +7,53 @@ This script imports complete Quran data into IslamicKnowledgeDB MySQL database.
 
 Features:
 - Imports all 114 Surahs with metadata
-- Imports all 6,236 Ayahs with Arabic text
+- Imports all 6,236 Ayahs with Arabic text (text_clean: harakat, Quranic marks,
+  tatweel stripped and letter variants folded by arabic_normalizer)
 - Imports multiple English translations (Sahih International, Yusuf Ali, etc.)
+- Catalog mode: discovers every text edition listed by /edition (translations,
+  transliterations, tafsirs) and imports the ones matching --language/--type
 - Uses batch inserts for optimal performance
+- Downloads all editions concurrently over a pooled keep-alive session
+- Pipelines translation downloads, tuple preparation and inserts
+- Caches API responses on disk (revalidated with ETag/Last-Modified)
+- Delta mode: only rows whose content hash changed are written
 - Handles duplicate entries gracefully
 
 Data Source: AlQuran.cloud API (https://api.alquran.cloud)
 
 Usage:
     python import_quran.py
+    python import_quran.py --concurrency 1    # fetch editions one at a time
+    python import_quran.py --offline          # replay from .http_cache only
+    python import_quran.py --engine load-data # bulk-load via LOAD DATA LOCAL INFILE
+    python import_quran.py --defer-indexes    # build FULLTEXT indexes once at the end
+    python import_quran.py --delta            # upsert only new/changed rows
+    python import_quran.py --resume           # continue after a crashed/killed run
+    python import_quran.py --stream           # parse ayahs incrementally (flat memory)
+    python import_quran.py --catalog                          # every text edition
+    python import_quran.py --catalog --language ur id --type translation
+    python import_quran.py --catalog --rate-limit 2           # be gentler on the API
 
 Requirements:
     pip install mysql-connector-python requests
 """
 
+import argparse
+import itertools
 import mysql.connector
-import requests
 import sys
 import time
-from typing import List, Dict, Any
+from array import array
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+import bulk_load
+import http_client
+import json_stream
+from arabic_normalizer import BATCH_TEXTS as NORMALIZE_BATCH, normalize_many
+from bulk_load import batch_insert, batch_upsert, chunked, insert_stream
+from delta_import import DeltaSummary, content_hash, delta_upsert, delta_upsert_stream, existing_hashes
+from import_journal import ImportJournal
+from import_pipeline import DEFAULT_QUEUE_SIZE, Pipeline, print_stats
 
 # ============================================================================
 # DATABASE CONFIGURATION
@@ -54,7 +82,11 @@ TRANSLATION_EDITIONS = [
     {'identifier': 'en.clearquran', 'name': 'The Clear Quran', 'language': 'en', 'type': 'translation'},
 ]
 
-BATCH_SIZE = 500  # Number of records to insert at once
+# Edition types from /edition that are stored in ayah_data (editions.type values).
+# 'quran' editions are alternative Arabic scripts and 'versebyverse' ones are
+# audio recitations, so neither is offered in catalog mode.
+CATALOG_TYPES = ('translation', 'tafsir', 'transliteration')
+CATALOG_FORMAT = 'text'
 
 # ============================================================================
 # UTILITY FUNCTIONS
@@ -62,89 +94,192 @@ BATCH_SIZE = 500  # Number of records to insert at once
 
 def fetch_api(url: str) -> Dict[str, Any]:
     """Fetch data from AlQuran.cloud API with retry logic."""
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            print(f"    Fetching: {url}")
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            if data.get('code') == 200:
-                return data['data']
-            else:
-                raise Exception(f"API returned code {data.get('code')}")
-        except requests.RequestException as e:
-            print(f"    ⚠ Attempt {attempt + 1}/{max_retries} failed: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
-            else:
-                raise
-    raise Exception("Max retries exceeded")
-
-def remove_diacritics(arabic_text: str) -> str:
-    """Remove Arabic diacritics (harakat) from text for simpler searching."""
-    diacritics = [
-        '\u064B',  # Fathatan
-        '\u064C',  # Dammatan
-        '\u064D',  # Kasratan
-        '\u064E',  # Fatha
-        '\u064F',  # Damma
-        '\u0650',  # Kasra
-        '\u0651',  # Shadda
-        '\u0652',  # Sukun
-        '\u0653',  # Maddah
-        '\u0654',  # Hamza above
-        '\u0655',  # Hamza below
-        '\u0656',  # Subscript alef
-        '\u0657',  # Inverted damma
-        '\u0658',  # Mark noon ghunna
-    ]
-    clean_text = arabic_text
-    for diacritic in diacritics:
-        clean_text = clean_text.replace(diacritic, '')
-    return clean_text
-
-def batch_insert(cursor, table: str, columns: List[str], data: List[tuple], ignore_duplicates: bool = True):
-    """Perform batch insert with proper error handling."""
-    if not data:
-        return 0
-
-    placeholders = ', '.join(['%s'] * len(columns))
-    columns_str = ', '.join(columns)
-
-    ignore_clause = 'IGNORE' if ignore_duplicates else ''
-    sql = f"INSERT {ignore_clause} INTO {table} ({columns_str}) VALUES ({placeholders})"
-
-    inserted = 0
-    for i in range(0, len(data), BATCH_SIZE):
-        batch = data[i:i + BATCH_SIZE]
-        cursor.executemany(sql, batch)
-        inserted += cursor.rowcount
-        print(f"    📝 Inserted {min(i + BATCH_SIZE, len(data))}/{len(data)} records")
-
-    return inserted
+    data = http_client.get_json(url)
+    if data.get('code') == 200:
+        return data['data']
+    else:
+        raise Exception(f"API returned code {data.get('code')}")
+
+def source_urls() -> List[str]:
+    """All API URLs the importer needs, in import order."""
+    urls = [f"{API_BASE}/meta", f"{API_BASE}/quran/quran-uthmani"]
+    urls.extend(f"{API_BASE}/quran/{edition['identifier']}" for edition in TRANSLATION_EDITIONS)
+    return urls
+
+def prefetch_sources(concurrency: int, urls: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Download `urls` (default: /meta, quran-uthmani and every edition) in parallel."""
+    http_client.configure_session(concurrency)
+    return http_client.fetch_many(urls or source_urls(), fetch_api, concurrency)
+
+def get_source(url: str, sources: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a prefetched payload (releasing it) or fetch it on demand."""
+    if sources is not None and url in sources:
+        return sources.pop(url)
+    return fetch_api(url)
+
+def fetch_edition_catalog(languages: Optional[List[str]] = None,
+                          types: Iterable[str] = CATALOG_TYPES,
+                          edition_format: str = CATALOG_FORMAT) -> List[Dict[str, str]]:
+    """
+    Discover editions from the /edition endpoint, filtered by language, type
+    and format, as entries shaped like TRANSLATION_EDITIONS.
+    """
+    types = set(types)
+    editions = []
+    for entry in fetch_api(f"{API_BASE}/edition"):
+        if entry.get('format') != edition_format or entry.get('type') not in types:
+            continue
+        if languages and entry.get('language') not in languages:
+            continue
+        name = entry.get('englishName') or entry.get('name') or entry['identifier']
+        editions.append({
+            'identifier': entry['identifier'],
+            'name': name,
+            'language': entry['language'],
+            'type': entry['type'],
+            'author': name,
+        })
+    return editions
+
+def stream_surah_ayahs(url: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Yield (surah_number, ayah) from a /quran/{edition} response, parsed
+    incrementally from the network stream or its cached copy.
+    """
+    chunks = http_client.iter_text(url)
+    for context, ayah in json_stream.iter_items(chunks, ('data', 'surahs', '*', 'ayahs', '*')):
+        if context[0].get('code') != 200:
+            raise Exception(f"API returned code {context[0].get('code')}")
+        yield context[-1]['number'], ayah
 
 # ============================================================================
 # MAIN IMPORT FUNCTIONS
 # ============================================================================
 
-def import_surahs(cursor, connection) -> Dict[int, int]:
-    """Import all 114 Surahs into the database."""
+class QuranIds:
+    """
+    Database ids of surahs and ayahs without per-key dicts.
+
+    Rows are inserted with canonical ids - a surah's id is its number and an
+    ayah's id is its global number (1-6,236) - so ids are computed from the
+    per-surah ayah offsets (prefix sums of ayah_count) instead of being read
+    back after the insert. Tables filled before ids were allocated this way
+    keep their AUTO_INCREMENT ids; those are loaded once into flat arrays
+    indexed by the same (surah, ayah) offsets.
+    """
+
+    def __init__(self, ayah_counts: List[int]):
+        self.ayah_counts = array('H', ayah_counts)
+        self.offsets = array('H', itertools.accumulate(ayah_counts, initial=0))
+        self.surah_ids: Optional[array] = None  # None: id == surah_number
+        self.ayah_ids: Optional[array] = None   # None: id == global ayah number
+
+    @property
+    def total_ayahs(self) -> int:
+        return self.offsets[-1]
+
+    def ayah_index(self, surah_number: int, ayah_number: int) -> Optional[int]:
+        """0-based global position of an ayah, or None if it does not exist."""
+        if not 1 <= surah_number <= len(self.ayah_counts):
+            return None
+        if not 1 <= ayah_number <= self.ayah_counts[surah_number - 1]:
+            return None
+        return self.offsets[surah_number - 1] + ayah_number - 1
+
+    def surah_id(self, surah_number: int) -> Optional[int]:
+        if not 1 <= surah_number <= len(self.ayah_counts):
+            return None
+        if self.surah_ids is None:
+            return surah_number
+        return self.surah_ids[surah_number - 1] or None
+
+    def ayah_id(self, surah_number: int, ayah_number: int) -> Optional[int]:
+        index = self.ayah_index(surah_number, ayah_number)
+        if index is None:
+            return None
+        if self.ayah_ids is None:
+            return index + 1
+        return self.ayah_ids[index] or None
+
+def load_quran_ids(cursor) -> QuranIds:
+    """QuranIds for an already-imported surahs table (114 rows, no ayah scan)."""
+    cursor.execute("SELECT ayah_count FROM surahs ORDER BY surah_number")
+    ids = QuranIds([row[0] for row in cursor.fetchall()])
+    if not canonical_surah_ids(cursor):
+        load_surah_ids(cursor, ids)
+    if not canonical_ayah_ids(cursor):
+        load_ayah_ids(cursor, ids)
+    return ids
+
+def canonical_surah_ids(cursor) -> bool:
+    """True if every stored surah has id == surah_number (or there are none)."""
+    cursor.execute("SELECT COUNT(*) FROM surahs WHERE id <> surah_number")
+    return cursor.fetchone()[0] == 0
+
+def canonical_ayah_ids(cursor) -> bool:
+    """True if every stored ayah has id == its global number (or there are none)."""
+    cursor.execute("""
+        SELECT COUNT(*)
+        FROM ayahs a
+        JOIN (SELECT id, SUM(ayah_count) OVER (ORDER BY surah_number) - ayah_count AS ayahs_before
+              FROM surahs) s ON s.id = a.surah_id
+        WHERE a.id <> s.ayahs_before + a.ayah_number
+    """)
+    return cursor.fetchone()[0] == 0
+
+def load_surah_ids(cursor, ids: QuranIds):
+    """Fallback for pre-existing AUTO_INCREMENT surah ids."""
+    print("   ⚠ surahs ids are not canonical; loading them")
+    ids.surah_ids = array('i', [0]) * len(ids.ayah_counts)
+    cursor.execute("SELECT surah_number, id FROM surahs")
+    for surah_number, surah_id in cursor.fetchall():
+        if 1 <= surah_number <= len(ids.surah_ids):
+            ids.surah_ids[surah_number - 1] = surah_id
+
+def load_ayah_ids(cursor, ids: QuranIds):
+    """Fallback for pre-existing AUTO_INCREMENT ayah ids."""
+    print("   ⚠ ayahs ids are not canonical; loading them")
+    ids.ayah_ids = array('i', [0]) * ids.total_ayahs
+    cursor.execute("""
+        SELECT s.surah_number, a.ayah_number, a.id
+        FROM ayahs a JOIN surahs s ON s.id = a.surah_id
+    """)
+    for surah_number, ayah_number, ayah_id in cursor.fetchall():
+        index = ids.ayah_index(surah_number, ayah_number)
+        if index is not None:
+            ids.ayah_ids[index] = ayah_id
+
+def import_surahs(cursor, connection, sources: Optional[Dict[str, Any]] = None,
+                  delta: Optional[DeltaSummary] = None,
+                  journal: Optional[ImportJournal] = None) -> QuranIds:
+    """
+    Import all 114 Surahs into the database (refreshing metadata in delta mode).
+
+    Returns the QuranIds built from the metadata's ayah counts.
+    """
     print("\n" + "="*70)
     print("STEP 1: IMPORTING SURAHS")
     print("="*70)
 
+    if journal and journal.is_completed('surahs'):
+        print("\n⏭  Surahs completed in an earlier run")
+        return load_quran_ids(cursor)
+
     # Fetch Quran metadata
     print("\n📖 Fetching Quran metadata...")
-    meta_data = fetch_api(f"{API_BASE}/meta")
+    meta_data = get_source(f"{API_BASE}/meta", sources)
     surahs = meta_data['surahs']['references']
 
     print(f"   ✅ Retrieved {len(surahs)} Surahs\n")
 
+    ids = QuranIds([surah['numberOfAyahs'] for surah in sorted(surahs, key=lambda surah: surah['number'])])
+    canonical = canonical_surah_ids(cursor)
+
     # Prepare data for batch insert
     surah_data = []
     for surah in surahs:
         surah_data.append((
+            surah['number'],
             surah['number'],
             surah['name'],
             surah['englishName'],
@@ -154,141 +289,309 @@ def import_surahs(cursor, connection) -> Dict[int, int]:
 
     # Batch insert
     print("💾 Inserting Surahs into database...")
-    columns = ['surah_number', 'name_arabic', 'name_english', 'revelation_place', 'ayah_count']
-    inserted = batch_insert(cursor, 'surahs', columns, surah_data)
+    columns = ['id', 'surah_number', 'name_arabic', 'name_english', 'revelation_place', 'ayah_count']
+    if not canonical:
+        columns = columns[1:]
+        surah_data = [row[1:] for row in surah_data]
+    if delta is not None:
+        inserted = batch_upsert(cursor, 'surahs', columns, surah_data, columns[-4:])
+    else:
+        inserted = batch_insert(cursor, 'surahs', columns, surah_data)
+    if journal:
+        journal.complete('surahs', len(surah_data))
     connection.commit()
 
     print(f"\n✅ Successfully imported {inserted} Surahs")
 
-    # Create mapping of surah_number to id
-    cursor.execute("SELECT id, surah_number FROM surahs")
-    surah_map = {row[1]: row[0] for row in cursor.fetchall()}
-
-    return surah_map
-
-def import_ayahs(cursor, connection, surah_map: Dict[int, int]) -> Dict[int, int]:
-    """Import all Ayahs with Arabic text."""
-    print("\n" + "="*70)
-    print("STEP 2: IMPORTING AYAHS")
-    print("="*70)
-
-    # Fetch complete Quran with Uthmani script
-    print("\n📖 Fetching complete Quran with Arabic text...")
-    quran_data = fetch_api(f"{API_BASE}/quran/quran-uthmani")
-
-    print(f"   ✅ Retrieved Quran data\n")
+    if not canonical:
+        load_surah_ids(cursor, ids)
+    return ids
+
+def iter_ayah_rows(surah_ayahs: Iterable[Tuple[int, Dict[str, Any]]],
+                   ids: QuranIds) -> Iterator[tuple]:
+    """
+    Build ayahs tuples (canonical id first, content hash last) from
+    (surah_number, ayah) pairs.
+    """
+    missing = set()
+
+    # text_clean is normalized a batch at a time (one vectorized pass per batch)
+    for batch in chunked(surah_ayahs, NORMALIZE_BATCH):
+        cleaned = normalize_many([ayah['text'] for _, ayah in batch])
+        for (surah_number, ayah), text_clean in zip(batch, cleaned):
+            surah_id = ids.surah_id(surah_number)
+            index = ids.ayah_index(surah_number, ayah['numberInSurah'])
+
+            if not surah_id or index is None:
+                if (surah_number, index is None) not in missing:
+                    missing.add((surah_number, index is None))
+                    print(f"⚠ Warning: Surah {surah_number} "
+                          f"{'ayah beyond ayah_count' if surah_id else 'not found in database'}")
+                continue
 
-    # Prepare ayah data
-    print("💾 Preparing Ayah data for import...")
-    ayah_data = []
-    ayah_number_map = {}  # Maps ayah_key to database id
-
-    for surah_data in quran_data['surahs']:
-        surah_number = surah_data['number']
-        surah_id = surah_map.get(surah_number)
-
-        if not surah_id:
-            print(f"⚠ Warning: Surah {surah_number} not found in database")
-            continue
-
-        for ayah in surah_data['ayahs']:
             ayah_key = f"{surah_number}:{ayah['numberInSurah']}"
-            text_arabic = ayah['text']
-            text_clean = remove_diacritics(text_arabic)
-
-            ayah_data.append((
+            row = (
                 surah_id,
                 ayah['numberInSurah'],
                 ayah_key,
-                text_arabic,
+                ayah['text'],
                 text_clean,
                 ayah.get('juz'),
                 ayah.get('manzil'),
                 ayah.get('ruku'),
                 ayah.get('page')
-            ))
+            )
 
-    print(f"   ✅ Prepared {len(ayah_data)} Ayahs\n")
+            yield (index + 1,) + row + (content_hash(row[1:]),)
 
-    # Batch insert
-    print("💾 Inserting Ayahs into database...")
-    columns = ['surah_id', 'ayah_number', 'ayah_key', 'text_arabic', 'text_clean', 'juz', 'manzil', 'ruku', 'page']
-    inserted = batch_insert(cursor, 'ayahs', columns, ayah_data)
-    connection.commit()
+def import_ayahs(cursor, connection, ids: QuranIds,
+                 sources: Optional[Dict[str, Any]] = None,
+                 delta: Optional[DeltaSummary] = None,
+                 journal: Optional[ImportJournal] = None,
+                 stream: bool = False) -> QuranIds:
+    """
+    Import all Ayahs with Arabic text (only new/changed rows in delta mode).
 
-    print(f"\n✅ Successfully imported {inserted} Ayahs")
+    Ayahs get their global number as id, so `ids` needs no re-read of the
+    table afterwards (unless it still holds AUTO_INCREMENT ids).
 
-    # Create mapping of ayah_key to id
-    cursor.execute("SELECT id, ayah_key FROM ayahs")
-    ayah_key_map = {row[1]: row[0] for row in cursor.fetchall()}
-
-    return ayah_key_map
-
-def import_translations(cursor, connection, ayah_key_map: Dict[str, int]):
-    """Import translations for all Ayahs."""
+    With `stream`, ayahs are parsed from the response as they are inserted,
+    in fixed-size batches, instead of building the whole payload and row list.
+    """
     print("\n" + "="*70)
-    print("STEP 3: IMPORTING TRANSLATIONS")
+    print("STEP 2: IMPORTING AYAHS")
     print("="*70)
 
-    for edition in TRANSLATION_EDITIONS:
-        print(f"\n📖 Processing {edition['name']}...")
+    if journal and journal.is_completed('ayahs'):
+        print("\n⏭  Ayahs completed in an earlier run")
+        if not canonical_ayah_ids(cursor):
+            load_ayah_ids(cursor, ids)
+        return ids
 
-        # Step 1: Create or get edition
-        print("   1️⃣  Creating edition entry...")
-        edition_slug = edition['identifier']
-        cursor.execute("""
-            INSERT INTO editions (slug, name, language, type, author, source_api)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE id=LAST_INSERT_ID(id)
-        """, (edition_slug, edition['name'], edition['language'], edition['type'],
-              edition.get('author', edition['name']), API_BASE))
+    canonical = canonical_ayah_ids(cursor)
 
-        edition_id = cursor.lastrowid
-        if edition_id == 0:
-            cursor.execute("SELECT id FROM editions WHERE slug = %s", (edition_slug,))
-            edition_id = cursor.fetchone()[0]
+    url = f"{API_BASE}/quran/quran-uthmani"
+    if stream:
+        print("\n📖 Streaming complete Quran with Arabic text...\n")
+        ayah_data = iter_ayah_rows(stream_surah_ayahs(url), ids)
+    else:
+        # Fetch complete Quran with Uthmani script
+        print("\n📖 Fetching complete Quran with Arabic text...")
+        quran_data = get_source(url, sources)
 
-        connection.commit()
-        print(f"      ✅ Edition ID: {edition_id}")
+        print(f"   ✅ Retrieved Quran data\n")
+
+        # Prepare ayah data
+        print("💾 Preparing Ayah data for import...")
+        surah_ayahs = ((surah['number'], ayah) for surah in quran_data['surahs'] for ayah in surah['ayahs'])
+        ayah_data = list(iter_ayah_rows(surah_ayahs, ids))
+        del quran_data
+
+        print(f"   ✅ Prepared {len(ayah_data)} Ayahs\n")
+
+    # Batch insert
+    print("💾 Inserting Ayahs into database...")
+    columns = ['id', 'surah_id', 'ayah_number', 'ayah_key', 'text_arabic', 'text_clean',
+               'juz', 'manzil', 'ruku', 'page', 'content_hash']
+    if not canonical:
+        # Explicit ids could collide with rows stored under AUTO_INCREMENT ids
+        columns = columns[1:]
+        trimmed = (row[1:] for row in ayah_data)
+        ayah_data = list(trimmed) if isinstance(ayah_data, list) else trimmed
+    if delta is not None:
+        summary, total_rows = delta_upsert_stream(cursor, 'ayahs', columns, ayah_data, ['ayah_key'],
+                                                  existing_hashes(cursor, 'ayahs', ['ayah_key']))
+        delta.add(summary)
+        inserted = summary.written
+    else:
+        offset = journal.resume_offset('ayahs') if journal else 0
+        on_batch = journal.batch_committer('ayahs', offset) if journal else None
+        inserted, total_rows = insert_stream(cursor, 'ayahs', columns, ayah_data,
+                                             skip=offset, on_batch=on_batch)
+    if journal:
+        journal.complete('ayahs', total_rows)
+    connection.commit()
 
-        # Step 2: Fetch translation data
-        print("   2️⃣  Fetching translation data...")
-        translation_data = fetch_api(f"{API_BASE}/quran/{edition_slug}")
+    print(f"\n✅ Successfully imported {inserted} Ayahs")
 
-        # Step 3: Prepare translation data
-        print("   3️⃣  Preparing translation data...")
-        ayah_data_entries = []
+    if not canonical:
+        load_ayah_ids(cursor, ids)
+    return ids
+
+def ensure_edition(cursor, connection, edition: Dict[str, str]) -> int:
+    """Create the edition row if needed and return its id."""
+    edition_slug = edition['identifier']
+    cursor.execute("""
+        INSERT INTO editions (slug, name, language, type, author, source_api)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE id=LAST_INSERT_ID(id)
+    """, (edition_slug, edition['name'], edition['language'], edition['type'],
+          edition.get('author', edition['name']), API_BASE))
+
+    edition_id = cursor.lastrowid
+    if edition_id == 0:
+        cursor.execute("SELECT id FROM editions WHERE slug = %s", (edition_slug,))
+        edition_id = cursor.fetchone()[0]
 
-        for surah_data in translation_data['surahs']:
-            surah_number = surah_data['number']
+    connection.commit()
+    return edition_id
 
-            for ayah in surah_data['ayahs']:
-                ayah_key = f"{surah_number}:{ayah['numberInSurah']}"
-                ayah_id = ayah_key_map.get(ayah_key)
+def prepare_translation_rows(translation_data: Dict[str, Any], edition_id: int,
+                             ids: QuranIds) -> List[tuple]:
+    """Build (ayah_id, edition_id, text, content_hash) tuples for one edition payload."""
+    ayah_data_entries = []
 
-                if ayah_id:
-                    ayah_data_entries.append((
-                        ayah_id,
-                        edition_id,
-                        ayah['text']
-                    ))
+    for surah_data in translation_data['surahs']:
+        surah_number = surah_data['number']
 
-        print(f"      ✅ Prepared {len(ayah_data_entries)} translations")
+        for ayah in surah_data['ayahs']:
+            ayah_id = ids.ayah_id(surah_number, ayah['numberInSurah'])
+
+            if ayah_id:
+                ayah_data_entries.append((
+                    ayah_id,
+                    edition_id,
+                    ayah['text'],
+                    content_hash((ayah['text'],))
+                ))
+
+    return ayah_data_entries
+
+def count_payload_ayahs(payload: Dict[str, Any]) -> int:
+    """Number of ayahs in an edition payload (for pipeline throughput counters)."""
+    return sum(len(surah['ayahs']) for surah in payload['surahs'])
+
+def import_translations(cursor, connection, ids: QuranIds,
+                        sources: Optional[Dict[str, Any]] = None,
+                        concurrency: int = 1, queue_size: int = DEFAULT_QUEUE_SIZE,
+                        delta: Optional[DeltaSummary] = None,
+                        journal: Optional[ImportJournal] = None,
+                        editions: Optional[List[Dict[str, str]]] = None):
+    """
+    Import translations for all Ayahs (only new/changed rows in delta mode).
+
+    `editions` defaults to TRANSLATION_EDITIONS; catalog mode passes the
+    filtered /edition listing instead. Editions flow through a
+    fetch -> prepare -> insert pipeline, so the next edition downloads (on
+    `concurrency` threads) and its tuples are built while the current one is
+    written. At most `queue_size` payloads wait between two stages, so memory
+    stays bounded by a handful of editions however many are imported.
+    """
+    print("\n" + "="*70)
+    print("STEP 3: IMPORTING TRANSLATIONS")
+    print("="*70)
 
-        # Step 4: Batch insert
-        print("   4️⃣  Inserting translations into database...")
-        columns = ['ayah_id', 'edition_id', 'text']
-        inserted = batch_insert(cursor, 'ayah_data', columns, ayah_data_entries)
+    editions = editions or TRANSLATION_EDITIONS
+
+    # Step 1: Create or get editions (on this thread; the pipeline needs the ids)
+    print("\n📚 Creating edition entries...")
+    edition_ids = {}
+    for edition in editions:
+        edition_ids[edition['identifier']] = ensure_edition(cursor, connection, edition)
+        print(f"   ✅ {edition['name']}: Edition ID {edition_ids[edition['identifier']]}")
+
+    pending_editions = editions
+    if journal:
+        pending_editions = [e for e in editions if not journal.is_completed(f"edition:{e['identifier']}")]
+        for edition in editions:
+            if edition not in pending_editions:
+                print(f"   ⏭  Skipping {edition['name']} (completed in an earlier run)")
+
+    # Step 2: Fetch translation data
+    def fetch(edition: Dict[str, str]):
+        print(f"\n📖 Fetching {edition['name']}...")
+        return edition, get_source(f"{API_BASE}/quran/{edition['identifier']}", sources)
+
+    # Step 3: Prepare translation data
+    def prepare(fetched):
+        edition, translation_data = fetched
+        rows = prepare_translation_rows(translation_data, edition_ids[edition['identifier']], ids)
+        print(f"   ✅ Prepared {len(rows)} {edition['name']} translations")
+        return edition, rows
+
+    # Step 4: Batch insert
+    done = 0
+
+    def insert(prepared) -> int:
+        nonlocal done
+        edition, rows = prepared
+        unit = f"edition:{edition['identifier']}"
+        done += 1
+        print(f"\n💾 [{done}/{len(pending_editions)}] Inserting {edition['name']} into database...")
+        columns = ['ayah_id', 'edition_id', 'text', 'content_hash']
+        if delta is not None:
+            edition_id = edition_ids[edition['identifier']]
+            existing = existing_hashes(cursor, 'ayah_data', ['ayah_id', 'edition_id'],
+                                       'edition_id = %s', (edition_id,))
+            summary = delta_upsert(cursor, 'ayah_data', columns, rows, ['ayah_id', 'edition_id'], existing)
+            delta.add(summary)
+            inserted = summary.written
+        else:
+            offset = journal.resume_offset(unit) if journal else 0
+            on_batch = journal.batch_committer(unit, offset) if journal else None
+            inserted = batch_insert(cursor, 'ayah_data', columns, rows[offset:], on_batch=on_batch)
+        if journal:
+            journal.complete(unit, len(rows))
         connection.commit()
+        print(f"   ✅ Completed {edition['name']} ({inserted} translations)")
+        return inserted
+
+    pipeline = Pipeline(queue_size)
+    pipeline.add_stage('fetch', fetch, workers=concurrency, rows=lambda f: count_payload_ayahs(f[1]))
+    pipeline.add_stage('prepare', prepare, rows=lambda p: len(p[1]))
 
-        print(f"\n   ✅ Completed {edition['name']} ({inserted} translations)")
+    start = time.perf_counter()
+    stats = pipeline.run(pending_editions, insert, sink_rows=lambda inserted: inserted)
+    print_stats(stats, time.perf_counter() - start)
 
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Import Quran data into IslamicKnowledgeDB")
+    parser.add_argument('--concurrency', type=int, default=http_client.DEFAULT_CONCURRENCY,
+                        help="Maximum parallel API downloads (1 = fetch serially, on demand)")
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE,
+                        help="Edition payloads buffered between pipeline stages")
+    http_client.add_cache_arguments(parser)
+    http_client.add_rate_limit_argument(parser)
+    bulk_load.add_engine_argument(parser)
+    bulk_load.add_defer_indexes_argument(parser)
+    parser.add_argument('--delta', action='store_true',
+                        help="Compare content hashes and upsert only new or changed rows")
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip steps/editions finished by an earlier run and continue mid-step")
+    parser.add_argument('--catalog', action='store_true',
+                        help="Import every text edition listed by /edition instead of the built-in list")
+    parser.add_argument('--stream', action='store_true',
+                        help="Parse the Arabic text incrementally and insert ayahs in fixed-size batches")
+    parser.add_argument('--language', nargs='+', metavar='CODE',
+                        help="Catalog mode: only these language codes (e.g. en ur id)")
+    parser.add_argument('--type', nargs='+', choices=CATALOG_TYPES, default=list(CATALOG_TYPES),
+                        help="Catalog mode: only these edition types (default: all)")
+    args = parser.parse_args()
+    if (args.language or args.type != list(CATALOG_TYPES)) and not args.catalog:
+        parser.error("--language/--type require --catalog")
+    return args
+
 def main():
     """Main execution function."""
+    args = parse_args()
+    http_client.configure_cache_from_args(args)
+    http_client.configure_rate_limit(args.rate_limit)
+    bulk_load.set_engine(args.engine)
+
+    editions = TRANSLATION_EDITIONS
+    if args.catalog:
+        print("\n📚 Reading edition catalog...")
+        editions = fetch_edition_catalog(args.language, args.type)
+        if not editions:
+            print("   ❌ No editions match the given --language/--type filters")
+            sys.exit(1)
+        print(f"   ✅ {len(editions)} editions selected")
+
     print("\n" + "="*70)
     print("ISLAMIC KNOWLEDGE DATABASE - QURAN DATA IMPORTER")
     print("="*70)
@@ -297,13 +600,17 @@ def main():
     print("\nThis will import:")
     print("  - All 114 Surahs")
     print("  - All 6,236 Ayahs with Arabic text")
-    print(f"  - {len(TRANSLATION_EDITIONS)} English translations")
+    if args.catalog:
+        languages = sorted({edition['language'] for edition in editions})
+        print(f"  - {len(editions)} catalog editions in {len(languages)} language(s)")
+    else:
+        print(f"  - {len(editions)} English translations")
     print("="*70)
 
     # Connect to database
     print("\n🔌 Connecting to MySQL database...")
     try:
-        connection = mysql.connector.connect(**DB_CONFIG)
+        connection = mysql.connector.connect(**DB_CONFIG, allow_local_infile=(args.engine == 'load-data'))
         cursor = connection.cursor(buffered=True)
         print("   ✅ Connected successfully\n")
     except mysql.connector.Error as err:
@@ -313,10 +620,32 @@ def main():
     try:
         # Import data
         start_time = time.time()
-
-        surah_map = import_surahs(cursor, connection)
-        ayah_key_map = import_ayahs(cursor, connection, surah_map)
-        import_translations(cursor, connection, ayah_key_map)
+        journal = ImportJournal(cursor, connection, 'quran', resume=args.resume)
+
+        # Translations are streamed by the pipeline in import_translations,
+        # so only the metadata and Arabic text are prefetched here.
+        sources = None
+        http_client.configure_session(args.concurrency)
+        base_urls = [url for unit, url in [('surahs', f"{API_BASE}/meta"),
+                                           ('ayahs', f"{API_BASE}/quran/quran-uthmani")]
+                     if not journal.is_completed(unit) and not (args.stream and unit == 'ayahs')]
+        if args.concurrency > 1 and base_urls:
+            print(f"🌐 Prefetching {len(base_urls)} API sources ({args.concurrency} concurrent)...")
+            fetch_start = time.time()
+            sources = prefetch_sources(args.concurrency, base_urls)
+            print(f"   ✅ Downloaded in {time.time() - fetch_start:.2f} seconds")
+
+        with bulk_load.deferred_indexes(cursor, connection, ['ayahs', 'ayah_data'],
+                                        enabled=args.defer_indexes) as index_timings:
+            load_start = time.time()
+            delta = DeltaSummary() if args.delta else None
+            ids = import_surahs(cursor, connection, sources, delta, journal)
+            ids = import_ayahs(cursor, connection, ids, sources, delta, journal,
+                               stream=args.stream)
+            import_translations(cursor, connection, ids,
+                                concurrency=args.concurrency, queue_size=args.queue_size,
+                                delta=delta, journal=journal, editions=editions)
+            load_time = time.time() - load_start
 
         elapsed_time = time.time() - start_time
 
@@ -331,8 +660,8 @@ def main():
         cursor.execute("SELECT COUNT(*) FROM ayahs")
         ayah_count = cursor.fetchone()[0]
 
-        cursor.execute("SELECT COUNT(*) FROM editions WHERE type='translation'")
-        edition_count = cursor.fetchone()[0]
+        cursor.execute("SELECT type, COUNT(*) FROM editions GROUP BY type ORDER BY type")
+        edition_counts = cursor.fetchall()
 
         cursor.execute("SELECT COUNT(*) FROM ayah_data")
         translation_count = cursor.fetchone()[0]
@@ -340,9 +669,15 @@ def main():
         print(f"\nStatistics:")
         print(f"  - Surahs: {surah_count}")
         print(f"  - Ayahs: {ayah_count}")
-        print(f"  - Translation Editions: {edition_count}")
+        for edition_type, count in edition_counts:
+            print(f"  - {edition_type.capitalize()} Editions: {count}")
         print(f"  - Total Translations: {translation_count}")
+        if delta is not None:
+            print(f"  - Delta: {delta}")
         print(f"\nTime Elapsed: {elapsed_time:.2f} seconds")
+        print(f"  - Row load: {load_time:.2f} seconds")
+        print(f"  - Index build: {index_timings.build_seconds:.2f} seconds "
+              f"({index_timings.rebuilt} index(es))")
         print("\n✅ You can now query the database!")
         print("="*70 + "\n")
 
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Streaming JSON Reader
+==================================================
+
+Incremental parsing of the large API payloads (a hadith collection, a full
+Quran edition) without materializing the whole document.
+
+The reader walks the enclosing objects and arrays itself and only decodes
+the items of one target array, one at a time, with
+json.JSONDecoder.raw_decode. Text arrives in chunks (a streamed HTTP
+response or a cached gzip file), so memory is bounded by the chunk size plus
+the largest single item.
+
+Paths name the keys leading to the items, with '*' for "every element":
+
+    ('hadiths', '*')                        # hadith-api editions
+    ('data', 'surahs', '*', 'ayahs', '*')   # AlQuran.cloud /quran/{edition}
+
+Each item comes with its context: one dict per enclosing object, holding
+the members that precede the path key (e.g. a surah's 'number' before its
+'ayahs', or a collection's 'metadata' before its 'hadiths').
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# ============================================================================
+# READER
+# ============================================================================
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+Context = List[Dict[str, Any]]
+
+class _Reader:
+    """A text buffer refilled from an iterator of chunks."""
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk (dropping consumed text); False at end of input."""
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of input)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found or 'end of input'!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode one complete JSON value, reading more chunks as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+                # A number (or literal) ending exactly at the buffer end may continue
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+# ============================================================================
+# PATH WALKER
+# ============================================================================
+
+def _walk(reader: _Reader, path: Sequence[str], depth: int,
+          context: Context) -> Iterator[Tuple[Context, Any]]:
+    if depth == len(path):
+        yield context, reader.value()
+        return
+
+    step = path[depth]
+    if step == '*':
+        reader.expect('[')
+        if reader.peek() == ']':
+            reader.pos += 1
+            return
+        while True:
+            yield from _walk(reader, path, depth + 1, context)
+            separator = reader.peek()
+            reader.pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or ']' but found {separator or 'end of input'!r}")
+
+    reader.expect('{')
+    fields: Dict[str, Any] = {}
+    context = context + [fields]
+    if reader.peek() == '}':
+        reader.pos += 1
+        return
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise ValueError(f"Expected an object key but found {key!r}")
+        reader.expect(':')
+        if key == step:
+            yield from _walk(reader, path, depth + 1, context)
+        else:
+            fields[key] = reader.value()
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == '}':
+            return
+        if separator != ',':
+            raise ValueError(f"Expected ',' or '}}' but found {separator or 'end of input'!r}")
+
+def iter_items(chunks: Iterable[str], path: Sequence[str]) -> Iterator[Tuple[Context, Any]]:
+    """
+    Yield (context, item) for every item at `path` in the JSON text `chunks`.
+
+    A missing key simply yields nothing; members after the path key are
+    decoded and discarded.
+    """
+    return _walk(_Reader(chunks), tuple(path), 0, [])
@@ -0,0 +1,18 @@
+-- ============================================================================
+-- MIGRATION 001: per-row content hashes for delta imports
+-- ============================================================================
+-- Adds the content_hash columns that schema.sql now creates, for databases
+-- built from an older schema.sql. Existing rows start with NULL hashes; the
+-- first `--delta` import fills them in (they are reported as "changed").
+--
+-- Run: mysql -u root -p IslamicKnowledgeDB < migrations/001_add_content_hashes.sql
+-- ============================================================================
+
+ALTER TABLE ayahs
+  ADD COLUMN content_hash CHAR(32) COMMENT 'MD5 of the imported content (delta imports)' AFTER page;
+
+ALTER TABLE ayah_data
+  ADD COLUMN content_hash CHAR(32) COMMENT 'MD5 of the imported content (delta imports)' AFTER text;
+
+ALTER TABLE hadiths
+  ADD COLUMN content_hash CHAR(32) COMMENT 'MD5 of the imported content (delta imports)' AFTER grade;
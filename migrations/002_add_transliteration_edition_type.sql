@@ -0,0 +1,13 @@
+-- ============================================================================
+-- MIGRATION 002: 'transliteration' edition type
+-- ============================================================================
+-- Catalog imports (`import_quran.py --catalog`) store the transliteration
+-- editions listed by AlQuran.cloud's /edition endpoint alongside
+-- translations and tafsirs. Extends editions.type for databases built from
+-- an older schema.sql; existing rows are unaffected.
+--
+-- Run: mysql -u root -p IslamicKnowledgeDB < migrations/002_add_transliteration_edition_type.sql
+-- ============================================================================
+
+ALTER TABLE editions
+  MODIFY COLUMN type ENUM('translation', 'tafsir', 'recitation', 'transliteration') NOT NULL;
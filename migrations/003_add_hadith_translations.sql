@@ -0,0 +1,41 @@
+-- ============================================================================
+-- MIGRATION 003: multi-language hadith translations
+-- ============================================================================
+-- Creates the hadith_editions / hadith_data tables that schema.sql now
+-- defines, for databases built from an older schema.sql. They are filled by
+-- import_hadith_translations.py.
+--
+-- Run: mysql -u root -p IslamicKnowledgeDB < migrations/003_add_hadith_translations.sql
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS hadith_editions (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  slug VARCHAR(100) NOT NULL UNIQUE COMMENT 'CDN edition name (e.g., urd-bukhari, ind-muslim)',
+  collection_id INT NOT NULL,
+  language VARCHAR(10) NOT NULL COMMENT 'CDN language code (e.g., urd, ind, tur, ben)',
+  language_name VARCHAR(50) COMMENT 'Language display name (e.g., Urdu)',
+  author VARCHAR(255) COMMENT 'Translator',
+  source_api VARCHAR(255) COMMENT 'API source URL where data was obtained',
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+  FOREIGN KEY (collection_id) REFERENCES hadith_collections(id) ON DELETE CASCADE,
+  UNIQUE KEY unique_collection_language (collection_id, language),
+  INDEX idx_language (language)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS hadith_data (
+  id BIGINT AUTO_INCREMENT PRIMARY KEY,
+  hadith_id BIGINT NOT NULL,
+  edition_id INT NOT NULL,
+  text LONGTEXT NOT NULL COMMENT 'Translated hadith text',
+  content_hash CHAR(32) COMMENT 'MD5 of the imported content (delta imports)',
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+  FOREIGN KEY (hadith_id) REFERENCES hadiths(id) ON DELETE CASCADE,
+  FOREIGN KEY (edition_id) REFERENCES hadith_editions(id) ON DELETE CASCADE,
+  UNIQUE KEY unique_hadith_edition (hadith_id, edition_id),
+  INDEX idx_edition_id (edition_id),
+  FULLTEXT INDEX ft_text (text)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,15 @@
+-- ============================================================================
+-- MIGRATION 004: match type for hadith → ayah references
+-- ============================================================================
+-- extract_hadith_references.py records how each reference was found:
+-- an explicit verse citation, a verbatim quotation, or a surah named without
+-- a verse (stored against the surah's first ayah). Existing rows default to
+-- 'citation'.
+--
+-- Run: mysql -u root -p IslamicKnowledgeDB < migrations/004_add_reference_match_type.sql
+-- ============================================================================
+
+ALTER TABLE hadith_ayah_references
+  ADD COLUMN match_type ENUM('citation', 'quotation', 'surah') NOT NULL DEFAULT 'citation'
+    COMMENT 'How extract_hadith_references.py found it (surah = surah named, linked to its first ayah)'
+    AFTER ayah_id;
@@ -0,0 +1,23 @@
+-- ============================================================================
+-- MIGRATION 005: near-duplicate hadith clusters
+-- ============================================================================
+-- find_duplicate_hadiths.py groups hadiths that are the same narration with
+-- minor wording differences (MinHash signatures + LSH banding) and stores one
+-- row per clustered hadith and compared language. Hadiths without a
+-- near-duplicate have no row.
+--
+-- Run: mysql -u root -p IslamicKnowledgeDB < migrations/005_add_hadith_clusters.sql
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS hadith_clusters (
+  hadith_id BIGINT NOT NULL,
+  language VARCHAR(10) NOT NULL COMMENT 'Text compared: ara/eng (hadiths) or a hadith_data language',
+  cluster_id BIGINT NOT NULL COMMENT 'Smallest hadith id in the cluster',
+  similarity DECIMAL(5,4) NOT NULL COMMENT 'Best estimated Jaccard similarity to another member',
+  cluster_size INT NOT NULL,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+  PRIMARY KEY (hadith_id, language),
+  FOREIGN KEY (hadith_id) REFERENCES hadiths(id) ON DELETE CASCADE,
+  INDEX idx_cluster (language, cluster_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,21 @@
+-- ============================================================================
+-- MIGRATION 006: diacritic-insensitive Arabic text for hadiths
+-- ============================================================================
+-- import_hadith.py now stores a normalized copy of text_arabic (harakat,
+-- Quranic marks and tatweel dropped, letter variants folded), like
+-- ayahs.text_clean, with its own FULLTEXT index.
+--
+-- Existing rows start with NULL text_clean; fill them in afterwards with
+--   python import_hadith.py --backfill-clean
+-- which updates in small id-ordered chunks, one commit each.
+--
+-- Run: mysql -u root -p IslamicKnowledgeDB < migrations/006_add_hadith_text_clean.sql
+-- ============================================================================
+
+ALTER TABLE hadiths
+  ADD COLUMN text_clean LONGTEXT
+    COMMENT 'Arabic without marks/letter variants for search (arabic_normalizer)'
+    AFTER text_arabic;
+
+-- InnoDB builds one FULLTEXT index per ALTER statement
+ALTER TABLE hadiths ADD FULLTEXT INDEX ft_text_clean (text_clean);
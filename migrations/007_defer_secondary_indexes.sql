@@ -0,0 +1,15 @@
+-- ============================================================================
+-- MIGRATION 007: deferred secondary indexes
+-- ============================================================================
+-- --defer-indexes now also drops the non-unique BTREE indexes of the bulk
+-- loaded tables, not just their FULLTEXT indexes, so import_index_state
+-- records which kind of index each row stands for. Rows left by an earlier
+-- crashed run are FULLTEXT indexes, hence the default.
+--
+-- Run: mysql -u root -p IslamicKnowledgeDB < migrations/007_defer_secondary_indexes.sql
+-- ============================================================================
+
+ALTER TABLE import_index_state
+  ADD COLUMN index_type VARCHAR(16) NOT NULL DEFAULT 'FULLTEXT'
+    COMMENT 'FULLTEXT or BTREE'
+    AFTER index_name;
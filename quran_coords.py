@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Quran Coordinate Index
+===================================================
+
+In-process conversions between the ways an ayah is addressed, with no
+database hit:
+
+- ayah_key "2:255"  <->  global ayah number 262 (1-6,236)
+- global number      ->  juz, hizb quarter, manzil, ruku, mushaf page
+- juz / page / ...   ->  the range of ayahs it covers ("all ayahs on page 50")
+
+Everything is held in a few prefix-sum arrays (array('H')): per-surah ayah
+offsets plus the first ayah of every division. Key <-> number and
+division -> range are O(1); number -> surah or division is a bisect,
+O(log n). The index is built from the AlQuran.cloud /meta payload (optionally
+cross-checked against surahs.ayah_count) and saved as a ~4 KB binary file
+that loads in microseconds.
+
+Usage:
+    python quran_coords.py build                  # fetch /meta, write quran_coords.bin
+    python quran_coords.py build --check-db       # also verify surahs.ayah_count
+    python quran_coords.py lookup 2:255           # or a global number: lookup 262
+    python quran_coords.py page 50                # ayahs on a page (juz, manzil, ruku, hizb_quarter)
+
+    from quran_coords import QuranCoords
+    coords = QuranCoords.load()
+    coords.number_from_key('2:255')        # 262
+    coords.division('page', 262)           # 42
+    coords.division_range('juz', 30)       # range(5673, 6237)
+
+Requirements:
+    none to load; build needs requests (and mysql-connector-python for --check-db)
+"""
+
+import argparse
+import itertools
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_PATH = Path(__file__).resolve().with_name('quran_coords.bin')
+
+# Division name -> /meta key whose references list each division's first ayah
+DIVISIONS = {
+    'juz': 'juzs',
+    'hizb_quarter': 'hizbQuarters',
+    'manzil': 'manzils',
+    'ruku': 'rukus',
+    'page': 'pages',
+}
+
+MAGIC = b'QCRD'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHH')    # magic, version, section count
+SECTION = struct.Struct('<12sH')   # name, number of uint16 values
+
+# ============================================================================
+# COORDINATE INDEX
+# ============================================================================
+
+def parse_key(ayah_key: str) -> Tuple[int, int]:
+    """'2:255' -> (2, 255)."""
+    try:
+        surah, ayah = ayah_key.split(':')
+        return int(surah), int(ayah)
+    except ValueError:
+        raise ValueError(f"Invalid ayah_key {ayah_key!r} (expected 'surah:ayah')") from None
+
+class QuranCoords:
+    """Prefix-sum index over surahs, ayahs and mushaf divisions."""
+
+    def __init__(self, ayah_counts: Sequence[int], divisions: Dict[str, Sequence[int]],
+                 sajdas: Sequence[int] = ()):
+        """
+        `ayah_counts` has one entry per surah; `divisions` maps a division name
+        to the global numbers of its first ayahs, in order; `sajdas` are the
+        global numbers of the prostration ayahs.
+        """
+        self.ayah_counts = array('H', ayah_counts)
+        self.surah_starts = array('H', itertools.accumulate(ayah_counts, initial=0))
+        self.divisions = {name: array('H', starts) for name, starts in divisions.items()}
+        self.sajdas = array('H', sorted(sajdas))
+
+    def validate(self):
+        """Check that every division starts at ayah 1 and strictly increases (done at build time)."""
+        for name, starts in self.divisions.items():
+            if not starts or starts[0] != 1 or any(a >= b for a, b in zip(starts, starts[1:])):
+                raise ValueError(f"{name} starts must begin at ayah 1 and increase")
+            if starts[-1] > self.total_ayahs:
+                raise ValueError(f"{name} starts beyond ayah {self.total_ayahs}")
+
+    @property
+    def total_ayahs(self) -> int:
+        return self.surah_starts[-1]
+
+    # ------------------------------------------------------------------------
+    # Ayah references
+    # ------------------------------------------------------------------------
+
+    def number(self, surah: int, ayah: int) -> int:
+        """Global ayah number (1-based) of surah:ayah. O(1)."""
+        if not 1 <= surah <= len(self.ayah_counts):
+            raise ValueError(f"Surah {surah} out of range 1-{len(self.ayah_counts)}")
+        if not 1 <= ayah <= self.ayah_counts[surah - 1]:
+            raise ValueError(f"Surah {surah} has no ayah {ayah}")
+        return self.surah_starts[surah - 1] + ayah
+
+    def number_from_key(self, ayah_key: str) -> int:
+        return self.number(*parse_key(ayah_key))
+
+    def _check_number(self, number: int):
+        if not 1 <= number <= self.total_ayahs:
+            raise ValueError(f"Ayah number {number} out of range 1-{self.total_ayahs}")
+
+    def surah_ayah(self, number: int) -> Tuple[int, int]:
+        """(surah, ayah) of a global ayah number. O(log 114)."""
+        self._check_number(number)
+        surah = bisect_right(self.surah_starts, number - 1)
+        return surah, number - self.surah_starts[surah - 1]
+
+    def key(self, number: int) -> str:
+        """ayah_key ('2:255') of a global ayah number."""
+        return '%d:%d' % self.surah_ayah(number)
+
+    def surah_range(self, surah: int) -> range:
+        """Global numbers of a surah's ayahs. O(1)."""
+        return range(self.number(surah, 1), self.surah_starts[surah] + 1)
+
+    # ------------------------------------------------------------------------
+    # Divisions (juz, hizb_quarter, manzil, ruku, page)
+    # ------------------------------------------------------------------------
+
+    def _starts(self, name: str) -> array:
+        if name not in self.divisions:
+            raise ValueError(f"Unknown division {name!r} (available: {', '.join(self.divisions)})")
+        return self.divisions[name]
+
+    def division_count(self, name: str) -> int:
+        return len(self._starts(name))
+
+    def division(self, name: str, number: int) -> int:
+        """The juz/page/... (1-based) containing a global ayah number. O(log n)."""
+        self._check_number(number)
+        return bisect_right(self._starts(name), number)
+
+    def division_range(self, name: str, index: int) -> range:
+        """Global numbers of the ayahs in juz/page/... `index`. O(1)."""
+        starts = self._starts(name)
+        if not 1 <= index <= len(starts):
+            raise ValueError(f"{name} {index} out of range 1-{len(starts)}")
+        end = starts[index] if index < len(starts) else self.total_ayahs + 1
+        return range(starts[index - 1], end)
+
+    def locate(self, number: int) -> Dict[str, int]:
+        """Every coordinate of a global ayah number."""
+        surah, ayah = self.surah_ayah(number)
+        location = {'number': number, 'surah': surah, 'ayah': ayah}
+        for name in self.divisions:
+            location[name] = self.division(name, number)
+        return location
+
+    def is_sajda(self, number: int) -> bool:
+        index = bisect_right(self.sajdas, number)
+        return index > 0 and self.sajdas[index - 1] == number
+
+    # ------------------------------------------------------------------------
+    # Building and serialization
+    # ------------------------------------------------------------------------
+
+    @classmethod
+    def from_meta(cls, meta: Dict, ayah_counts: Optional[Sequence[int]] = None) -> 'QuranCoords':
+        """
+        Build from an AlQuran.cloud /meta payload ('data' member). If
+        `ayah_counts` (e.g. surahs.ayah_count) is given it must agree with
+        the metadata.
+        """
+        surahs = sorted(meta['surahs']['references'], key=lambda surah: surah['number'])
+        meta_counts = [surah['numberOfAyahs'] for surah in surahs]
+        if ayah_counts is not None and list(ayah_counts) != meta_counts:
+            raise ValueError("surahs.ayah_count does not match /meta numberOfAyahs")
+
+        coords = cls(meta_counts, {})
+        divisions = {
+            name: [coords.number(ref['surah'], ref['ayah']) for ref in meta[key]['references']]
+            for name, key in DIVISIONS.items() if key in meta
+        }
+        sajdas = [coords.number(ref['surah'], ref['ayah'])
+                  for ref in meta.get('sajdas', {}).get('references', [])]
+        coords = cls(meta_counts, divisions, sajdas)
+        coords.validate()
+        return coords
+
+    def to_bytes(self) -> bytes:
+        sections = [('surahs', self.ayah_counts)] + list(self.divisions.items()) + [('sajdas', self.sajdas)]
+        parts = [HEADER.pack(MAGIC, FORMAT_VERSION, len(sections))]
+        for name, values in sections:
+            values = array('H', values)
+            if sys.byteorder == 'big':
+                values.byteswap()
+            parts.append(SECTION.pack(name.encode('ascii'), len(values)))
+            parts.append(values.tobytes())
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'QuranCoords':
+        magic, version, count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Not a quran_coords v{FORMAT_VERSION} file")
+
+        sections: Dict[str, array] = {}
+        offset = HEADER.size
+        for _ in range(count):
+            name, length = SECTION.unpack_from(data, offset)
+            offset += SECTION.size
+            values = array('H')
+            values.frombytes(data[offset:offset + 2 * length])
+            if sys.byteorder == 'big':
+                values.byteswap()
+            sections[name.rstrip(b'\0').decode('ascii')] = values
+            offset += 2 * length
+
+        ayah_counts = sections.pop('surahs')
+        sajdas = sections.pop('sajdas', array('H'))
+        return cls(ayah_counts, sections, sajdas)
+
+    def save(self, path: Path = DEFAULT_PATH) -> int:
+        data = self.to_bytes()
+        Path(path).write_bytes(data)
+        return len(data)
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_PATH) -> 'QuranCoords':
+        return cls.from_bytes(Path(path).read_bytes())
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def load_db_ayah_counts() -> List[int]:
+    """surahs.ayah_count in surah order."""
+    import mysql.connector
+    from import_quran import DB_CONFIG
+
+    connection = mysql.connector.connect(**DB_CONFIG)
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT ayah_count FROM surahs ORDER BY surah_number")
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        connection.close()
+
+def build(args):
+    import http_client
+    from import_quran import API_BASE, fetch_api
+
+    http_client.configure_cache_from_args(args)
+    print("\n📖 Fetching Quran metadata...")
+    meta = fetch_api(f"{API_BASE}/meta")
+    ayah_counts = None
+    if args.check_db:
+        print("🔌 Reading surahs.ayah_count...")
+        ayah_counts = load_db_ayah_counts()
+
+    coords = QuranCoords.from_meta(meta, ayah_counts)
+    size = coords.save(args.output)
+
+    start = time.perf_counter()
+    QuranCoords.load(args.output)
+    load_us = (time.perf_counter() - start) * 1e6
+
+    print(f"   ✅ {coords.total_ayahs:,} ayahs, " +
+          ', '.join(f"{len(starts)} {name}" for name, starts in coords.divisions.items()))
+    print(f"   💾 Wrote {args.output} ({size:,} bytes, loads in {load_us:.0f} µs)\n")
+
+def lookup(args, coords: QuranCoords):
+    number = coords.number_from_key(args.ayah) if ':' in args.ayah else int(args.ayah)
+    location = coords.locate(number)
+    print(f"{coords.key(number)} = ayah #{number}")
+    for name in coords.divisions:
+        print(f"  {name:<13} {location[name]}")
+    if coords.is_sajda(number):
+        print("  sajda")
+
+def show_division(args, coords: QuranCoords):
+    ayahs = coords.division_range(args.division, args.index)
+    print(f"{args.division} {args.index}: {coords.key(ayahs[0])} - {coords.key(ayahs[-1])} "
+          f"(#{ayahs[0]}-#{ayahs[-1]}, {len(ayahs)} ayahs)")
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Build or query the Quran coordinate index")
+    parser.add_argument('--file', type=Path, default=DEFAULT_PATH, help="Index file (default: %(default)s)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = commands.add_parser('build', help="Build the index from /meta")
+    build_parser.add_argument('--check-db', action='store_true',
+                              help="Verify surahs.ayah_count against /meta before writing")
+    from http_client import add_cache_arguments
+    add_cache_arguments(build_parser)
+
+    lookup_parser = commands.add_parser('lookup', help="Coordinates of an ayah_key or global number")
+    lookup_parser.add_argument('ayah', help="e.g. 2:255 or 262")
+
+    for name in DIVISIONS:
+        division_parser = commands.add_parser(name, help=f"Ayah range of a {name}")
+        division_parser.add_argument('index', type=int)
+        division_parser.set_defaults(division=name)
+
+    args = parser.parse_args()
+    args.output = args.file
+    return args
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+    if args.command == 'build':
+        build(args)
+        return
+
+    try:
+        coords = QuranCoords.load(args.file)
+    except FileNotFoundError:
+        print(f"❌ {args.file} not found; run: python quran_coords.py build")
+        sys.exit(1)
+
+    try:
+        if args.command == 'lookup':
+            lookup(args, coords)
+        else:
+            show_division(args, coords)
+    except ValueError as err:
+        print(f"❌ {err}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
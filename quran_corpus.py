@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Packed Quran Corpus
+================================================
+
+Exports the ayahs and any chosen editions into one packed file that
+read-heavy services memory-map instead of querying MySQL or holding every
+translation in Python dicts.
+
+File layout (little-endian):
+- header:     magic, format version, surah/edition/ayah counts
+- surahs:     ayah count per surah (uint16), so keys resolve without the DB
+- directory:  per edition: name, offset table position, blob position
+- per edition an offset table of ayah_count + 1 uint32 byte offsets,
+  followed by the edition's UTF-8 texts concatenated in mushaf order
+
+Built-in editions: 'arabic' (ayahs.text_arabic) and 'clean' (text_clean);
+translations/tafsirs keep their editions.slug. A missing ayah is an empty
+slice.
+
+QuranCorpus opens the file with mmap (read-only), so startup only parses
+the header and directory, lookups return memoryview slices of the mapping
+(zero copy) or decode just the requested text, and the page cache is shared
+by every worker process that maps the same file. Exports are written to a
+temporary file and renamed into place, so running readers keep their old
+mapping.
+
+Usage:
+    python quran_corpus.py export --editions en.sahih en.yusufali
+    python quran_corpus.py export --all-editions --output /srv/quran_corpus.bin
+    python quran_corpus.py get 2:255 --edition arabic en.sahih
+
+    from quran_corpus import QuranCorpus
+    corpus = QuranCorpus()                 # quran_corpus.bin next to this module
+    corpus.text('en.sahih', '2:255')
+    corpus.raw('arabic', 262)              # memoryview (UTF-8 bytes)
+
+Requirements:
+    none to read; export needs mysql-connector-python
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from quran_coords import QuranCoords
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_PATH = Path(__file__).resolve().with_name('quran_corpus.bin')
+
+BUILTIN_EDITIONS = {'arabic': 'text_arabic', 'clean': 'text_clean'}
+
+MAGIC = b'QCORPUS\0'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<8sHHHI')   # magic, version, surah count, edition count, ayah count
+ENTRY = struct.Struct('<64sQQ')     # edition name, offset table position, blob position
+ALIGN = 8
+
+AyahRef = Union[int, str]  # global ayah number (1-based) or ayah_key
+
+def _padding(position: int) -> int:
+    return -position % ALIGN
+
+# ============================================================================
+# WRITER
+# ============================================================================
+
+def write_corpus(path: Union[str, Path], ayah_counts: Sequence[int],
+                 editions: Dict[str, Iterable[Tuple[int, Optional[str]]]]) -> int:
+    """
+    Write a corpus file atomically; returns its size in bytes.
+
+    `editions` maps an edition name to (global ayah number, text) pairs in
+    any order; ayahs without a pair are stored empty.
+    """
+    too_long = [name for name in editions if len(name.encode('utf-8')) > ENTRY.size - 16]
+    if too_long:
+        raise ValueError(f"Edition name(s) longer than {ENTRY.size - 16} bytes: {', '.join(too_long)}")
+
+    total = sum(ayah_counts)
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=path.name + '.', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(ayah_counts), len(editions), total))
+            counts = array('H', ayah_counts)
+            if sys.byteorder != 'little':
+                counts.byteswap()
+            f.write(counts.tobytes())
+            f.write(b'\0' * _padding(f.tell()))
+
+            directory_position = f.tell()
+            f.write(b'\0' * (ENTRY.size * len(editions)))
+
+            entries = []
+            for name, pairs in editions.items():
+                texts: List[bytes] = [b''] * total
+                for number, text in pairs:
+                    if 1 <= number <= total and text:
+                        texts[number - 1] = text.encode('utf-8')
+
+                offsets = array('I', [0]) * (total + 1)
+                position = 0
+                for i, encoded in enumerate(texts):
+                    position += len(encoded)
+                    offsets[i + 1] = position
+                if sys.byteorder != 'little':
+                    offsets.byteswap()
+
+                f.write(b'\0' * _padding(f.tell()))
+                offsets_position = f.tell()
+                f.write(offsets.tobytes())
+                blob_position = f.tell()
+                f.writelines(texts)
+                entries.append(ENTRY.pack(name.encode('utf-8'), offsets_position, blob_position))
+
+            size = f.tell()
+            f.seek(directory_position)
+            f.write(b''.join(entries))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return size
+
+# ============================================================================
+# READER
+# ============================================================================
+
+class QuranCorpus:
+    """Read-only, memory-mapped view of a corpus file."""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_PATH):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        magic, version, surah_count, edition_count, self.total_ayahs = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a quran_corpus v{FORMAT_VERSION} file")
+
+        position = HEADER.size
+        counts = array('H')
+        counts.frombytes(self._view[position:position + 2 * surah_count])
+        if sys.byteorder != 'little':
+            counts.byteswap()
+        self.coords = QuranCoords(counts, {})
+        position += 2 * surah_count + _padding(position + 2 * surah_count)
+
+        self._editions: Dict[str, Tuple[Sequence[int], int]] = {}
+        for i in range(edition_count):
+            name, offsets_position, blob_position = ENTRY.unpack_from(self._view, position + i * ENTRY.size)
+            table = self._view[offsets_position:offsets_position + 4 * (self.total_ayahs + 1)]
+            if sys.byteorder == 'little':
+                offsets = table.cast('I')
+            else:
+                offsets = array('I')
+                offsets.frombytes(table)
+                offsets.byteswap()
+            self._editions[name.rstrip(b'\0').decode('utf-8')] = (offsets, blob_position)
+
+    @property
+    def editions(self) -> List[str]:
+        return list(self._editions)
+
+    def number(self, ref: AyahRef) -> int:
+        """Global ayah number of an ayah_key ('2:255') or number."""
+        if isinstance(ref, str):
+            return self.coords.number_from_key(ref)
+        if not 1 <= ref <= self.total_ayahs:
+            raise ValueError(f"Ayah number {ref} out of range 1-{self.total_ayahs}")
+        return ref
+
+    def raw(self, edition: str, ref: AyahRef) -> memoryview:
+        """UTF-8 bytes of one ayah as a zero-copy slice of the mapping."""
+        if edition not in self._editions:
+            raise ValueError(f"Edition {edition!r} not in corpus (available: {', '.join(self._editions)})")
+        offsets, blob_position = self._editions[edition]
+        index = self.number(ref) - 1
+        return self._view[blob_position + offsets[index]:blob_position + offsets[index + 1]]
+
+    def text(self, edition: str, ref: AyahRef) -> str:
+        return str(self.raw(edition, ref), 'utf-8')
+
+    def texts(self, ref: AyahRef, editions: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """{edition: text} for one ayah across `editions` (default: all)."""
+        return {edition: self.text(edition, ref) for edition in (editions or self._editions)}
+
+    def close(self):
+        for offsets, _ in self._editions.values():
+            if isinstance(offsets, memoryview):
+                offsets.release()
+        self._editions = {}
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ============================================================================
+# EXPORT FROM THE DATABASE
+# ============================================================================
+
+FETCH_ROWS = 2000
+
+def iter_numbered(cursor, coords: QuranCoords, query: str, params: tuple = ()) -> Iterable[Tuple[int, str]]:
+    """(global number, text) pairs from a query selecting surah_number, ayah_number, text."""
+    cursor.execute(query, params)
+    while True:
+        rows = cursor.fetchmany(FETCH_ROWS)
+        if not rows:
+            return
+        for surah_number, ayah_number, text in rows:
+            yield coords.number(surah_number, ayah_number), text
+
+def export(args):
+    import mysql.connector
+    from import_quran import DB_CONFIG
+
+    print("\n🔌 Connecting to MySQL database...")
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG)
+        cursor = connection.cursor()
+    except mysql.connector.Error as err:
+        print(f"   ❌ Error: {err}")
+        sys.exit(1)
+
+    try:
+        start_time = time.time()
+        cursor.execute("SELECT ayah_count FROM surahs ORDER BY surah_number")
+        coords = QuranCoords([row[0] for row in cursor.fetchall()], {})
+
+        if args.all_editions:
+            cursor.execute("SELECT slug FROM editions ORDER BY id")
+            slugs = [row[0] for row in cursor.fetchall()]
+        else:
+            slugs = args.editions or []
+        cursor.execute("SELECT slug, id FROM editions")
+        edition_ids = dict(cursor.fetchall())
+        unknown = [slug for slug in slugs if slug not in edition_ids]
+        if unknown:
+            print(f"   ❌ Unknown edition(s): {', '.join(unknown)}")
+            sys.exit(1)
+
+        # Each edition's query runs only when the writer reaches it
+        ayah_query = """
+            SELECT s.surah_number, a.ayah_number, a.{column}
+            FROM ayahs a JOIN surahs s ON s.id = a.surah_id
+        """
+        editions = {name: iter_numbered(cursor, coords, ayah_query.format(column=column))
+                    for name, column in BUILTIN_EDITIONS.items()}
+        for slug in slugs:
+            editions[slug] = iter_numbered(cursor, coords, """
+                SELECT s.surah_number, a.ayah_number, ad.text
+                FROM ayah_data ad
+                JOIN ayahs a ON a.id = ad.ayah_id
+                JOIN surahs s ON s.id = a.surah_id
+                WHERE ad.edition_id = %s
+            """, (edition_ids[slug],))
+
+        print(f"📦 Packing {coords.total_ayahs:,} ayahs x {len(editions)} editions...")
+        size = write_corpus(args.output, coords.ayah_counts, editions)
+        print(f"   ✅ Wrote {args.output} ({size / 1e6:.1f} MB) in {time.time() - start_time:.2f} seconds\n")
+    finally:
+        cursor.close()
+        connection.close()
+
+def get(args):
+    start = time.perf_counter()
+    with QuranCorpus(args.output) as corpus:
+        opened_us = (time.perf_counter() - start) * 1e6
+        ref = args.ayah if ':' in args.ayah else int(args.ayah)
+        for edition, text in corpus.texts(ref, args.edition).items():
+            print(f"[{edition}] {text}")
+        print(f"\n(opened {len(corpus.editions)} editions in {opened_us:.0f} µs)")
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Export or read the packed Quran corpus")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--output', type=Path, default=DEFAULT_PATH, help="Corpus file (default: %(default)s)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = commands.add_parser('export', parents=[common],
+                                        help="Export ayahs and editions from the database")
+    export_parser.add_argument('--editions', nargs='+', metavar='SLUG', help="Edition slugs (e.g. en.sahih)")
+    export_parser.add_argument('--all-editions', action='store_true', help="Every edition in the database")
+
+    get_parser = commands.add_parser('get', parents=[common], help="Print one ayah from the corpus")
+    get_parser.add_argument('ayah', help="ayah_key (2:255) or global number (262)")
+    get_parser.add_argument('--edition', nargs='+', help="Editions to print (default: all)")
+
+    return parser.parse_args()
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+    if args.command == 'export':
+        export(args)
+        return
+    try:
+        get(args)
+    except (FileNotFoundError, ValueError) as err:
+        print(f"❌ {err}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Related Ayahs and Hadiths
+======================================================
+
+"Related" lists for every ayah and hadith (ayah -> ayahs, ayah -> hadiths,
+hadith -> hadiths, hadith -> ayahs) by cosine similarity of document
+vectors, computed with NumPy matrix products instead of per-row loops.
+
+Features:
+- Vectors come from either:
+  * embeddings imported from a JSON Lines export (one {"id", "embedding"}
+    object per line, e.g. the app's embedding_english_jsonb column), or
+  * a local TF-IDF + LSA model fitted on the English texts: ayahs (all
+    English translations of an ayah joined) and hadiths.text_english share
+    one vocabulary and one latent space, so ayahs and hadiths are comparable
+- Each item set is stored as contiguous, L2-normalized float32 .npy files
+  and opened as memmaps, so loading costs nothing until rows are touched
+- Queries are answered in batches: one matrix product scores a batch against
+  every target, numpy.argpartition picks the top k per row and only those k
+  are sorted; batch size keeps the score matrix under SCORE_BUFFER bytes
+- LSA uses a randomized SVD over a sparse TF-IDF matrix kept as sorted
+  (row, column, value) arrays; sparse products run in cache-sized
+  vectorized chunks
+- Precomputed tables (<query>-<target>.related.npy positions and
+  .scores.npy similarities, TOP_K per item) turn lookups into a row read
+
+Item sets are only compared when they were built in the same vector space
+(LSA sets with each other, imported embeddings with sets imported under the
+same --space name).
+
+Usage:
+    python related.py build                          # LSA vectors + all related tables
+    python related.py build --dimensions 384 --sets hadiths
+    python related.py import embeddings.jsonl --set hadiths --space text-embedding-3-small
+    python related.py precompute -k 20
+    python related.py related ayahs 262 --target hadiths -k 5
+
+    from related import RelatedIndex
+    related = RelatedIndex()
+    related.related('ayahs', 262, target='hadiths', k=5)   # [(hadith id, 'bukhari:4', 0.71), ...]
+
+Requirements:
+    numpy; build needs mysql-connector-python
+"""
+
+import argparse
+import json
+import sys
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy
+
+from search_index import words
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_DIR = Path(__file__).resolve().with_name('related')
+
+DIMENSIONS = 256            # LSA latent dimensions
+OVERSAMPLE = 16             # extra random directions for the randomized SVD
+POWER_ITERATIONS = 3
+MIN_DF = 2                  # terms in fewer documents are dropped
+MAX_DF = 0.5                # terms in more than this share of documents are dropped
+LSA_SPACE = 'lsa'
+
+TOP_K = 20                  # related items kept per item in precomputed tables
+SCORE_BUFFER = 256 << 20    # bytes of float32 scores per query batch
+SPARSE_CHUNK = 1 << 12      # nonzeros per vectorized sparse product step (keeps the step in cache)
+IMPORT_CHUNK = 4096         # embedding rows parsed before each write
+FETCH_ROWS = 2000
+
+# documents: (row id, label, text) rows ordered by row id; consecutive rows of one id are joined
+ITEM_SETS: Dict[str, str] = {
+    'ayahs': """
+        SELECT a.id, a.ayah_key, ad.text
+        FROM ayah_data ad
+        JOIN ayahs a ON a.id = ad.ayah_id
+        JOIN editions e ON e.id = ad.edition_id
+        WHERE e.type = 'translation' AND e.language = 'en'
+        ORDER BY a.id, e.id
+    """,
+    'hadiths': """
+        SELECT h.id, CONCAT(c.slug, ':', h.reference_number), h.text_english
+        FROM hadiths h
+        JOIN hadith_collections c ON c.id = h.collection_id
+        WHERE h.text_english IS NOT NULL
+        ORDER BY h.id
+    """,
+}
+
+Related = Tuple[int, str, float]   # (row id, label, cosine similarity)
+
+# ============================================================================
+# STORAGE
+# ============================================================================
+
+def set_paths(name: str, directory: Path = DEFAULT_DIR) -> Dict[str, Path]:
+    return {part: Path(directory) / f"{name}.{part}.{extension}"
+            for part, extension in (('vectors', 'npy'), ('ids', 'npy'), ('meta', 'json'))}
+
+def table_paths(query: str, target: str, directory: Path = DEFAULT_DIR) -> Tuple[Path, Path]:
+    base = Path(directory) / f"{query}-{target}"
+    return base.with_suffix('.related.npy'), base.with_suffix('.scores.npy')
+
+def normalize_rows(vectors: numpy.ndarray) -> numpy.ndarray:
+    """L2-normalize rows in place (all-zero rows stay zero)."""
+    norms = numpy.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    vectors /= norms
+    return vectors
+
+def save_set(name: str, vectors: numpy.ndarray, ids: Sequence[int], labels: Sequence[str],
+             space: str, directory: Path = DEFAULT_DIR) -> Path:
+    """Write an item set: normalized float32 vectors, int64 row ids, labels and metadata."""
+    paths = set_paths(name, directory)
+    paths['vectors'].parent.mkdir(parents=True, exist_ok=True)
+    vectors = normalize_rows(numpy.ascontiguousarray(vectors, dtype=numpy.float32))
+    numpy.save(paths['vectors'], vectors)
+    numpy.save(paths['ids'], numpy.asarray(ids, dtype=numpy.int64))
+    meta = {'space': space, 'count': len(vectors), 'dimensions': int(vectors.shape[1]), 'labels': list(labels),
+            'built_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}
+    paths['meta'].write_text(json.dumps(meta, ensure_ascii=False), encoding='utf-8')
+    return paths['vectors']
+
+class ItemSet:
+    """One memory-mapped item set (vectors, row ids, labels)."""
+
+    def __init__(self, name: str, directory: Path = DEFAULT_DIR):
+        paths = set_paths(name, directory)
+        self.name = name
+        self.meta = json.loads(paths['meta'].read_text(encoding='utf-8'))
+        self.space = self.meta['space']
+        self.labels: List[str] = self.meta['labels']
+        self.vectors = numpy.load(paths['vectors'], mmap_mode='r')
+        self.ids = numpy.load(paths['ids'])
+        self._order = numpy.argsort(self.ids, kind='stable')
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def positions(self, row_ids: Sequence[int]) -> numpy.ndarray:
+        """Row positions of table row ids (ValueError if any is missing)."""
+        row_ids = numpy.asarray(row_ids, dtype=numpy.int64)
+        if not len(self):
+            raise ValueError(f"{self.name} is empty")
+        found = self._order[numpy.minimum(numpy.searchsorted(self.ids, row_ids, sorter=self._order), len(self) - 1)]
+        missing = self.ids[found] != row_ids
+        if missing.any():
+            raise ValueError(f"{self.name}: unknown row id(s) {row_ids[missing].tolist()[:5]}")
+        return found
+
+# ============================================================================
+# TOP-K COSINE SIMILARITY
+# ============================================================================
+
+def top_k(queries: numpy.ndarray, targets: numpy.ndarray, k: int,
+          exclude: Optional[numpy.ndarray] = None) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Best k targets per query row, by dot product (cosine for normalized rows).
+
+    Returns (positions, scores), both (queries, k), best first. `exclude`
+    gives one target position per query to skip (the item itself), or -1.
+    """
+    k = min(k, len(targets) - (exclude is not None))
+    positions = numpy.empty((len(queries), max(k, 0)), dtype=numpy.int32)
+    scores = numpy.empty((len(queries), max(k, 0)), dtype=numpy.float32)
+    if k <= 0 or len(queries) == 0:
+        return positions, scores
+
+    batch = max(1, SCORE_BUFFER // (4 * len(targets)))
+    for start in range(0, len(queries), batch):
+        block = numpy.asarray(queries[start:start + batch], dtype=numpy.float32) @ numpy.asarray(targets).T
+        rows = numpy.arange(len(block))
+        if exclude is not None:
+            skip = numpy.asarray(exclude[start:start + batch])
+            block[rows[skip >= 0], skip[skip >= 0]] = -numpy.inf
+        if k < block.shape[1]:
+            best = numpy.argpartition(block, -k, axis=1)[:, -k:]
+        else:
+            best = numpy.broadcast_to(numpy.arange(k), block.shape)
+        best_scores = numpy.take_along_axis(block, best, axis=1)
+        order = numpy.argsort(-best_scores, axis=1, kind='stable')
+        positions[start:start + len(block)] = numpy.take_along_axis(best, order, axis=1)
+        scores[start:start + len(block)] = numpy.take_along_axis(best_scores, order, axis=1)
+    return positions, scores
+
+def precompute(query: ItemSet, target: ItemSet, k: int = TOP_K,
+               directory: Path = DEFAULT_DIR) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Related table of every query item against the target set, written next to the sets."""
+    if query.space != target.space:
+        raise ValueError(f"{query.name} ({query.space}) and {target.name} ({target.space}) are different vector spaces")
+    exclude = numpy.arange(len(query)) if query.name == target.name else None
+    positions, scores = top_k(query.vectors, target.vectors, k, exclude)
+    related_path, scores_path = table_paths(query.name, target.name, directory)
+    numpy.save(related_path, positions)
+    numpy.save(scores_path, scores)
+    return positions, scores
+
+class RelatedIndex:
+    """Related-item lookups over the item sets in a directory."""
+
+    def __init__(self, directory: Path = DEFAULT_DIR):
+        self.directory = Path(directory)
+        self._sets: Dict[str, ItemSet] = {}
+        self._tables: Dict[Tuple[str, str], Tuple[numpy.ndarray, numpy.ndarray]] = {}
+
+    def item_set(self, name: str) -> ItemSet:
+        if name not in self._sets:
+            self._sets[name] = ItemSet(name, self.directory)
+        return self._sets[name]
+
+    def _table(self, query: str, target: str):
+        if (query, target) not in self._tables:
+            related_path, scores_path = table_paths(query, target, self.directory)
+            self._tables[query, target] = ((numpy.load(related_path, mmap_mode='r'), numpy.load(scores_path, mmap_mode='r'))
+                                           if related_path.exists() and scores_path.exists() else None)
+        return self._tables[query, target]
+
+    def related_many(self, source: str, row_ids: Sequence[int], target: Optional[str] = None,
+                     k: int = 10) -> List[List[Related]]:
+        """Related items of many rows: read from a precomputed table, else one batched top_k()."""
+        target = target or source
+        query_set, target_set = self.item_set(source), self.item_set(target)
+        if query_set.space != target_set.space:
+            raise ValueError(f"{source} ({query_set.space}) and {target} ({target_set.space}) are different vector spaces")
+        rows = query_set.positions(row_ids)
+        table = self._table(source, target)
+        if table is not None and table[0].shape[1] >= k:
+            positions, scores = table[0][rows, :k], table[1][rows, :k]
+        else:
+            positions, scores = top_k(query_set.vectors[rows], target_set.vectors, k,
+                                      rows if source == target else None)
+        target_ids = target_set.ids[positions].tolist()
+        return [[(row_id, target_set.labels[position], float(score))
+                 for row_id, position, score in zip(ids, position_row, score_row)]
+                for ids, position_row, score_row in zip(target_ids, positions.tolist(), scores.tolist())]
+
+    def related(self, source: str, row_id: int, target: Optional[str] = None, k: int = 10) -> List[Related]:
+        return self.related_many(source, [row_id], target, k)[0]
+
+# ============================================================================
+# TF-IDF + LSA
+# ============================================================================
+
+class SparseMatrix:
+    """Row-sorted (row, column, value) triplets with chunked vectorized products."""
+
+    def __init__(self, rows: numpy.ndarray, columns: numpy.ndarray, values: numpy.ndarray, shape: Tuple[int, int]):
+        self.rows, self.columns, self.values, self.shape = rows, columns, values, shape
+        self._by_column = numpy.argsort(columns, kind='stable')
+
+    @staticmethod
+    def _product(out_index, in_index, values, dense, out_rows) -> numpy.ndarray:
+        out = numpy.zeros((out_rows, dense.shape[1]), dtype=numpy.float32)
+        for start in range(0, len(values), SPARSE_CHUNK):
+            index = out_index[start:start + SPARSE_CHUNK]
+            contributions = values[start:start + SPARSE_CHUNK, None] * dense[in_index[start:start + SPARSE_CHUNK]]
+            starts = numpy.flatnonzero(numpy.diff(index, prepend=-1))
+            out[index[starts]] += numpy.add.reduceat(contributions, starts)
+        return out
+
+    def dot(self, dense: numpy.ndarray) -> numpy.ndarray:
+        """self @ dense"""
+        return self._product(self.rows, self.columns, self.values, dense, self.shape[0])
+
+    def tdot(self, dense: numpy.ndarray) -> numpy.ndarray:
+        """self.T @ dense"""
+        order = self._by_column
+        return self._product(self.columns[order], self.rows[order], self.values[order], dense, self.shape[1])
+
+def tfidf_matrix(documents: Iterable[str]) -> Tuple[SparseMatrix, List[str]]:
+    """Sublinear TF-IDF rows (L2-normalized) and the kept vocabulary."""
+    vocabulary: Dict[str, int] = {}
+    docs, terms, tfs = array('I'), array('I'), array('I')
+    count = 0
+    for doc, text in enumerate(documents):
+        for term, tf in Counter(words(text or '')).items():
+            docs.append(doc)
+            terms.append(vocabulary.setdefault(term, len(vocabulary)))
+            tfs.append(tf)
+        count = doc + 1
+
+    docs = numpy.frombuffer(docs, dtype=numpy.uint32).astype(numpy.int64)
+    terms = numpy.frombuffer(terms, dtype=numpy.uint32).astype(numpy.int64)
+    df = numpy.bincount(terms, minlength=len(vocabulary))
+    kept = (df >= MIN_DF) & (df <= MAX_DF * count)
+    column = numpy.cumsum(kept) - 1
+    keep = kept[terms]
+    idf = (numpy.log((1 + count) / (1 + df[kept])) + 1).astype(numpy.float32)
+
+    docs, columns = docs[keep], column[terms[keep]]
+    values = (1 + numpy.log(numpy.frombuffer(tfs, dtype=numpy.uint32)[keep].astype(numpy.float32))) * idf[columns]
+    norms = numpy.sqrt(numpy.bincount(docs, weights=values * values, minlength=count))
+    values = (values / numpy.where(norms[docs] > 0, norms[docs], 1)).astype(numpy.float32)
+    names = [None] * len(vocabulary)
+    for term, term_id in vocabulary.items():
+        names[term_id] = term
+    return SparseMatrix(docs, columns, values, (count, int(kept.sum()))), [name for name, k in zip(names, kept) if k]
+
+def orthonormalize(matrix: numpy.ndarray) -> numpy.ndarray:
+    """
+    Orthonormal basis of the columns of a tall matrix.
+
+    CholeskyQR2: two rounds of Q = A inv(chol(A.T A)).T, which cost a small
+    Gram matrix and a matrix product each (several times faster than
+    Householder QR here); falls back to QR when the Gram matrix is singular.
+    """
+    try:
+        for _ in range(2):
+            gram = (matrix.T @ matrix).astype(numpy.float64)
+            matrix = matrix @ numpy.linalg.inv(numpy.linalg.cholesky(gram).T).astype(numpy.float32)
+        return matrix
+    except numpy.linalg.LinAlgError:
+        return numpy.linalg.qr(matrix)[0]
+
+def lsa_vectors(matrix: SparseMatrix, dimensions: int = DIMENSIONS, seed: int = 0) -> numpy.ndarray:
+    """Document vectors (U * S) of a rank-`dimensions` randomized SVD of the TF-IDF matrix."""
+    rank = min(dimensions + OVERSAMPLE, *matrix.shape)
+    omega = numpy.random.default_rng(seed).standard_normal((matrix.shape[1], rank), dtype=numpy.float32)
+    basis = orthonormalize(matrix.dot(omega))
+    for _ in range(POWER_ITERATIONS):
+        basis = orthonormalize(matrix.dot(orthonormalize(matrix.tdot(basis))))
+    small = matrix.tdot(basis).T                # basis.T @ matrix: (rank, terms)
+    left, singular, _ = numpy.linalg.svd(small, full_matrices=False)
+    dimensions = min(dimensions, rank)
+    return (basis @ left[:, :dimensions]) * singular[:dimensions]
+
+# ============================================================================
+# BUILD AND IMPORT
+# ============================================================================
+
+def load_documents(cursor, name: str) -> Tuple[List[int], List[str], List[str]]:
+    """(row ids, labels, texts) of an item set; multiple rows of one id are joined."""
+    ids, labels, texts = [], [], []
+    cursor.execute(ITEM_SETS[name])
+    while True:
+        rows = cursor.fetchmany(FETCH_ROWS)
+        if not rows:
+            break
+        for row_id, label, text in rows:
+            if ids and ids[-1] == row_id:
+                texts[-1] += ' ' + (text or '')
+            else:
+                ids.append(row_id)
+                labels.append(label or '')
+                texts.append(text or '')
+    return ids, labels, texts
+
+def import_embeddings(path: Path, name: str, space: str, directory: Path = DEFAULT_DIR) -> Tuple[int, int]:
+    """
+    Import a JSON Lines embedding export as an item set; returns (rows, dimensions).
+
+    Each line is {"id": row id, "embedding": [floats, ...]} with an optional
+    "label"; the embedding may also be a JSON-encoded string (jsonb exports).
+    Rows are parsed in chunks and written straight into the .npy memmap.
+    """
+    def parse(line):
+        row = json.loads(line)
+        embedding = row['embedding']
+        return row['id'], row.get('label', str(row['id'])), json.loads(embedding) if isinstance(embedding, str) else embedding
+
+    with open(path, encoding='utf-8') as f:
+        count = sum(1 for line in f if line.strip())
+        if not count:
+            raise ValueError(f"{path} has no embeddings")
+        f.seek(0)
+        first = next((parse(line) for line in f if line.strip()), None)
+    if first is None:
+        raise ValueError(f"{path} has no embeddings")
+
+    paths = set_paths(name, directory)
+    paths['vectors'].parent.mkdir(parents=True, exist_ok=True)
+    vectors = numpy.lib.format.open_memmap(paths['vectors'], mode='w+', dtype=numpy.float32,
+                                           shape=(count, len(first[2])))
+    ids, labels, chunk, position = [], [], [], 0
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row_id, label, embedding = parse(line)
+            if len(embedding) != vectors.shape[1]:
+                raise ValueError(f"{path}: id {row_id} has {len(embedding)} dimensions, expected {vectors.shape[1]}")
+            ids.append(row_id)
+            labels.append(label)
+            chunk.append(embedding)
+            if len(chunk) == IMPORT_CHUNK:
+                vectors[position:position + len(chunk)] = normalize_rows(numpy.array(chunk, dtype=numpy.float32))
+                position, chunk = position + len(chunk), []
+        if chunk:
+            vectors[position:position + len(chunk)] = normalize_rows(numpy.array(chunk, dtype=numpy.float32))
+    vectors.flush()
+    del vectors
+
+    numpy.save(paths['ids'], numpy.asarray(ids, dtype=numpy.int64))
+    meta = {'space': space, 'count': count, 'dimensions': len(first[2]), 'labels': labels, 'source': str(path),
+            'built_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}
+    paths['meta'].write_text(json.dumps(meta, ensure_ascii=False), encoding='utf-8')
+    return count, len(first[2])
+
+def precompute_all(directory: Path, k: int) -> None:
+    names = sorted(path.name[:-len('.meta.json')] for path in Path(directory).glob('*.meta.json'))
+    if not names:
+        raise FileNotFoundError(f"No item sets in {directory} (run build or import first)")
+    sets = [ItemSet(name, directory) for name in names]
+    for query in sets:
+        for target in sets:
+            if query.space != target.space:
+                continue
+            start = time.perf_counter()
+            precompute(query, target, k, directory)
+            print(f"   ✅ {query.name} -> {target.name}: {len(query):,} x {len(target):,} "
+                  f"top-{k} in {time.perf_counter() - start:.1f}s")
+
+def build(args):
+    import mysql.connector
+    from import_quran import DB_CONFIG
+
+    print("\n🔌 Connecting to MySQL database...")
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG)
+        cursor = connection.cursor()
+    except mysql.connector.Error as err:
+        print(f"   ❌ Error: {err}")
+        sys.exit(1)
+
+    try:
+        start_time = time.time()
+        loaded = {name: load_documents(cursor, name) for name in args.sets}
+    finally:
+        cursor.close()
+        connection.close()
+    for name, (ids, _, _) in loaded.items():
+        print(f"📚 {name}: {len(ids):,} documents")
+
+    print(f"\n🧮 Fitting TF-IDF + LSA ({args.dimensions} dimensions)...")
+    matrix, vocabulary = tfidf_matrix(text for _, _, texts in loaded.values() for text in texts)
+    vectors = lsa_vectors(matrix, args.dimensions)
+    print(f"   ✅ {matrix.shape[0]:,} x {len(vocabulary):,} TF-IDF matrix ({len(matrix.values):,} nonzeros) "
+          f"in {time.time() - start_time:.1f}s")
+
+    offset = 0
+    for name, (ids, labels, _) in loaded.items():
+        path = save_set(name, vectors[offset:offset + len(ids)], ids, labels, LSA_SPACE, args.directory)
+        offset += len(ids)
+        print(f"   💾 {name} -> {path}")
+
+    if not args.no_precompute:
+        print(f"\n🔗 Precomputing top-{args.k} related items...")
+        precompute_all(args.directory, args.k)
+    print(f"\n✅ Done in {time.time() - start_time:.1f}s\n")
+
+def show_related(args):
+    related = RelatedIndex(args.directory)
+    start = time.perf_counter()
+    results = related.related(args.set, args.row_id, args.target, args.k)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for rank, (row_id, label, score) in enumerate(results, 1):
+        print(f"{rank:>3}. {score:6.3f}  {label}  (id {row_id})")
+    if not results:
+        print("No related items.")
+    print(f"\n({elapsed_ms:.2f} ms)")
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Build or query related ayahs and hadiths")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--directory', type=Path, default=DEFAULT_DIR, help="Vector directory (default: %(default)s)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = commands.add_parser('build', parents=[common], help="Fit TF-IDF + LSA vectors from the database")
+    build_parser.add_argument('--sets', nargs='+', choices=list(ITEM_SETS), default=list(ITEM_SETS),
+                              help="Item sets to vectorize (default: all)")
+    build_parser.add_argument('--dimensions', type=int, default=DIMENSIONS, help="LSA dimensions (default: %(default)s)")
+    build_parser.add_argument('-k', type=int, default=TOP_K, help="Related items per item (default: %(default)s)")
+    build_parser.add_argument('--no-precompute', action='store_true', help="Only write the vectors")
+
+    import_parser = commands.add_parser('import', parents=[common], help="Import embeddings from JSON Lines")
+    import_parser.add_argument('file', type=Path)
+    import_parser.add_argument('--set', required=True, help="Item set name (e.g. hadiths)")
+    import_parser.add_argument('--space', required=True, help="Embedding model name; only equal spaces are compared")
+
+    precompute_parser = commands.add_parser('precompute', parents=[common], help="Write all related tables")
+    precompute_parser.add_argument('-k', type=int, default=TOP_K, help="Related items per item (default: %(default)s)")
+
+    related_parser = commands.add_parser('related', parents=[common], help="Show the items related to one row")
+    related_parser.add_argument('set', help="Item set of the row (ayahs, hadiths, ...)")
+    related_parser.add_argument('row_id', type=int, help="ayahs.id / hadiths.id (or the imported id)")
+    related_parser.add_argument('--target', help="Item set to search (default: the row's own)")
+    related_parser.add_argument('-k', type=int, default=10, help="Results to return (default: %(default)s)")
+    return parser.parse_args()
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+    if args.command == 'build':
+        build(args)
+        return
+    try:
+        if args.command == 'import':
+            start = time.perf_counter()
+            count, dimensions = import_embeddings(args.file, args.set, args.space, args.directory)
+            print(f"✅ {count:,} x {dimensions} embeddings -> {set_paths(args.set, args.directory)['vectors']} "
+                  f"in {time.perf_counter() - start:.1f}s")
+        elif args.command == 'precompute':
+            precompute_all(args.directory, args.k)
+        else:
+            show_related(args)
+    except (FileNotFoundError, ValueError) as err:
+        print(f"❌ {err}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,7 @@ USE IslamicKnowledgeDB;
 -- Table: surahs
 -- Stores information about all 114 Surahs of the Quran
 CREATE TABLE IF NOT EXISTS surahs (
-  id INT AUTO_INCREMENT PRIMARY KEY,
+  id INT AUTO_INCREMENT PRIMARY KEY COMMENT 'import_quran.py inserts id = surah_number',
   surah_number TINYINT UNSIGNED NOT NULL UNIQUE,
   name_arabic VARCHAR(100) NOT NULL,
   name_english VARCHAR(100),
@@ -38,16 +38,17 @@ CREATE TABLE IF NOT EXISTS surahs (
 -- Table: ayahs
 -- Stores all verses (ayahs) of the Quran with Arabic text
 CREATE TABLE IF NOT EXISTS ayahs (
-  id INT AUTO_INCREMENT PRIMARY KEY,
+  id INT AUTO_INCREMENT PRIMARY KEY COMMENT 'import_quran.py inserts id = global ayah number (1-6236)',
   surah_id INT NOT NULL,
   ayah_number SMALLINT UNSIGNED NOT NULL,
   ayah_key VARCHAR(10) NOT NULL UNIQUE COMMENT 'Format: surah:ayah (e.g., 1:1, 114:6)',
   text_arabic TEXT NOT NULL,
-  text_clean TEXT COMMENT 'Arabic text without diacritics for simpler search',
+  text_clean TEXT COMMENT 'Arabic without marks/letter variants for search (arabic_normalizer)',
   juz TINYINT UNSIGNED COMMENT 'Juz number (1-30)',
   manzil TINYINT UNSIGNED COMMENT 'Manzil number (1-7)',
   ruku SMALLINT UNSIGNED COMMENT 'Ruku/Section number',
   page SMALLINT UNSIGNED COMMENT 'Page number in Mushaf',
+  content_hash CHAR(32) COMMENT 'MD5 of the imported content (delta imports)',
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
 
@@ -73,7 +74,7 @@ CREATE TABLE IF NOT EXISTS editions (
   slug VARCHAR(50) NOT NULL UNIQUE COMMENT 'Unique identifier (e.g., en.sahihintl, ar.muyassar)',
   name VARCHAR(255) NOT NULL COMMENT 'Display name of the edition',
   language VARCHAR(10) NOT NULL COMMENT 'ISO language code (e.g., en, ar, ur)',
-  type ENUM('translation', 'tafsir', 'recitation') NOT NULL,
+  type ENUM('translation', 'tafsir', 'recitation', 'transliteration') NOT NULL,
   author VARCHAR(255) COMMENT 'Author or translator name',
   source_api VARCHAR(255) COMMENT 'API source URL where data was obtained',
   description TEXT COMMENT 'Description of the edition',
@@ -93,6 +94,7 @@ CREATE TABLE IF NOT EXISTS ayah_data (
   ayah_id INT NOT NULL,
   edition_id INT NOT NULL,
   text LONGTEXT NOT NULL COMMENT 'Translation or Tafsir text',
+  content_hash CHAR(32) COMMENT 'MD5 of the imported content (delta imports)',
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
 
@@ -127,7 +129,7 @@ CREATE TABLE IF NOT EXISTS hadith_collections (
 -- Table: hadith_chapters
 -- Stores chapters (books) within each hadith collection
 CREATE TABLE IF NOT EXISTS hadith_chapters (
-  id INT AUTO_INCREMENT PRIMARY KEY,
+  id INT AUTO_INCREMENT PRIMARY KEY COMMENT 'import_hadith.py inserts collection_id * 100000 + chapter_number',
   collection_id INT NOT NULL,
   chapter_number INT NOT NULL,
   chapter_name_english VARCHAR(255),
@@ -150,9 +152,11 @@ CREATE TABLE IF NOT EXISTS hadiths (
   reference_number VARCHAR(50) NOT NULL COMMENT 'Book-specific hadith number',
   hadith_in_chapter INT COMMENT 'Number within the chapter',
   text_arabic LONGTEXT NOT NULL,
+  text_clean LONGTEXT COMMENT 'Arabic without marks/letter variants for search (arabic_normalizer)',
   text_english LONGTEXT,
   narrator_chain LONGTEXT COMMENT 'Isnad (chain of narrators)',
   grade VARCHAR(50) COMMENT 'Authenticity grade (Sahih, Hasan, Daif, etc.)',
+  content_hash CHAR(32) COMMENT 'MD5 of the imported content (delta imports)',
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
 
@@ -163,10 +167,48 @@ CREATE TABLE IF NOT EXISTS hadiths (
   INDEX idx_chapter_id (chapter_id),
   INDEX idx_grade (grade),
   FULLTEXT INDEX ft_text_arabic (text_arabic),
+  FULLTEXT INDEX ft_text_clean (text_clean),
   FULLTEXT INDEX ft_text_english (text_english),
   FULLTEXT INDEX ft_text_combined (text_arabic, text_english)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- Table: hadith_editions
+-- One row per (collection, language) translation served by the hadith-api CDN
+-- (e.g. urd-bukhari). Mirrors editions for the Quran.
+CREATE TABLE IF NOT EXISTS hadith_editions (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  slug VARCHAR(100) NOT NULL UNIQUE COMMENT 'CDN edition name (e.g., urd-bukhari, ind-muslim)',
+  collection_id INT NOT NULL,
+  language VARCHAR(10) NOT NULL COMMENT 'CDN language code (e.g., urd, ind, tur, ben)',
+  language_name VARCHAR(50) COMMENT 'Language display name (e.g., Urdu)',
+  author VARCHAR(255) COMMENT 'Translator',
+  source_api VARCHAR(255) COMMENT 'API source URL where data was obtained',
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+  FOREIGN KEY (collection_id) REFERENCES hadith_collections(id) ON DELETE CASCADE,
+  UNIQUE KEY unique_collection_language (collection_id, language),
+  INDEX idx_language (language)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Table: hadith_data
+-- Hadith translations per edition (mirrors ayah_data)
+CREATE TABLE IF NOT EXISTS hadith_data (
+  id BIGINT AUTO_INCREMENT PRIMARY KEY,
+  hadith_id BIGINT NOT NULL,
+  edition_id INT NOT NULL,
+  text LONGTEXT NOT NULL COMMENT 'Translated hadith text',
+  content_hash CHAR(32) COMMENT 'MD5 of the imported content (delta imports)',
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+  FOREIGN KEY (hadith_id) REFERENCES hadiths(id) ON DELETE CASCADE,
+  FOREIGN KEY (edition_id) REFERENCES hadith_editions(id) ON DELETE CASCADE,
+  UNIQUE KEY unique_hadith_edition (hadith_id, edition_id),
+  INDEX idx_edition_id (edition_id),
+  FULLTEXT INDEX ft_text (text)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 -- ============================================================================
 -- D. CROSS-REFERENCE TABLES
 -- ============================================================================
@@ -177,6 +219,8 @@ CREATE TABLE IF NOT EXISTS hadith_ayah_references (
   id INT AUTO_INCREMENT PRIMARY KEY,
   hadith_id BIGINT NOT NULL,
   ayah_id INT NOT NULL,
+  match_type ENUM('citation', 'quotation', 'surah') NOT NULL DEFAULT 'citation'
+    COMMENT 'How extract_hadith_references.py found it (surah = surah named, linked to its first ayah)',
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
   FOREIGN KEY (hadith_id) REFERENCES hadiths(id) ON DELETE CASCADE,
@@ -186,6 +230,21 @@ CREATE TABLE IF NOT EXISTS hadith_ayah_references (
   INDEX idx_ayah_id (ayah_id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- Table: hadith_clusters
+-- Near-duplicate hadiths grouped by find_duplicate_hadiths.py (MinHash/LSH)
+CREATE TABLE IF NOT EXISTS hadith_clusters (
+  hadith_id BIGINT NOT NULL,
+  language VARCHAR(10) NOT NULL COMMENT 'Text compared: ara/eng (hadiths) or a hadith_data language',
+  cluster_id BIGINT NOT NULL COMMENT 'Smallest hadith id in the cluster',
+  similarity DECIMAL(5,4) NOT NULL COMMENT 'Best estimated Jaccard similarity to another member',
+  cluster_size INT NOT NULL,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+  PRIMARY KEY (hadith_id, language),
+  FOREIGN KEY (hadith_id) REFERENCES hadiths(id) ON DELETE CASCADE,
+  INDEX idx_cluster (language, cluster_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 -- ============================================================================
 -- E. USER TABLES (For Authentication & User Data)
 -- ============================================================================
@@ -257,7 +316,40 @@ CREATE TABLE IF NOT EXISTS reading_history (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- ============================================================================
--- F. INITIAL DATA: HADITH COLLECTIONS
+-- F. IMPORT BOOKKEEPING TABLES
+-- ============================================================================
+
+-- Table: import_index_state
+-- Secondary indexes (FULLTEXT and non-unique BTREE) dropped by an importer
+-- running with --defer-indexes. Rows are written before the DROP and removed
+-- once the index is rebuilt, so any row left here marks an index a crashed
+-- import still owes.
+CREATE TABLE IF NOT EXISTS import_index_state (
+  table_name VARCHAR(64) NOT NULL,
+  index_name VARCHAR(64) NOT NULL,
+  index_type VARCHAR(16) NOT NULL DEFAULT 'FULLTEXT' COMMENT 'FULLTEXT or BTREE',
+  column_list VARCHAR(512) NOT NULL COMMENT 'Comma-separated indexed columns, with prefix lengths',
+  dropped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+  PRIMARY KEY (table_name, index_name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Table: import_journal
+-- Checkpoints for resumable imports (--resume). One row per unit of work
+-- (a Quran edition, a hadith collection, ...); rows_committed is updated in
+-- the same transaction as each inserted batch.
+CREATE TABLE IF NOT EXISTS import_journal (
+  importer VARCHAR(32) NOT NULL COMMENT 'quran, hadith, ...',
+  unit VARCHAR(100) NOT NULL COMMENT 'e.g. ayahs, edition:en.sahih, bukhari',
+  status ENUM('in_progress', 'completed') NOT NULL,
+  rows_committed INT UNSIGNED NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+  PRIMARY KEY (importer, unit)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- ============================================================================
+-- G. INITIAL DATA: HADITH COLLECTIONS
 -- ============================================================================
 
 -- Insert the six major hadith collections
@@ -271,7 +363,7 @@ INSERT INTO hadith_collections (name_english, name_arabic, slug, author, descrip
 ON DUPLICATE KEY UPDATE updated_at = CURRENT_TIMESTAMP;
 
 -- ============================================================================
--- G. SAMPLE EDITIONS (Translation & Tafsir)
+-- H. SAMPLE EDITIONS (Translation & Tafsir)
 -- ============================================================================
 
 -- Insert common English translations
@@ -285,7 +377,7 @@ INSERT INTO editions (slug, name, language, type, author, source_api) VALUES
 ON DUPLICATE KEY UPDATE updated_at = CURRENT_TIMESTAMP;
 
 -- ============================================================================
--- H. USEFUL QUERIES & EXAMPLES
+-- I. USEFUL QUERIES & EXAMPLES
 -- ============================================================================
 
 -- Query Example 1: Get all verses from Surah Al-Baqarah with English translation
@@ -354,8 +446,25 @@ WHERE b.user_id = 'user-uuid-here'
 ORDER BY b.created_at DESC;
 */
 
+-- Query Example 5: Other narrations of the same hadith (near-duplicates)
+/*
+SELECT
+    hc.slug,
+    h.reference_number,
+    c.similarity,
+    h.text_english
+FROM hadith_clusters target
+JOIN hadith_clusters c ON c.language = target.language AND c.cluster_id = target.cluster_id
+JOIN hadiths h ON c.hadith_id = h.id
+JOIN hadith_collections hc ON h.collection_id = hc.id
+WHERE target.hadith_id = 1234
+  AND target.language = 'ara'
+  AND c.hadith_id <> target.hadith_id
+ORDER BY c.similarity DESC;
+*/
+
 -- ============================================================================
--- I. DATABASE STATISTICS QUERIES
+-- J. DATABASE STATISTICS QUERIES
 -- ============================================================================
 
 -- Check table sizes
@@ -0,0 +1,651 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - BM25 Search Index
+==============================================
+
+In-process full-text search over the imported tables, replacing MySQL
+MATCH ... AGAINST (fixed ranking, stopword list, innodb_ft_min_token_size
+and latency that grows with every edition).
+
+Features:
+- Inverted index built from a table in one streaming pass; every token is
+  indexed (no stopwords, no minimum length) and ranked with BM25
+- Postings are stored in blocks of BLOCK_SIZE documents: doc number deltas
+  and term frequencies as varints, decoded with NumPy in one vectorized pass
+- Per-term maximum scores and per-block last doc numbers drive MaxScore
+  early termination: once the k-th best score exceeds what the remaining
+  (rarer-first ordered) terms could add, no new candidates are admitted,
+  hopeless candidates are dropped, and only the blocks that can contain the
+  surviving candidates are decoded; candidates are a sorted doc array
+  merged term by term, so a query never touches every document
+- Results can be restricted to groups (editions / hadith collections)
+- "Did you mean" corrections and fuzzy expansion of unknown query words
+  through a trigram index over the vocabulary (trigram_index.py)
+- One file per source, memory-mapped on load; arrays are zero-copy views
+
+Sources:
+- ayah_data:   translation texts (editions.type = 'translation'), grouped by edition slug
+- hadiths:     hadiths.text_english, grouped by collection slug
+- quran_arabic, hadiths_arabic: ayahs.text_clean / hadiths.text_clean keyed by
+  Arabic root (arabic_stemmer), so رحمة also matches الرحمن, يرحم, رحيم
+
+Usage:
+    python search_index.py build                          # every source
+    python search_index.py build --sources hadiths
+    python search_index.py search "paradise rivers" --source ayah_data -k 5 --group en.sahih
+    python search_index.py search "ebrahim" --fuzzy
+
+    from search_index import SearchIndex
+    index = SearchIndex.load('ayah_data')
+    index.search('paradise', k=10)      # [(ayah_data.id, '2:25 en.sahih', 7.31), ...]
+
+Requirements:
+    numpy; build needs mysql-connector-python
+"""
+
+import argparse
+import json
+import mmap
+import re
+import struct
+import sys
+import time
+from array import array
+from collections import Counter
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy
+
+import arabic_normalizer
+import arabic_stemmer
+from trigram_index import TrigramIndex
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_DIR = Path(__file__).resolve().with_name('search_index')
+
+K1 = 1.2
+B = 0.75
+BLOCK_SIZE = 128       # postings per block (unit of skipping)
+FUZZY_EXPANSIONS = 3   # closest terms an unknown query word expands to
+FETCH_ROWS = 2000
+
+MAGIC = b'QBM25\0\0\0'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<8sHI')   # magic, version, metadata length
+ALIGN = 8
+
+# name, dtype (stored little-endian)
+ARRAYS = (
+    ('doc_ids', '<i8'),         # table row id per document
+    ('doc_groups', '<u4'),      # group id per document
+    ('doc_lengths', '<u4'),     # tokens per document
+    ('label_offsets', '<u4'),   # documents + 1 byte offsets into labels
+    ('labels', 'u1'),
+    ('vocabulary', 'u1'),       # sorted terms joined by '\n'
+    ('df', '<u4'),              # documents per term
+    ('max_scores', '<f4'),      # best BM25 contribution per term
+    ('term_blocks', '<u4'),     # terms + 1: first block of each term
+    ('block_last', '<u4'),      # last doc number in each block
+    ('block_offsets', '<u8'),   # blocks + 1: byte offsets into postings
+    ('postings', 'u1'),
+)
+
+# ============================================================================
+# ANALYZERS
+# ============================================================================
+
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+def words(text: str) -> List[str]:
+    """Case-folded runs of letters/digits."""
+    return TOKEN_PATTERN.findall(text.casefold())
+
+def arabic_words(text: str) -> List[str]:
+    """Words of the 'search'-normalized text (marks dropped, letter variants folded)."""
+    return TOKEN_PATTERN.findall(arabic_normalizer.normalize(text))
+
+def arabic_roots(text: str) -> List[str]:
+    """Roots (arabic_stemmer) of the Arabic words, so one query matches every derived form."""
+    return arabic_stemmer.root_many(arabic_words(text))
+
+ANALYZERS: Dict[str, Callable[[str], List[str]]] = {
+    'words': words,
+    'arabic': arabic_words,
+    'arabic_root': arabic_roots,
+}
+
+# ============================================================================
+# SOURCES
+# ============================================================================
+
+# groups: (id, name) rows; documents: (row id, group id, label, text) rows
+SOURCES: Dict[str, Dict[str, str]] = {
+    'ayah_data': {
+        'analyzer': 'words',
+        'groups': "SELECT id, slug FROM editions",
+        'documents': """
+            SELECT ad.id, ad.edition_id, CONCAT(a.ayah_key, ' ', e.slug), ad.text
+            FROM ayah_data ad
+            JOIN ayahs a ON a.id = ad.ayah_id
+            JOIN editions e ON e.id = ad.edition_id
+            WHERE e.type = 'translation'
+            ORDER BY ad.id
+        """,
+    },
+    'hadiths': {
+        'analyzer': 'words',
+        'groups': "SELECT id, slug FROM hadith_collections",
+        'documents': """
+            SELECT h.id, h.collection_id, CONCAT(c.slug, ':', h.reference_number), h.text_english
+            FROM hadiths h
+            JOIN hadith_collections c ON c.id = h.collection_id
+            WHERE h.text_english IS NOT NULL
+            ORDER BY h.id
+        """,
+    },
+    'quran_arabic': {
+        'analyzer': 'arabic_root',
+        'groups': "SELECT 1, 'quran'",
+        'documents': """
+            SELECT a.id, 1, a.ayah_key, a.text_clean
+            FROM ayahs a
+            ORDER BY a.id
+        """,
+    },
+    'hadiths_arabic': {
+        'analyzer': 'arabic_root',
+        'groups': "SELECT id, slug FROM hadith_collections",
+        'documents': """
+            SELECT h.id, h.collection_id, CONCAT(c.slug, ':', h.reference_number), h.text_clean
+            FROM hadiths h
+            JOIN hadith_collections c ON c.id = h.collection_id
+            WHERE h.text_clean IS NOT NULL
+            ORDER BY h.id
+        """,
+    },
+}
+
+def index_path(source: Union[str, Path], directory: Path = DEFAULT_DIR) -> Path:
+    """A source name maps to <directory>/<name>.idx; paths are used as-is."""
+    if isinstance(source, str) and source in SOURCES:
+        return directory / f"{source}.idx"
+    return Path(source)
+
+# ============================================================================
+# VARINTS
+# ============================================================================
+
+def encode_varints(values: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """LEB128-encode uint32 values; returns (bytes, start offset of each value)."""
+    values = values.astype(numpy.uint64)
+    sizes = numpy.ones(len(values), dtype=numpy.int64)
+    for i in range(1, 5):
+        sizes += values >= (1 << (7 * i))
+    ends = numpy.cumsum(sizes)
+    starts = ends - sizes
+    out = numpy.empty(int(ends[-1]) if len(ends) else 0, dtype=numpy.uint8)
+    for i in range(5):
+        selected = sizes > i
+        byte = (values[selected] >> numpy.uint64(7 * i)) & numpy.uint64(0x7F)
+        byte |= numpy.where(sizes[selected] > i + 1, 0x80, 0).astype(numpy.uint64)
+        out[starts[selected] + i] = byte
+    return out, starts
+
+def decode_varints(data: numpy.ndarray) -> numpy.ndarray:
+    """Inverse of encode_varints over a uint8 array."""
+    if not (data & 0x80).any():
+        return data.astype(numpy.int64)
+    ends = numpy.flatnonzero(data < 0x80)
+    starts = numpy.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    shifts = (numpy.arange(len(data)) - numpy.repeat(starts, ends - starts + 1)) * 7
+    return numpy.add.reduceat((data & 0x7F).astype(numpy.int64) << shifts, starts)
+
+# ============================================================================
+# BUILDER
+# ============================================================================
+
+class IndexBuilder:
+    """Accumulates documents, then writes the block-compressed index file."""
+
+    def __init__(self, analyzer: str = 'words', k1: float = K1, b: float = B):
+        if analyzer not in ANALYZERS:
+            raise ValueError(f"Unknown analyzer {analyzer!r} (choose from {', '.join(ANALYZERS)})")
+        self.analyzer = analyzer
+        self._analyze = ANALYZERS[analyzer]
+        self.k1 = k1
+        self.b = b
+        self.vocabulary: Dict[str, int] = {}
+        self.doc_ids: List[int] = []
+        self.doc_groups: List[int] = []
+        self.doc_lengths: List[int] = []
+        self.labels: List[str] = []
+        self._terms = array('I')   # one entry per (term, doc) posting
+        self._docs = array('I')
+        self._tfs = array('I')
+
+    def add(self, row_id: int, group: int, label: str, text: Optional[str]):
+        doc = len(self.doc_ids)
+        tokens = self._analyze(text or '')
+        vocabulary = self.vocabulary
+        for term, tf in Counter(tokens).items():
+            term_id = vocabulary.get(term)
+            if term_id is None:
+                term_id = vocabulary[term] = len(vocabulary)
+            self._terms.append(term_id)
+            self._docs.append(doc)
+            self._tfs.append(tf)
+        self.doc_ids.append(row_id)
+        self.doc_groups.append(group or 0)
+        self.doc_lengths.append(len(tokens))
+        self.labels.append(label or '')
+
+    def arrays(self) -> Dict[str, numpy.ndarray]:
+        """Sort postings by (term, doc) and lay out blocks, scores and varints."""
+        terms_sorted = sorted(self.vocabulary)
+        rank = numpy.empty(len(terms_sorted), dtype=numpy.int64)
+        rank[[self.vocabulary[term] for term in terms_sorted]] = numpy.arange(len(terms_sorted))
+
+        terms = rank[numpy.frombuffer(self._terms, dtype=numpy.uint32)]
+        order = numpy.argsort(terms, kind='stable')   # docs were added in increasing order
+        terms = terms[order]
+        docs = numpy.frombuffer(self._docs, dtype=numpy.uint32)[order].astype(numpy.int64)
+        tfs = numpy.frombuffer(self._tfs, dtype=numpy.uint32)[order].astype(numpy.int64)
+
+        doc_lengths = numpy.array(self.doc_lengths, dtype=numpy.int64)
+        total_docs = len(doc_lengths)
+        avgdl = float(doc_lengths.mean()) if total_docs else 0.0
+        df = numpy.bincount(terms, minlength=len(terms_sorted))
+        term_starts = numpy.concatenate(([0], numpy.cumsum(df)))
+
+        # BM25 contribution of every posting -> per-term upper bound
+        idf = numpy.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+        norms = self.k1 * (1 - self.b + self.b * doc_lengths / (avgdl or 1))
+        weights = idf[terms] * tfs * (self.k1 + 1) / (tfs + norms[docs])
+        max_scores = (numpy.maximum.reduceat(weights, term_starts[:-1]) if len(weights)
+                      else numpy.zeros(0))
+
+        # Blocks of BLOCK_SIZE postings per term
+        local = numpy.arange(len(terms)) - term_starts[terms]
+        term_blocks = numpy.concatenate(([0], numpy.cumsum(-(-df // BLOCK_SIZE))))
+        block_of = term_blocks[terms] + local // BLOCK_SIZE
+        block_starts = numpy.flatnonzero(numpy.diff(block_of, prepend=-1))
+        block_sizes = numpy.diff(numpy.append(block_starts, len(terms)))
+        block_last = docs[block_starts + block_sizes - 1]
+
+        # Value stream per block: [doc deltas..., tfs...]; deltas restart at each term
+        deltas = numpy.diff(docs, prepend=0)
+        deltas[term_starts[:-1][df > 0]] = docs[term_starts[:-1][df > 0]]
+        within = numpy.arange(len(terms)) - block_starts[block_of]
+        delta_positions = 2 * block_starts[block_of] + within
+        values = numpy.empty(2 * len(terms), dtype=numpy.int64)
+        values[delta_positions] = deltas
+        values[delta_positions + block_sizes[block_of]] = tfs
+        postings, value_starts = encode_varints(values)
+        block_offsets = numpy.append(value_starts[2 * block_starts], len(postings))
+
+        labels = [label.encode('utf-8') for label in self.labels]
+        label_offsets = numpy.concatenate(([0], numpy.cumsum([len(label) for label in labels])))
+        return {
+            'doc_ids': numpy.array(self.doc_ids, dtype=numpy.int64),
+            'doc_groups': numpy.array(self.doc_groups, dtype=numpy.int64),
+            'doc_lengths': doc_lengths,
+            'label_offsets': label_offsets,
+            'labels': numpy.frombuffer(b''.join(labels), dtype=numpy.uint8),
+            'vocabulary': numpy.frombuffer('\n'.join(terms_sorted).encode('utf-8'), dtype=numpy.uint8),
+            'df': df,
+            'max_scores': max_scores,
+            'term_blocks': term_blocks,
+            'block_last': block_last,
+            'block_offsets': block_offsets,
+            'postings': postings,
+        }
+
+    def write(self, path: Path, source: str = '', groups: Optional[Dict[str, int]] = None) -> int:
+        """Write the index file; returns its size in bytes."""
+        arrays = self.arrays()
+        layout, position = {}, 0
+        for name, dtype in ARRAYS:
+            data = arrays[name].astype(dtype)
+            arrays[name] = data
+            position += -position % ALIGN
+            layout[name] = [position, len(data)]
+            position += data.nbytes
+
+        meta = {
+            'source': source,
+            'analyzer': self.analyzer,
+            'k1': self.k1,
+            'b': self.b,
+            'avgdl': float(arrays['doc_lengths'].mean()) if len(self.doc_ids) else 0.0,
+            'block_size': BLOCK_SIZE,
+            'groups': groups or {},
+            'built_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'arrays': layout,
+        }
+        encoded = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded)) + encoded
+        header += b'\0' * (-len(header) % ALIGN)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(header)
+            for name, _ in ARRAYS:
+                f.write(b'\0' * (-(f.tell() - len(header)) % ALIGN))
+                f.write(arrays[name].tobytes())
+            return f.tell()
+
+# ============================================================================
+# SEARCH
+# ============================================================================
+
+Result = Tuple[int, str, float]  # (row id, label, score)
+
+class SearchIndex:
+    """Memory-mapped BM25 index with MaxScore top-k evaluation."""
+
+    def __init__(self, path: Union[str, Path]):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, meta_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a search_index v{FORMAT_VERSION} file")
+        self.meta = json.loads(self._mmap[HEADER.size:HEADER.size + meta_length])
+        data_start = HEADER.size + meta_length
+        data_start += -data_start % ALIGN
+
+        for name, dtype in ARRAYS:
+            offset, count = self.meta['arrays'][name]
+            setattr(self, '_' + name, numpy.frombuffer(self._mmap, dtype=dtype, count=count,
+                                                      offset=data_start + offset))
+
+        self.analyze = ANALYZERS[self.meta['analyzer']]
+        self.k1, self.b = self.meta['k1'], self.meta['b']
+        self.groups: Dict[str, int] = self.meta['groups']
+        self.terms: List[str] = (bytes(self._vocabulary).decode('utf-8').split('\n')
+                                 if len(self._vocabulary) else [])
+        self._term_ids = {term: i for i, term in enumerate(self.terms)}
+
+        self.total_docs = len(self._doc_ids)
+        self._idf = numpy.log(1 + (self.total_docs - self._df + 0.5) / (self._df + 0.5))
+        self._norms = self.k1 * (1 - self.b + self.b * self._doc_lengths / (self.meta['avgdl'] or 1))
+
+    @classmethod
+    def load(cls, source: Union[str, Path], directory: Path = DEFAULT_DIR) -> 'SearchIndex':
+        return cls(index_path(source, directory))
+
+    def close(self):
+        """Drop the array views and unmap the file."""
+        for name, _ in ARRAYS:
+            setattr(self, '_' + name, None)
+        self._idf = self._norms = None
+        self._mmap.close()
+
+    # ------------------------------------------------------------------ terms
+
+    def term_id(self, term: str) -> Optional[int]:
+        return self._term_ids.get(term)
+
+    def document_frequency(self, term: str) -> int:
+        term_id = self._term_ids.get(term)
+        return 0 if term_id is None else int(self._df[term_id])
+
+    def label(self, doc: int) -> str:
+        return bytes(self._labels[self._label_offsets[doc]:self._label_offsets[doc + 1]]).decode('utf-8')
+
+    # --------------------------------------------------------------- postings
+
+    def postings(self, term_id: int, blocks: Optional[numpy.ndarray] = None) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """(doc numbers, term frequencies) of a term, optionally only some of its blocks."""
+        first, last = int(self._term_blocks[term_id]), int(self._term_blocks[term_id + 1])
+        if blocks is None:
+            blocks = numpy.arange(last - first)
+            data = self._postings[self._block_offsets[first]:self._block_offsets[last]]
+        else:
+            starts = self._block_offsets[first + blocks].astype(numpy.int64)
+            lengths = self._block_offsets[first + blocks + 1].astype(numpy.int64) - starts
+            gather = numpy.repeat(starts - numpy.cumsum(lengths) + lengths, lengths) + numpy.arange(lengths.sum())
+            data = self._postings[gather]
+        if not len(blocks):
+            return numpy.zeros(0, dtype=numpy.int64), numpy.zeros(0, dtype=numpy.int64)
+
+        # Every block holds [BLOCK_SIZE deltas, BLOCK_SIZE tfs] except a term's last one
+        values = decode_varints(data)
+        full = len(blocks) - int(blocks[-1] == last - first - 1 and self._df[term_id] % BLOCK_SIZE != 0)
+        head = values[:2 * BLOCK_SIZE * full].reshape(full, 2, BLOCK_SIZE)
+        tail = values[2 * BLOCK_SIZE * full:]
+        tail_deltas, tail_tfs = tail[:len(tail) // 2], tail[len(tail) // 2:]
+
+        # Each block's first delta is relative to the previous block's last doc
+        bases = numpy.where(blocks > 0, self._block_last[first + numpy.maximum(blocks - 1, 0)], 0).astype(numpy.int64)
+        docs = numpy.cumsum(head[:, 0, :], axis=1) + bases[:full, None]
+        if len(tail_deltas):
+            docs = numpy.concatenate((docs.ravel(), numpy.cumsum(tail_deltas) + bases[-1]))
+            return docs, numpy.concatenate((head[:, 1, :].ravel(), tail_tfs))
+        return docs.ravel(), head[:, 1, :].ravel()
+
+    def _weights(self, term_id: int, docs: numpy.ndarray, tfs: numpy.ndarray) -> numpy.ndarray:
+        return self._idf[term_id] * tfs * (self.k1 + 1) / (tfs + self._norms[docs])
+
+    def _group_mask(self, groups: Optional[Iterable[str]]) -> Optional[numpy.ndarray]:
+        if not groups:
+            return None
+        unknown = [group for group in groups if group not in self.groups]
+        if unknown:
+            raise ValueError(f"Unknown group(s): {', '.join(unknown)}")
+        return numpy.isin(self._doc_groups, [self.groups[group] for group in groups])
+
+    # ----------------------------------------------------------------- search
+
+    @cached_property
+    def spelling(self) -> TrigramIndex:
+        """Trigram index over this index's vocabulary (built on first use)."""
+        return TrigramIndex(self.terms, self._df)
+
+    def correct(self, query: str) -> Tuple[str, Dict[str, str]]:
+        """("did you mean" query, {unknown token: correction}) for tokens not in the vocabulary."""
+        tokens = self.analyze(query)
+        corrections = {}
+        for token in tokens:
+            if token not in self._term_ids and token not in corrections:
+                suggestions = self.spelling.suggest(token, limit=1)
+                if suggestions:
+                    corrections[token] = suggestions[0][0]
+        return ' '.join(corrections.get(token, token) for token in tokens), corrections
+
+    def query_terms(self, query: str, fuzzy: bool = False) -> List[int]:
+        """
+        Distinct indexed term ids of a query. With `fuzzy`, each unknown token
+        is replaced by its FUZZY_EXPANSIONS closest vocabulary terms.
+        """
+        term_ids = []
+        for token in self.analyze(query):
+            term_id = self._term_ids.get(token)
+            if term_id is not None:
+                term_ids.append(term_id)
+            elif fuzzy:
+                suggestions = self.spelling.suggest(token, limit=FUZZY_EXPANSIONS)
+                term_ids += [self._term_ids[term] for term, distance, _ in suggestions
+                             if distance == suggestions[0][1]]
+        return list(dict.fromkeys(term_ids))
+
+    def search_terms(self, term_ids: Sequence[int], k: int = 10, groups: Optional[Iterable[str]] = None,
+                     exhaustive: bool = False) -> List[Tuple[int, float]]:
+        """Top-k (doc number, score) for a bag of term ids, best first."""
+        if not term_ids or k <= 0:
+            return []
+        mask = self._group_mask(groups)
+        term_ids = sorted(term_ids, key=lambda term_id: -self._max_scores[term_id])
+        # Stored bounds are float32; pad them so rounding never prunes a real candidate
+        bounds = self._max_scores[term_ids].astype(numpy.float64) * (1 + 1e-6)
+        remaining = numpy.append(numpy.cumsum(bounds[::-1])[::-1], 0)   # best score still addable from term i on
+
+        # Candidates are a sorted doc array with parallel scores. While a new
+        # doc can still reach the top k, each term's postings are merged in;
+        # once the k-th best score exceeds what the remaining terms could add,
+        # the candidate set is closed, pruned after every term, and only the
+        # blocks of later terms that can hold a candidate are decoded.
+        docs = numpy.zeros(0, dtype=numpy.int64)
+        scores = numpy.zeros(0)
+        closed = False
+        for i, term_id in enumerate(term_ids):
+            if closed:
+                first, last = int(self._term_blocks[term_id]), int(self._term_blocks[term_id + 1])
+                blocks = numpy.unique(numpy.searchsorted(self._block_last[first:last], docs))
+                blocks = blocks[blocks < last - first]
+                term_docs, tfs = self.postings(term_id, blocks if 2 * len(blocks) < last - first else None)
+            else:
+                term_docs, tfs = self.postings(term_id)
+                if mask is not None:
+                    keep = mask[term_docs]
+                    term_docs, tfs = term_docs[keep], tfs[keep]
+            weights = self._weights(term_id, term_docs, tfs)
+
+            positions = numpy.searchsorted(docs, term_docs)
+            found = positions < len(docs)
+            found[found] = docs[positions[found]] == term_docs[found]
+            scores[positions[found]] += weights[found]
+            if not closed:
+                docs = numpy.insert(docs, positions[~found], term_docs[~found])
+                scores = numpy.insert(scores, positions[~found], weights[~found])
+
+            if exhaustive or len(docs) < k or i + 1 == len(term_ids):
+                continue
+            threshold = numpy.partition(scores, -k)[-k]
+            if remaining[i + 1] <= threshold:
+                # No unseen doc can enter the top k; drop those that cannot reach it
+                closed = True
+                keep = scores + remaining[i + 1] >= threshold
+                docs, scores = docs[keep], scores[keep]
+
+        if len(docs) > k:
+            top = numpy.argpartition(-scores, k - 1)[:k]
+        else:
+            top = numpy.arange(len(docs))
+        top = top[numpy.lexsort((docs[top], -scores[top]))]
+        return [(int(docs[i]), float(scores[i])) for i in top]
+
+    def search(self, query: str, k: int = 10, groups: Optional[Iterable[str]] = None,
+               exhaustive: bool = False, fuzzy: bool = False) -> List[Result]:
+        """Top-k (row id, label, score) for a free-text query."""
+        return [(int(self._doc_ids[doc]), self.label(doc), score)
+                for doc, score in self.search_terms(self.query_terms(query, fuzzy), k, groups, exhaustive)]
+
+    def matching_row_ids(self, query: str) -> numpy.ndarray:
+        """Row ids of every document containing at least one query term."""
+        term_ids = self.query_terms(query)
+        if not term_ids:
+            return numpy.zeros(0, dtype=numpy.int64)
+        docs = numpy.unique(numpy.concatenate([self.postings(term_id)[0] for term_id in term_ids]))
+        return self._doc_ids[docs]
+
+# ============================================================================
+# BUILD FROM THE DATABASE
+# ============================================================================
+
+def build_source(cursor, source: str, path: Path) -> Tuple[IndexBuilder, int]:
+    config = SOURCES[source]
+    cursor.execute(config['groups'])
+    groups = {name: group_id for group_id, name in cursor.fetchall()}
+
+    builder = IndexBuilder(config['analyzer'])
+    cursor.execute(config['documents'])
+    while True:
+        rows = cursor.fetchmany(FETCH_ROWS)
+        if not rows:
+            break
+        for row_id, group_id, label, text in rows:
+            builder.add(row_id, group_id, label, text)
+    return builder, builder.write(path, source, groups)
+
+def build(args):
+    import mysql.connector
+    from import_quran import DB_CONFIG
+
+    print("\n🔌 Connecting to MySQL database...")
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG)
+        cursor = connection.cursor()
+    except mysql.connector.Error as err:
+        print(f"   ❌ Error: {err}")
+        sys.exit(1)
+
+    try:
+        for source in args.sources:
+            start_time = time.time()
+            path = index_path(source, args.directory)
+            print(f"\n📚 Indexing {source}...")
+            builder, size = build_source(cursor, source, path)
+            postings = len(builder._docs)
+            print(f"   ✅ {len(builder.doc_ids):,} documents, {len(builder.vocabulary):,} terms, "
+                  f"{postings:,} postings -> {path} ({size / 1e6:.1f} MB, "
+                  f"{size / max(postings, 1):.2f} bytes/posting) in {time.time() - start_time:.1f}s")
+        print()
+    finally:
+        cursor.close()
+        connection.close()
+
+def search(args):
+    start = time.perf_counter()
+    index = SearchIndex.load(args.source, args.directory)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    results = index.search(args.query, args.k, args.group, args.exhaustive, args.fuzzy)
+    query_ms = (time.perf_counter() - start) * 1000
+
+    suggestion, corrections = index.correct(args.query)
+    if corrections:
+        print(f"{'Expanded' if args.fuzzy else 'Did you mean'}: {suggestion}\n")
+
+    for rank, (row_id, label, score) in enumerate(results, 1):
+        print(f"{rank:>3}. {score:7.3f}  {label}  (id {row_id})")
+    if not results:
+        print("No results.")
+    print(f"\n({index.total_docs:,} documents; loaded in {load_ms:.1f} ms, query {query_ms:.2f} ms)")
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Build or query the BM25 search indexes")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--directory', type=Path, default=DEFAULT_DIR, help="Index directory (default: %(default)s)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = commands.add_parser('build', parents=[common], help="Build indexes from the database")
+    build_parser.add_argument('--sources', nargs='+', choices=list(SOURCES), default=list(SOURCES),
+                              help="Sources to index (default: all)")
+
+    search_parser = commands.add_parser('search', parents=[common], help="Query an index")
+    search_parser.add_argument('query', help="Free-text query")
+    search_parser.add_argument('--source', default='ayah_data', help="Source name or index file (default: %(default)s)")
+    search_parser.add_argument('-k', type=int, default=10, help="Results to return (default: %(default)s)")
+    search_parser.add_argument('--group', nargs='+', help="Only these editions / collections")
+    search_parser.add_argument('--exhaustive', action='store_true', help="Score every match (no early termination)")
+    search_parser.add_argument('--fuzzy', action='store_true', help="Expand misspelled/unknown words to close terms")
+    return parser.parse_args()
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+    if args.command == 'build':
+        build(args)
+        return
+    try:
+        search(args)
+    except (FileNotFoundError, ValueError) as err:
+        print(f"❌ {err}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Static Shard Export
+================================================
+
+Renders the "surah N / page N / juz N with translations X, Y" responses once,
+as static files a CDN can serve, instead of joining ayahs, ayah_data and
+editions on every request.
+
+Output layout (one set of files per shard):
+    <output>/surah/2.json       <output>/surah/2.bin
+    <output>/surah/2.json.gz    <output>/surah/2.bin.gz
+    <output>/surah/2.json.zst   <output>/surah/2.bin.zst    (when zstandard is installed)
+    <output>/page/50.*  <output>/juz/30.*
+    <output>/manifest.json      editions, per-shard fingerprints and file sizes
+
+Features:
+- JSON shards carry surah and edition metadata plus every ayah with its
+  Arabic text and the chosen translations/tafsirs
+- Binary shards (.bin) carry only the texts: a uint16 array of global ayah
+  numbers and, per column, a uint32 offset table plus a UTF-8 blob, all
+  4-byte aligned so clients can wrap them in typed arrays without copying
+- Pre-compressed copies: gzip -9 (deterministic, mtime 0) and zstd -19 if
+  the optional zstandard package is installed
+- Rendering and compression run in a process pool across all cores
+- Incremental: a first pass reads only ids and content hashes, fingerprints
+  every shard and compares against manifest.json; texts are fetched and
+  files rewritten only for shards whose fingerprint changed (--force
+  rebuilds everything). Shards that no longer exist are deleted.
+- Every file is written to a temporary name and renamed into place, and the
+  manifest is written last, so an interrupted run is simply redone next time
+
+Binary shard layout (little-endian):
+    header        magic b'QSHD', version (u16), ayah count (u16), column count (u16)
+    column names  per column: length (u8) + UTF-8 name ('arabic', then edition slugs)
+    numbers       global ayah number per ayah (u16)
+    columns       per column: ayah count + 1 byte offsets (u32), then the texts
+
+Usage:
+    python static_export.py --output /srv/cdn/quran
+    python static_export.py --editions en.sahih en.yusufali --kinds surah page
+    python static_export.py --all-editions --workers 8
+    python static_export.py --force                      # ignore manifest.json
+
+Requirements:
+    mysql-connector-python; zstandard (optional, for .zst files)
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from quran_coords import QuranCoords
+
+try:
+    import zstandard
+except ImportError:  # .zst files are skipped
+    zstandard = None
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_OUTPUT = Path(__file__).resolve().with_name('static')
+
+SHARD_KINDS = ('surah', 'page', 'juz')
+FORMAT_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+
+GZIP_LEVEL = 9
+ZSTD_LEVEL = 19
+ID_CHUNK = 1000        # ids per IN (...) when fetching texts
+FETCH_ROWS = 2000
+
+SHARD_MAGIC = b'QSHD'
+SHARD_HEADER = struct.Struct('<4sHHH')   # magic, version, ayah count, column count
+ALIGN = 4
+
+# ayah tuple fields (first pass)
+AYAH_ID, NUMBER, SURAH, AYAH, JUZ, PAGE, HASH = range(7)
+
+def _padding(position: int) -> int:
+    return -position % ALIGN
+
+def write_atomic(path: Path, data: bytes):
+    """Write `data` to a temporary file next to `path`, then rename it into place."""
+    fd, tmp_path = tempfile.mkstemp(prefix=path.name + '.', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+# ============================================================================
+# ENCODING (runs in worker processes)
+# ============================================================================
+
+def encode_binary(numbers: Sequence[int], columns: Dict[str, Sequence[str]]) -> bytes:
+    """Pack global ayah numbers and one text per ayah per column."""
+    parts = [SHARD_HEADER.pack(SHARD_MAGIC, FORMAT_VERSION, len(numbers), len(columns))]
+    for name in columns:
+        encoded = name.encode('utf-8')
+        parts += [bytes([len(encoded)]), encoded]
+    parts.append(b'\0' * _padding(sum(len(part) for part in parts)))
+
+    values = array('H', numbers)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    parts.append(values.tobytes())
+    position = sum(len(part) for part in parts)
+
+    for texts in columns.values():
+        parts.append(b'\0' * _padding(position))
+        blobs = [text.encode('utf-8') for text in texts]
+        offsets = array('I', [0])
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        parts.append(offsets.tobytes())
+        parts += blobs
+        position = sum(len(part) for part in parts)
+    return b''.join(parts)
+
+def decode_binary(data: bytes) -> Tuple[List[int], Dict[str, List[str]]]:
+    """Inverse of encode_binary (used to verify exports and by Python clients)."""
+    magic, version, count, column_count = SHARD_HEADER.unpack_from(data, 0)
+    if magic != SHARD_MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"Not a v{FORMAT_VERSION} shard")
+    position = SHARD_HEADER.size
+    names = []
+    for _ in range(column_count):
+        length = data[position]
+        names.append(data[position + 1:position + 1 + length].decode('utf-8'))
+        position += 1 + length
+    position += _padding(position)
+
+    numbers = array('H')
+    numbers.frombytes(data[position:position + 2 * count])
+    if sys.byteorder != 'little':
+        numbers.byteswap()
+    position += 2 * count
+    columns = {}
+    for name in names:
+        position += _padding(position)
+        offsets = array('I')
+        offsets.frombytes(data[position:position + 4 * (count + 1)])
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        position += 4 * (count + 1)
+        columns[name] = [data[position + offsets[i]:position + offsets[i + 1]].decode('utf-8')
+                         for i in range(count)]
+        position += offsets[count]
+    return list(numbers), columns
+
+def compressed(data: bytes) -> Dict[str, bytes]:
+    """{suffix: bytes} for the raw data and every available compressor."""
+    variants = {'': data, '.gz': gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)}
+    if zstandard is not None:
+        variants['.zst'] = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return variants
+
+def render_shard(task: Tuple[str, str, dict, List[str]]) -> Tuple[str, Dict[str, int]]:
+    """Write every file of one shard; returns (shard name, {file name: size})."""
+    output, name, document, slugs = task
+    ayahs = document['ayahs']
+    columns = {'arabic': [ayah['text'] for ayah in ayahs]}
+    for slug in slugs:
+        columns[slug] = [ayah['translations'].get(slug, '') for ayah in ayahs]
+
+    formats = {
+        '.json': json.dumps(document, ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+        '.bin': encode_binary([ayah['number'] for ayah in ayahs], columns),
+    }
+    base = Path(output) / name
+    base.parent.mkdir(parents=True, exist_ok=True)
+    files = {}
+    for extension, data in formats.items():
+        for suffix, payload in compressed(data).items():
+            path = base.with_name(base.name + extension + suffix)
+            write_atomic(path, payload)
+            files[path.name] = len(payload)
+    return name, files
+
+# ============================================================================
+# SHARD PLANNING AND FINGERPRINTS
+# ============================================================================
+
+def plan_shards(ayahs: List[tuple], kinds: Iterable[str]) -> Dict[str, List[int]]:
+    """{'surah/2': [indexes into ayahs], ...} in mushaf order."""
+    shards: Dict[str, List[int]] = {}
+    field = {'surah': SURAH, 'page': PAGE, 'juz': JUZ}
+    for index, ayah in enumerate(ayahs):
+        for kind in kinds:
+            if ayah[field[kind]] is not None:
+                shards.setdefault(f"{kind}/{ayah[field[kind]]}", []).append(index)
+    return shards
+
+def fingerprint(members: List[int], ayahs: List[tuple], data_hashes: Dict[Tuple[int, int], str],
+                edition_ids: List[int], header: str, surah_meta: Dict[int, str]) -> str:
+    """MD5 over everything a shard's files are rendered from."""
+    digest = hashlib.md5(header.encode('utf-8'))
+    seen_surahs = set()
+    for index in members:
+        ayah = ayahs[index]
+        if ayah[SURAH] not in seen_surahs:
+            seen_surahs.add(ayah[SURAH])
+            digest.update(surah_meta[ayah[SURAH]].encode('utf-8'))
+        digest.update(f"|{ayah[NUMBER]}:{ayah[JUZ]}:{ayah[PAGE]}:{ayah[HASH]}".encode('ascii'))
+        for edition_id in edition_ids:
+            digest.update((data_hashes.get((ayah[AYAH_ID], edition_id)) or '-').encode('ascii'))
+    return digest.hexdigest()
+
+def load_manifest(output: Path) -> Dict:
+    try:
+        return json.loads((output / MANIFEST_NAME).read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+# ============================================================================
+# DATABASE
+# ============================================================================
+
+def fetch_rows(cursor, query: str, params: Sequence = ()) -> Iterable[tuple]:
+    cursor.execute(query, params)
+    while True:
+        rows = cursor.fetchmany(FETCH_ROWS)
+        if not rows:
+            return
+        yield from rows
+
+def chunks(values: List[int], size: int = ID_CHUNK) -> Iterable[List[int]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+def load_structure(cursor, slugs: List[str]):
+    """Surahs, editions and (without texts) every ayah and its content hashes."""
+    cursor.execute("""
+        SELECT surah_number, name_arabic, name_english, revelation_place, ayah_count
+        FROM surahs ORDER BY surah_number
+    """)
+    surahs = {row[0]: {'number': row[0], 'name_arabic': row[1], 'name_english': row[2],
+                       'revelation_place': row[3], 'ayah_count': row[4]}
+              for row in cursor.fetchall()}
+    coords = QuranCoords([surah['ayah_count'] for surah in surahs.values()], {})
+
+    cursor.execute("SELECT id, slug, name, language, type FROM editions")
+    by_slug = {row[1]: row for row in cursor.fetchall()}
+    unknown = [slug for slug in slugs if slug not in by_slug]
+    if unknown:
+        raise ValueError(f"Unknown edition(s): {', '.join(unknown)}")
+    editions = [{'slug': slug, 'name': by_slug[slug][2], 'language': by_slug[slug][3],
+                 'type': by_slug[slug][4]} for slug in slugs]
+    edition_ids = [by_slug[slug][0] for slug in slugs]
+
+    ayahs = [(ayah_id, coords.number(surah, ayah), surah, ayah, juz, page, ayah_hash)
+             for ayah_id, surah, ayah, juz, page, ayah_hash in fetch_rows(cursor, """
+                 SELECT a.id, s.surah_number, a.ayah_number, a.juz, a.page,
+                        COALESCE(a.content_hash, MD5(a.text_arabic))
+                 FROM ayahs a JOIN surahs s ON s.id = a.surah_id
+             """)]
+    ayahs.sort(key=lambda ayah: ayah[NUMBER])
+
+    data_hashes: Dict[Tuple[int, int], str] = {}
+    if edition_ids:
+        placeholders = ', '.join(['%s'] * len(edition_ids))
+        for ayah_id, edition_id, data_hash in fetch_rows(cursor, f"""
+            SELECT ayah_id, edition_id, COALESCE(content_hash, MD5(text))
+            FROM ayah_data WHERE edition_id IN ({placeholders})
+        """, edition_ids):
+            data_hashes[(ayah_id, edition_id)] = data_hash
+    return surahs, editions, edition_ids, ayahs, data_hashes
+
+def load_texts(cursor, ayah_ids: List[int], edition_ids: List[int],
+               slugs: List[str]) -> Tuple[Dict[int, str], Dict[int, Dict[str, str]]]:
+    """Arabic text and {slug: text} per ayah id, for the ayahs being re-rendered."""
+    slug_of = dict(zip(edition_ids, slugs))
+    arabic: Dict[int, str] = {}
+    translations: Dict[int, Dict[str, str]] = {}
+    for ids in chunks(ayah_ids):
+        placeholders = ', '.join(['%s'] * len(ids))
+        arabic.update(fetch_rows(cursor, f"SELECT id, text_arabic FROM ayahs WHERE id IN ({placeholders})", ids))
+        if edition_ids:
+            edition_placeholders = ', '.join(['%s'] * len(edition_ids))
+            for ayah_id, edition_id, text in fetch_rows(cursor, f"""
+                SELECT ayah_id, edition_id, text FROM ayah_data
+                WHERE ayah_id IN ({placeholders}) AND edition_id IN ({edition_placeholders})
+            """, ids + edition_ids):
+                translations.setdefault(ayah_id, {})[slug_of[edition_id]] = text
+    return arabic, translations
+
+def shard_document(name: str, members: List[int], ayahs: List[tuple], surahs: Dict[int, dict],
+                   editions: List[dict], arabic: Dict[int, str],
+                   translations: Dict[int, Dict[str, str]]) -> dict:
+    kind, number = name.split('/')
+    rows = [ayahs[index] for index in members]
+    return {
+        'type': kind,
+        'number': int(number),
+        'editions': editions,
+        'surahs': [surahs[surah] for surah in dict.fromkeys(ayah[SURAH] for ayah in rows)],
+        'ayahs': [{
+            'number': ayah[NUMBER],
+            'key': f"{ayah[SURAH]}:{ayah[AYAH]}",
+            'surah': ayah[SURAH],
+            'ayah': ayah[AYAH],
+            'juz': ayah[JUZ],
+            'page': ayah[PAGE],
+            'text': arabic.get(ayah[AYAH_ID], ''),
+            'translations': translations.get(ayah[AYAH_ID], {}),
+        } for ayah in rows],
+    }
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+def remove_files(output: Path, name: str, files: Iterable[str]):
+    for file_name in files:
+        try:
+            (output / name).with_name(file_name).unlink()
+        except FileNotFoundError:
+            pass
+
+def export(args):
+    import mysql.connector
+    from import_quran import DB_CONFIG
+
+    output: Path = args.output
+    output.mkdir(parents=True, exist_ok=True)
+
+    print("\n🔌 Connecting to MySQL database...")
+    try:
+        connection = mysql.connector.connect(**DB_CONFIG)
+        cursor = connection.cursor()
+    except mysql.connector.Error as err:
+        print(f"   ❌ Error: {err}")
+        sys.exit(1)
+
+    try:
+        start_time = time.time()
+        if args.all_editions:
+            cursor.execute("SELECT slug FROM editions ORDER BY id")
+            slugs = [row[0] for row in cursor.fetchall()]
+        else:
+            slugs = args.editions or []
+
+        print("🔎 Fingerprinting shards...")
+        try:
+            surahs, editions, edition_ids, ayahs, data_hashes = load_structure(cursor, slugs)
+        except ValueError as err:
+            print(f"   ❌ {err}")
+            sys.exit(1)
+
+        header = json.dumps([FORMAT_VERSION, editions], ensure_ascii=False, sort_keys=True)
+        surah_meta = {number: json.dumps(surah, ensure_ascii=False, sort_keys=True)
+                      for number, surah in surahs.items()}
+        shards = plan_shards(ayahs, args.kinds)
+        fingerprints = {name: fingerprint(members, ayahs, data_hashes, edition_ids, header, surah_meta)
+                        for name, members in shards.items()}
+
+        previous = {} if args.force else load_manifest(output).get('shards', {})
+        changed = [name for name, value in fingerprints.items()
+                   if previous.get(name, {}).get('fingerprint') != value]
+        print(f"   {len(shards):,} shards, {len(changed):,} to render")
+
+        manifest_shards = {name: previous[name] for name in shards if name not in changed}
+        if changed:
+            ayah_ids = sorted({ayahs[index][AYAH_ID] for name in changed for index in shards[name]})
+            print(f"📥 Loading texts for {len(ayah_ids):,} ayahs x {len(slugs) + 1} columns...")
+            arabic, translations = load_texts(cursor, ayah_ids, edition_ids, slugs)
+
+            tasks = (
+                (str(output), name,
+                 shard_document(name, shards[name], ayahs, surahs, editions, arabic, translations), slugs)
+                for name in changed
+            )
+            formats = 'json + bin, raw + gzip' + (' + zstd' if zstandard is not None else '')
+            print(f"🗜  Rendering with {args.workers} worker(s) ({formats})...")
+            if args.workers > 1:
+                with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                    results = list(executor.map(render_shard, tasks, chunksize=4))
+            else:
+                results = [render_shard(task) for task in tasks]
+
+            for name, files in results:
+                stale = set(previous.get(name, {}).get('files', {})) - set(files)
+                remove_files(output, name, stale)
+                manifest_shards[name] = {'fingerprint': fingerprints[name], 'ayahs': len(shards[name]),
+                                         'files': files}
+
+        removed = [name for name in previous if name not in shards]
+        for name in removed:
+            remove_files(output, name, previous[name].get('files', {}))
+
+        manifest = {'format_version': FORMAT_VERSION,
+                    'editions': ['arabic'] + slugs,
+                    'generated_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                    'shards': manifest_shards}
+        write_atomic(output / MANIFEST_NAME,
+                     json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True).encode('utf-8'))
+
+        total_bytes = sum(size for shard in manifest_shards.values() for size in shard['files'].values())
+        print(f"   ✅ {len(changed):,} rendered, {len(shards) - len(changed):,} unchanged, "
+              f"{len(removed):,} removed ({total_bytes / 1e6:.1f} MB on disk) "
+              f"in {time.time() - start_time:.2f} seconds\n")
+    finally:
+        cursor.close()
+        connection.close()
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Export static surah/page/juz shards for CDN serving")
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT, help="Output directory (default: %(default)s)")
+    parser.add_argument('--editions', nargs='+', metavar='SLUG', help="Edition slugs to include (e.g. en.sahih)")
+    parser.add_argument('--all-editions', action='store_true', help="Include every edition in the database")
+    parser.add_argument('--kinds', nargs='+', choices=SHARD_KINDS, default=list(SHARD_KINDS),
+                        help="Shard kinds to export (default: all)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Render processes (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="Re-render every shard, ignoring manifest.json")
+    return parser.parse_args()
+
+def main():
+    """Main execution function."""
+    export(parse_args())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Islamic Knowledge Database - Trigram Spelling Index
+===================================================
+
+Typo and transliteration tolerant term lookup ("ebrahim" -> ibrahim,
+"sulaiman" -> sulayman, "paradice" -> paradise) over the vocabulary of a
+search index, used by search_index.py for "did you mean" suggestions and
+fuzzy query expansion.
+
+Features:
+- Indexes the vocabulary, not the documents: every distinct term is padded
+  ($$term$$) and split into character trigrams; trigram -> term ids postings
+  are stored CSR-style in NumPy arrays (a few MB for 100k+ terms), so the
+  index stays in memory and grows with the vocabulary, not with editions
+- Candidate generation counts shared trigrams in one vectorized pass and
+  keeps terms that share enough of them for the edit budget (an edit
+  destroys at most 4 trigrams) and whose length is within the budget
+- Candidates are verified with an optimal-string-alignment edit distance
+  (transpositions count once): one by one with early exit when there are
+  few, in a single NumPy DP over all of them when there are many
+- Suggestions are ranked by distance, then by document frequency
+
+The edit budget grows with word length: words under 3 letters are only
+matched exactly, 3-6 letters allow 1 edit, longer words 2, which keeps the
+shared-trigram bound above zero for every word.
+
+Usage:
+    python trigram_index.py ebrahim sulaiman paradice --source ayah_data
+    python trigram_index.py wudhu --source hadiths --max-distance 2
+
+    from search_index import SearchIndex
+    index = SearchIndex.load('hadiths')
+    index.spelling.suggest('wudhu')         # [('wudu', 1, 412), ...]
+    index.correct('fastng in ramadan')      # ('fasting in ramadan', {'fastng': 'fasting'})
+
+Requirements:
+    numpy
+"""
+
+import argparse
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+GRAM = 3
+PAD = '$'
+EDIT_GRAMS = GRAM + 1   # trigrams one edit can destroy (a transposition touches 4)
+MAX_SUGGESTIONS = 5
+BATCH_VERIFY = 32       # candidates verified with the vectorized DP from this many on
+
+Suggestion = Tuple[str, int, int]  # (term, edit distance, document frequency)
+
+def max_edits(word: str) -> int:
+    """Edit budget for a query word of this length."""
+    if len(word) < 3:
+        return 0
+    return 1 if len(word) <= 6 else 2
+
+def trigrams(term: str) -> set:
+    padded = f"{PAD * (GRAM - 1)}{term}{PAD * (GRAM - 1)}"
+    return {padded[i:i + GRAM] for i in range(len(padded) - GRAM + 1)}
+
+# ============================================================================
+# EDIT DISTANCE
+# ============================================================================
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, or limit + 1 once it exceeds `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        char = a[i - 1]
+        for j in range(1, len(b) + 1):
+            cost = 0 if char == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and j > 1 and char == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+def edit_distances(word: str, terms: Sequence[str], limit: int) -> numpy.ndarray:
+    """
+    edit_distance() of `word` to many terms at once (capped at limit + 1).
+
+    The DP runs over all terms in lockstep: substitutions, deletions and
+    transpositions are elementwise per row, and the left-to-right insertion
+    chain is a running minimum (current[j] = min_k tmp[k] + j - k).
+    """
+    if not terms:
+        return numpy.zeros(0, dtype=numpy.int64)
+    width = max(len(term) for term in terms)
+    codes = numpy.array(terms, dtype=f'U{width}').view(numpy.uint32).reshape(len(terms), width).astype(numpy.int64)
+    codes[codes == 0] = -1
+    lengths = numpy.fromiter((len(term) for term in terms), dtype=numpy.int64, count=len(terms))
+    columns = numpy.arange(width + 1)
+
+    previous2 = None
+    previous = numpy.broadcast_to(columns, (len(terms), width + 1)).copy()
+    for i, char in enumerate(word, 1):
+        current = numpy.empty_like(previous)
+        current[:, 0] = i
+        current[:, 1:] = numpy.minimum(previous[:, :-1] + (codes != ord(char)), previous[:, 1:] + 1)
+        if previous2 is not None:
+            swapped = (codes[:, :-1] == ord(char)) & (codes[:, 1:] == ord(word[i - 2]))
+            current[:, 2:] = numpy.where(swapped, numpy.minimum(current[:, 2:], previous2[:, :-2] + 1), current[:, 2:])
+        current = numpy.minimum.accumulate(current - columns, axis=1) + columns
+        previous2, previous = previous, current
+    return numpy.minimum(previous[numpy.arange(len(terms)), lengths], limit + 1)
+
+# ============================================================================
+# TRIGRAM INDEX
+# ============================================================================
+
+class TrigramIndex:
+    """Character trigram index over a vocabulary (term -> document frequency)."""
+
+    def __init__(self, terms: Sequence[str], frequencies: Optional[Sequence[int]] = None):
+        self.terms = list(terms)
+        self.frequencies = numpy.asarray(frequencies if frequencies is not None else [1] * len(self.terms),
+                                         dtype=numpy.int64)
+        self.lengths = numpy.fromiter((len(term) for term in self.terms), dtype=numpy.int32, count=len(self.terms))
+        self._term_ids = {term: i for i, term in enumerate(self.terms)}
+
+        self._gram_ids = {}
+        grams, term_ids = array('I'), array('I')
+        for term_id, term in enumerate(self.terms):
+            for gram in trigrams(term):
+                grams.append(self._gram_ids.setdefault(gram, len(self._gram_ids)))
+                term_ids.append(term_id)
+        grams = numpy.frombuffer(grams, dtype=numpy.uint32)
+        order = numpy.argsort(grams, kind='stable')
+        self._postings = numpy.frombuffer(term_ids, dtype=numpy.uint32)[order]
+        self._offsets = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(grams, minlength=len(self._gram_ids)))))
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the NumPy arrays (postings, offsets, lengths, frequencies)."""
+        return self._postings.nbytes + self._offsets.nbytes + self.lengths.nbytes + self.frequencies.nbytes
+
+    def frequency(self, term: str) -> int:
+        term_id = self._term_ids.get(term)
+        return 0 if term_id is None else int(self.frequencies[term_id])
+
+    def candidates(self, word: str, max_distance: int) -> numpy.ndarray:
+        """Term ids that may be within `max_distance` edits (before verification)."""
+        grams = trigrams(word)
+        needed = len(grams) - EDIT_GRAMS * max_distance
+        if needed <= 0:
+            # Budget too large for the count filter: every term of a close length
+            return numpy.flatnonzero(numpy.abs(self.lengths - len(word)) <= max_distance)
+        gram_ids = [self._gram_ids[gram] for gram in grams if gram in self._gram_ids]
+        if len(gram_ids) < needed:
+            return numpy.zeros(0, dtype=numpy.int64)
+        postings = numpy.concatenate([self._postings[self._offsets[gram_id]:self._offsets[gram_id + 1]]
+                                      for gram_id in gram_ids])
+        term_ids, counts = numpy.unique(postings, return_counts=True)
+        keep = (counts >= needed) & (numpy.abs(self.lengths[term_ids] - len(word)) <= max_distance)
+        return term_ids[keep]
+
+    def suggest(self, word: str, max_distance: Optional[int] = None,
+                limit: int = MAX_SUGGESTIONS) -> List[Suggestion]:
+        """Closest vocabulary terms, best first (distance, then frequency)."""
+        if max_distance is None:
+            max_distance = max_edits(word)
+        term_ids = self.candidates(word, max_distance).tolist()
+        terms = [self.terms[term_id] for term_id in term_ids]
+        if len(terms) >= BATCH_VERIFY:
+            distances = edit_distances(word, terms, max_distance).tolist()
+        else:
+            distances = [edit_distance(word, term, max_distance) for term in terms]
+        found = [(term, distance, int(self.frequencies[term_id]))
+                 for term_id, term, distance in zip(term_ids, terms, distances) if distance <= max_distance]
+        found.sort(key=lambda item: (item[1], -item[2], item[0]))
+        return found[:limit]
+
+    def brute_force(self, word: str, max_distance: int, limit: int = MAX_SUGGESTIONS) -> List[Suggestion]:
+        """suggest() by scanning the whole vocabulary (reference for benchmarks)."""
+        found = [(term, distance, int(self.frequencies[i])) for i, term in enumerate(self.terms)
+                 for distance in [edit_distance(word, term, max_distance)] if distance <= max_distance]
+        found.sort(key=lambda item: (item[1], -item[2], item[0]))
+        return found[:limit]
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def parse_args():
+    """Parse command-line options."""
+    from search_index import DEFAULT_DIR
+
+    parser = argparse.ArgumentParser(description="Spelling suggestions from a search index vocabulary")
+    parser.add_argument('words', nargs='+', help="Words to look up")
+    parser.add_argument('--source', default='ayah_data', help="Source name or index file (default: %(default)s)")
+    parser.add_argument('--directory', type=Path, default=DEFAULT_DIR, help="Index directory (default: %(default)s)")
+    parser.add_argument('--max-distance', type=int, help="Edit budget (default: by word length)")
+    return parser.parse_args()
+
+def main():
+    """Main execution function."""
+    from search_index import SearchIndex
+
+    args = parse_args()
+    try:
+        index = SearchIndex.load(args.source, args.directory)
+    except (FileNotFoundError, ValueError) as err:
+        print(f"❌ {err}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    spelling = index.spelling
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"{len(spelling.terms):,} terms, {spelling.nbytes / 1e6:.1f} MB of trigram arrays, built in {build_ms:.0f} ms\n")
+
+    for word in args.words:
+        word = word.casefold()
+        start = time.perf_counter()
+        suggestions = spelling.suggest(word, args.max_distance)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        known = spelling.frequency(word)
+        listed = ', '.join(f"{term} (d={distance}, df={df:,})" for term, distance, df in suggestions) or 'no suggestions'
+        print(f"{word}{f' [df={known:,}]' if known else ''}: {listed}  ({elapsed_ms:.2f} ms)")
+
+if __name__ == "__main__":
+    main()